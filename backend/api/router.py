@@ -5,6 +5,7 @@ from api.routers.applications import router as applications_router
 from api.routers.users import router as users_router
 from api.routers.jobs import router as jobs_router
 from api.routers.scoring import router as scoring_router
+from api.routers.tasks import router as tasks_router
 
 router = APIRouter()
 
@@ -14,5 +15,6 @@ router.include_router(applications_router)
 router.include_router(users_router)
 router.include_router(jobs_router)
 router.include_router(scoring_router)
+router.include_router(tasks_router)
 
 
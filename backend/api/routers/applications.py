@@ -1,16 +1,23 @@
-from fastapi import APIRouter, Depends, Request, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, Depends, Request, HTTPException, UploadFile, File, Form, Query
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 from models import Applications, ApplicationStatus, Jobs, ChatSessions, ChatMessages, MessageType, Users
 from typing import Optional, List
 from pydantic import BaseModel
 from core.db import get_db
 from core.scoring_db import get_scoring_summary_for_recruiter, get_scoring_result
-from api.schemas import ApplicationCreate, ApplicationWithText, ApplicationResponse, ApplicationDetailsResponse, ChatMessageResponse
+from core.job_stats import record_status_changes
+from core.task_queue import TASK_PREPARE_INTERVIEW, notify_task_workers
+from api.schemas import ApplicationCreate, ApplicationWithText, ApplicationResponse, ApplicationListItem, ApplicationDetailsResponse, ChatMessageResponse
 from services import (
     get_job_by_id, get_user_by_id, get_application_by_id,
     get_chat_sessions_for_application, get_messages_for_session,
     format_chat_message_response, extract_pdf_text_content,
     auto_score_application, get_application_discrepancies,
+    get_messages_for_application, extract_discrepancies,
+    get_recruiter_applications_with_chat_data, list_applications,
+    validate_export_options, export_media_type, export_filename, stream_applications_export,
+    enqueue_application_intake, import_applications_file,
     create_job_description_data, create_candidate_data
 )
 import json
@@ -23,7 +30,15 @@ PDF_ONLY_ERROR_MSG = "Only PDF files are allowed"
 NO_CHAT_HISTORY_MSG = "No chat history found for this application"
 NO_SCORING_DATA_MSG = "No scoring data available for this application"
 NO_DETAILED_SCORING_MSG = "No detailed scoring data available for this application"
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
 SCORING_FAILED_MSG = "Failed to score application"
+APPLICATION_LIST_RESPONSES = {
+    200: {
+        "model": List[ApplicationListItem],
+        "description": "Applications with only the fields named in ?fields=, or all of them when it is omitted",
+        "headers": {NEXT_CURSOR_HEADER: {"description": "Cursor for the next page, absent on the last page", "schema": {"type": "string"}}}
+    }
+}
 
 def handle_http_exceptions(func):
     @wraps(func)
@@ -41,6 +56,7 @@ def handle_http_exceptions(func):
 @router.post("/create", response_model=ApplicationResponse)
 async def create_application(
     application_data: ApplicationCreate, 
+    prepare_interview: bool = False,
     db: Session = Depends(get_db)
 ):
     new_application = Applications(
@@ -52,92 +68,84 @@ async def create_application(
     )
     
     db.add(new_application)
+    db.flush()
+    record_status_changes(db, [(new_application.job_id, None, ApplicationStatus.submitted)])
+    enqueue_application_intake(db, new_application, prepare_interview)
     db.commit()
     db.refresh(new_application)
-    
-    job = get_job_by_id(db, application_data.job_id)
-    user = get_user_by_id(db, application_data.user_id)
-    
-    job_description = create_job_description_data(job)
-    candidate = create_candidate_data(user, new_application)
-    
-    scoring_result = auto_score_application(db, new_application.application_id, job_description, candidate)
-    if scoring_result:
-        print(f"Application auto-scored: {scoring_result['final_score']} - {scoring_result['decision']}")
-    
-    # Refresh the application to get the updated score
-    db.refresh(new_application)
+    notify_task_workers()
     
     return new_application
 
-@router.get("/fetch_all", response_model=List[ApplicationResponse])
-async def fetch_applications(db: Session = Depends(get_db)):
-    applications = db.query(Applications).order_by(Applications.created_at.desc()).all()
-    return applications
+def paginated_response(applications: List[dict], next_cursor: Optional[str]) -> JSONResponse:
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return JSONResponse(content=applications, headers=headers)
+
+@router.get("/fetch_all", response_model=None, responses=APPLICATION_LIST_RESPONSES)
+async def fetch_applications(
+    fields: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    return paginated_response(*list_applications(db, fields=fields, limit=limit, cursor=cursor))
 
-@router.get("/by_job/{job_id}", response_model=List[ApplicationResponse])
-async def fetch_applications_by_job(job_id: int, db: Session = Depends(get_db)):
-    print(f"Fetching applications for job_id: {job_id}")
-    applications = db.query(Applications).filter(Applications.job_id == job_id).order_by(Applications.created_at.desc()).all()
-    print(f"Found {len(applications)} applications for job {job_id}")
-    return applications
+@router.get("/by_job/{job_id}", response_model=None, responses=APPLICATION_LIST_RESPONSES)
+async def fetch_applications_by_job(
+    job_id: int,
+    fields: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    return paginated_response(*list_applications(db, job_id=job_id, fields=fields, limit=limit, cursor=cursor))
 
-@router.get("/by_job/{job_id}/filtered", response_model=List[ApplicationResponse])
+@router.get("/by_job/{job_id}/filtered", response_model=None, responses=APPLICATION_LIST_RESPONSES)
 async def fetch_applications_by_job_filtered(
     job_id: int,
     min_score: Optional[float] = None,
     max_score: Optional[float] = None,
     recommended_only: bool = False,
+    fields: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    print(f"Fetching filtered applications for job_id: {job_id}")
-    query = db.query(Applications).filter(Applications.job_id == job_id)
-    
-    if recommended_only:
-        query = query.filter(Applications.score >= 80.0)
-    elif min_score is not None:
-        query = query.filter(Applications.score >= min_score)
-    
-    if max_score is not None:
-        query = query.filter(Applications.score <= max_score)
-    
-    query = query.order_by(Applications.score.desc().nulls_last())
-    
-    applications = query.all()
-    print(f"Found {len(applications)} filtered applications for job {job_id}")
-    return applications
+    return paginated_response(*list_applications(
+        db, job_id=job_id, min_score=min_score, max_score=max_score, recommended_only=recommended_only,
+        sort="score", fields=fields, limit=limit, cursor=cursor
+    ))
 
-@router.get("/by_recruiter/{recruiter_id}", response_model=List[ApplicationResponse])
-async def fetch_applications_by_recruiter(recruiter_id: int, db: Session = Depends(get_db)):
-    applications = db.query(Applications).join(Jobs).filter(Jobs.poster_id == recruiter_id).order_by(Applications.created_at.desc()).all()
-    return applications
+@router.get("/by_recruiter/{recruiter_id}", response_model=None, responses=APPLICATION_LIST_RESPONSES)
+async def fetch_applications_by_recruiter(
+    recruiter_id: int,
+    fields: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    return paginated_response(*list_applications(db, recruiter_id=recruiter_id, fields=fields, limit=limit, cursor=cursor))
 
-@router.get("/by_recruiter/{recruiter_id}/filtered", response_model=List[ApplicationResponse])
+@router.get("/by_recruiter/{recruiter_id}/filtered", response_model=None, responses=APPLICATION_LIST_RESPONSES)
 async def fetch_applications_by_recruiter_filtered(
     recruiter_id: int, 
     min_score: Optional[float] = None,
     max_score: Optional[float] = None,
     recommended_only: bool = False,
+    fields: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    query = db.query(Applications).join(Jobs).filter(Jobs.poster_id == recruiter_id)
-    
-    if recommended_only:
-        query = query.filter(Applications.score >= 80.0)
-    elif min_score is not None:
-        query = query.filter(Applications.score >= min_score)
-    
-    if max_score is not None:
-        query = query.filter(Applications.score <= max_score)
-    
-    query = query.order_by(Applications.score.desc().nulls_last())
-    
-    applications = query.all()
-    return applications
+    return paginated_response(*list_applications(
+        db, recruiter_id=recruiter_id, min_score=min_score, max_score=max_score, recommended_only=recommended_only,
+        sort="score", fields=fields, limit=limit, cursor=cursor
+    ))
 
 @router.post("/apply_with_text")
 async def apply_with_text(
     application_data: ApplicationWithText, 
+    prepare_interview: bool = False,
     db: Session = Depends(get_db)
 ):
     print(f"Creating application for job_id: {application_data.job_id}, user_id: {application_data.user_id}")
@@ -154,29 +162,44 @@ async def apply_with_text(
     )
     
     db.add(new_application)
+    db.flush()
+    record_status_changes(db, [(new_application.job_id, None, ApplicationStatus.submitted)])
+    tasks = enqueue_application_intake(db, new_application, prepare_interview)
     db.commit()
     db.refresh(new_application)
+    notify_task_workers()
     
     print(f"Created application with ID: {new_application.application_id}")
     
-    job_description = create_job_description_data(job)
-    candidate = create_candidate_data(
-        get_user_by_id(db, application_data.user_id or 1), 
-        new_application
-    )
-    
-    scoring_result = auto_score_application(db, new_application.application_id, job_description, candidate)
-    if scoring_result:
-        print(f"Application auto-scored: {scoring_result['final_score']} - {scoring_result['decision']}")
+    interview_task = next((task for task in tasks if task.task_type == TASK_PREPARE_INTERVIEW), None)
+    if interview_task is None:
+        interview_ready = False
+        message = "Application submitted successfully. Scoring has been queued."
+    elif interview_task.status == "done":
+        interview_ready = True
+        message = "Application submitted successfully. AI interview is ready."
+    else:
+        interview_ready = "queued"
+        message = "Application submitted successfully. Scoring and AI interview preparation have been queued."
     
     return {
         "application_id": new_application.application_id,
-        "message": "Application submitted successfully. AI interview will start automatically.",
-        "interview_ready": True,
-        "scoring_completed": scoring_result is not None,
+        "message": message,
+        "interview_ready": interview_ready,
+        "scoring_completed": False,
+        "queued_tasks": {task.task_type: task.task_id for task in tasks},
         "websocket_url": f"ws://localhost:8000/api/chat?applicationId={new_application.application_id}&userId={new_application.user_id}"
     }
 
+@router.post("/bulk_import")
+def bulk_import_applications(
+    file: UploadFile = File(...),
+    job_id: Optional[int] = Form(None),
+    prepare_interviews: bool = Form(False),
+    db: Session = Depends(get_db)
+):
+    return import_applications_file(db, file.file, file.filename or "", job_id, prepare_interviews)
+
 @router.post("/{application_id}/start_interview")
 @handle_http_exceptions
 async def start_ai_interview(application_id: int, db: Session = Depends(get_db)):
@@ -197,37 +220,10 @@ async def start_ai_interview(application_id: int, db: Session = Depends(get_db))
 @handle_http_exceptions
 async def get_application_details(application_id: int, db: Session = Depends(get_db)):
     application = get_application_by_id(db, application_id)
+    messages = get_messages_for_application(db, application_id)
     
-    print(f"Found application: {application.application_id} for job {application.job_id}")
-    
-    print(f"Looking for chat sessions for application_id: {application_id}")
-    
-    all_sessions = db.query(ChatSessions).all()
-    print(f"Total chat sessions in database: {len(all_sessions)}")
-    for session in all_sessions:
-        print(f"Session {session.session_id}: user_id={session.user_id}, application_id={session.application_id}")
-    
-    chat_sessions = get_chat_sessions_for_application(db, application_id)
-    print(f"Found {len(chat_sessions)} chat sessions for application {application_id}")
-    
-    chat_messages = []
-    for session in chat_sessions:
-        messages = get_messages_for_session(db, session.session_id)
-        
-        print(f"Found {len(messages)} messages for session {session.session_id}")
-        
-        for msg in messages:
-            chat_messages.append(ChatMessageResponse(
-                message_id=msg.message_id,
-                message_type=msg.message_type.value,
-                content=msg.content,
-                question_id=msg.question_id,
-                created_at=msg.created_at.isoformat()
-            ))
-    
-    print(f"Total chat messages for application {application_id}: {len(chat_messages)}")
-    
-    discrepancies = get_application_discrepancies(db, application_id)
+    chat_messages = [ChatMessageResponse(**format_chat_message_response(msg)) for msg in messages]
+    discrepancies = extract_discrepancies(messages)
     
     return ApplicationDetailsResponse(
         application=ApplicationResponse.from_orm(application),
@@ -295,56 +291,31 @@ async def get_application_chat_history(application_id: int, db: Session = Depend
 
 @router.get("/recruiter/{recruiter_id}/applications-with-chat")
 @handle_http_exceptions
-async def get_recruiter_applications_with_chat(recruiter_id: int, db: Session = Depends(get_db)):
-    applications = db.query(Applications).join(Jobs).filter(
-        Jobs.poster_id == recruiter_id
-    ).all()
-    
-    applications_with_chat = []
-    for app in applications:
-        chat_sessions = get_chat_sessions_for_application(db, app.application_id)
-        
-        total_messages = 0
-        for session in chat_sessions:
-            message_count = db.query(ChatMessages).filter(
-                ChatMessages.session_id == session.session_id
-            ).count()
-            total_messages += message_count
-        
-        latest_chat_activity = None
-        if chat_sessions:
-            latest_session = max(chat_sessions, key=lambda s: s.created_at)
-            latest_message = db.query(ChatMessages).filter(
-                ChatMessages.session_id == latest_session.session_id
-            ).order_by(ChatMessages.created_at.desc()).first()
-            
-            if latest_message:
-                latest_chat_activity = {
-                    "last_message_at": latest_message.created_at.isoformat(),
-                    "last_message_type": latest_message.message_type.value,
-                    "last_message_preview": latest_message.content[:100] + "..." if len(latest_message.content) > 100 else latest_message.content
-                }
-        
-        applications_with_chat.append({
-            "application_id": app.application_id,
-            "job_id": app.job_id,
-            "user_id": app.user_id,
-            "application_status": app.application_status.value,
-            "score": app.score,
-            "created_at": app.created_at.isoformat(),
-            "chat_summary": {
-                "total_sessions": len(chat_sessions),
-                "total_messages": total_messages,
-                "has_chat_history": total_messages > 0,
-                "latest_activity": latest_chat_activity
-            }
-        })
+async def get_recruiter_applications_with_chat(
+    recruiter_id: int,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    return get_recruiter_applications_with_chat_data(db, recruiter_id, limit, cursor)
+
+@router.get("/recruiter/{recruiter_id}/export")
+async def export_recruiter_applications(
+    recruiter_id: int,
+    http_request: Request,
+    format: str = "ndjson",
+    compression: Optional[str] = None,
+    job_id: Optional[int] = None,
+    db: Session = Depends(get_db)
+):
+    validate_export_options(format, compression)
+    get_user_by_id(db, recruiter_id)
     
-    return {
-        "recruiter_id": recruiter_id,
-        "total_applications": len(applications),
-        "applications_with_chat": applications_with_chat
-    }
+    return StreamingResponse(
+        stream_applications_export(http_request.app.state.db.get_session, recruiter_id, job_id, format, compression),
+        media_type=export_media_type(format, compression),
+        headers={"Content-Disposition": f'attachment; filename="{export_filename(format, compression)}"'}
+    )
 
 @router.post("/upload_cv")
 @handle_http_exceptions
@@ -8,7 +8,8 @@ from services import (
     save_message, create_message_response, get_session_messages,
     get_session_with_messages, create_job_description_text, create_user_info_text,
     send_websocket_message, get_chat_sessions_for_user, get_chat_sessions_for_application,
-    delete_chat_session, get_application_by_id, get_job_by_id, get_user_by_id
+    delete_chat_session, get_application_by_id, get_job_by_id, get_user_by_id,
+    get_prepared_interview
 )
 import json  
 
@@ -62,12 +63,16 @@ async def chat_endpoint(websocket: WebSocket):
     job = get_job_by_id(db, application.job_id)
     user = get_user_by_id(db, application.user_id)
     
-    job_description = create_job_description_text(job)
-    user_info = create_user_info_text(user, application)
+    prepared = get_prepared_interview(db, application_id)
+    if prepared is not None:
+        questions = prepared["questions"]
+    else:
+        job_description = create_job_description_text(job)
+        user_info = create_user_info_text(user, application)
         
-    first_evaluation = llm.compare_applicant_to_job(job_description, user_info, FirstResponse)
+        first_evaluation = llm.compare_applicant_to_job(job_description, user_info, FirstResponse)
         
-    questions = llm.generate_questions(first_evaluation.discrepancies)
+        questions = llm.generate_questions(first_evaluation.discrepancies)
 
     system_msg = f"Hello {user.full_name}! Thank you for applying to the {job.title} position at {job.company}. I've analyzed your application and have some personalized questions to better understand your qualifications."
     await send_websocket_message(websocket, db, chat_session.session_id, "system_message", system_msg)
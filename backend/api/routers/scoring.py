@@ -1,15 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Optional, List, Dict
 from core.db import get_db
-from api.schemas import ScoringRequest, CriterionResultResponse, AnswerJudgmentResponse, ScoringResponse
+from api.schemas import ScoringRequest, IncrementalScoringRequest, WhatIfRequest, RescoreRequest, CriterionResultResponse, AnswerJudgmentResponse, ScoringResponse
 from services import (
     get_application_by_id, get_job_by_id, get_user_by_id,
     create_job_description_data, create_candidate_data,
-    score_application_with_data, score_application_custom,
+    score_application_with_data, rescore_application_with_answers, score_application_custom,
     get_scoring_config_data, get_recruiter_dashboard_data,
     get_application_scoring_details_data, get_application_scoring_summary_data,
-    get_scoring_insights_data
+    get_scoring_insights_data, get_recruiter_match_matrix_data, get_what_if_data,
+    get_job_stats_data, get_pass_rate_data, get_pass_rate_curve_data, get_scoring_cache_stats,
+    start_job_rescore, stream_job_rescore, get_rescore_run_data
 )
 
 router = APIRouter(prefix="/scoring")
@@ -32,12 +35,25 @@ async def score_application(request: ScoringRequest, db: Session = Depends(get_d
     )
 
 
+@router.post("/score/answers")
+async def rescore_with_answers(request: IncrementalScoringRequest, db: Session = Depends(get_db)):
+    return rescore_application_with_answers(
+        db, request.application_id, request.chat_answers, request.rules_config
+    )
+
+
 @router.get("/config")
 async def get_scoring_config():
     return get_scoring_config_data()
 
 
 
+@router.get("/cache/stats")
+async def get_cache_stats():
+    return get_scoring_cache_stats()
+
+
+
 @router.post("/custom-score")
 async def custom_score(
     job_description: Dict,
@@ -53,10 +69,12 @@ async def custom_score(
 @router.get("/recruiter/dashboard")
 async def get_recruiter_dashboard(
     job_id: Optional[int] = None,
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=500),
+    sort: str = "recent",
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    return get_recruiter_dashboard_data(db, job_id, limit)
+    return get_recruiter_dashboard_data(db, job_id, limit, sort, cursor)
 
 
 @router.get("/recruiter/application/{application_id}")
@@ -81,3 +99,72 @@ async def get_scoring_insights(
     db: Session = Depends(get_db)
 ):
     return get_scoring_insights_data(db, job_id)
+
+
+@router.get("/recruiter/{recruiter_id}/match-matrix")
+async def get_recruiter_match_matrix(
+    recruiter_id: int,
+    top_k: int = 10,
+    applicants_only: bool = False,
+    include_matrix: bool = False,
+    db: Session = Depends(get_db)
+):
+    return get_recruiter_match_matrix_data(db, recruiter_id, top_k, applicants_only, include_matrix)
+
+
+@router.post("/jobs/{job_id}/what-if")
+async def what_if_job_scoring(
+    job_id: int,
+    request: WhatIfRequest,
+    top_deltas: int = Query(20, ge=0, le=1000),
+    db: Session = Depends(get_db)
+):
+    return get_what_if_data(db, job_id, request.model_dump(), top_deltas)
+
+
+@router.get("/jobs/{job_id}/stats")
+async def get_job_stats(
+    job_id: int,
+    db: Session = Depends(get_db)
+):
+    return get_job_stats_data(db, job_id)
+
+
+@router.get("/jobs/{job_id}/pass-rate")
+async def get_job_pass_rate(
+    job_id: int,
+    threshold: Optional[float] = None,
+    db: Session = Depends(get_db)
+):
+    return get_pass_rate_data(db, job_id, threshold)
+
+
+@router.get("/jobs/{job_id}/pass-rate-curve")
+async def get_job_pass_rate_curve(
+    job_id: int,
+    step: float = 1.0,
+    db: Session = Depends(get_db)
+):
+    return get_pass_rate_curve_data(db, job_id, step)
+
+
+@router.post("/jobs/{job_id}/rescore")
+async def rescore_job(
+    job_id: int,
+    http_request: Request,
+    request: RescoreRequest = RescoreRequest(),
+    db: Session = Depends(get_db)
+):
+    run = start_job_rescore(db, job_id, request.rules_config, request.restart)
+    return StreamingResponse(
+        stream_job_rescore(http_request.app.state.db.get_session, run.run_id),
+        media_type="text/event-stream"
+    )
+
+
+@router.get("/rescore-runs/{run_id}")
+async def get_rescore_run(
+    run_id: int,
+    db: Session = Depends(get_db)
+):
+    return get_rescore_run_data(db, run_id)
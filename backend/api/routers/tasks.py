@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from core.db import get_db
+from services import get_task_data, get_queue_stats_data
+
+router = APIRouter(prefix="/tasks")
+
+
+@router.get("/stats")
+async def get_queue_stats(db: Session = Depends(get_db)):
+    return get_queue_stats_data(db)
+
+
+@router.get("/{task_id}")
+async def get_task(task_id: int, db: Session = Depends(get_db)):
+    return get_task_data(db, task_id)
@@ -74,6 +74,14 @@ class ApplicationWithText(BaseModel):
     candidate: dict
     user_id: Optional[int] = None
 
+class ApplicationImportItem(BaseModel):
+    job_id: Optional[int] = None
+    cv: Optional[str] = None
+    cv_file: Optional[str] = None
+    cover_letter: Optional[str] = None
+    candidate: dict = {}
+    user_id: Optional[int] = None
+
 class ApplicationResponse(BaseModel):
     application_id: int
     job_id: int
@@ -87,6 +95,16 @@ class ApplicationResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class ApplicationListItem(BaseModel):
+    application_id: Optional[int] = None
+    job_id: Optional[int] = None
+    user_id: Optional[int] = None
+    cv: Optional[str] = None
+    cover_letter: Optional[str] = None
+    application_status: Optional[str] = None
+    reviewed_by_id: Optional[int] = None
+    score: Optional[float] = None
+
 class ChatMessageResponse(BaseModel):
     message_id: int
     message_type: str
@@ -159,6 +177,23 @@ class ScoringRequest(BaseModel):
     rules_config: Dict[str, str]  # Maps rule names to category strings
     chat_answers: List[Dict] = []
 
+class IncrementalScoringRequest(BaseModel):
+    application_id: int
+    chat_answers: List[Dict] = []
+    rules_config: Optional[Dict[str, str]] = None
+
+class WhatIfRequest(BaseModel):
+    weights: Optional[Dict[str, Optional[float]]] = None
+    experience_tolerance: float = 1.0
+    salary_soft_overage: float = 0.1
+    pass_threshold: float = 70.0
+    primary_weight: float = 0.8
+    secondary_weight: float = 0.2
+
+class RescoreRequest(BaseModel):
+    rules_config: Optional[Dict[str, str]] = None
+    restart: bool = False
+
 class CriterionResultResponse(BaseModel):
     name: str
     category: str
@@ -166,6 +201,7 @@ class CriterionResultResponse(BaseModel):
     passed: bool
     points_awarded: float
     notes: Optional[str] = None
+    coverage: Optional[float] = None
 
 class AnswerJudgmentResponse(BaseModel):
     question_id: str
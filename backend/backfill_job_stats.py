@@ -0,0 +1,47 @@
+import argparse
+
+from sqlalchemy import select
+
+from core.config import settings
+from core.db import Database
+from core.job_stats import rebuild_job_stats
+from models import Jobs
+
+BACKFILL_BATCH = 500
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create missing job_scoring_stats rows from the applications and their latest scores")
+    parser.add_argument("--job-id", type=int, default=None)
+    parser.add_argument("--recount", action="store_true", help="also recount existing rows; run while no applications are being written")
+    parser.add_argument("--batch", type=int, default=BACKFILL_BATCH)
+    args = parser.parse_args()
+
+    database = Database(
+        dbtype=settings.DB_TYPE,
+        dbname=settings.DB_NAME,
+        user=settings.DB_USER,
+        password=settings.DB_PASSWORD,
+        host=settings.DB_HOST,
+        port=settings.DB_PORT
+    )
+
+    db = database.get_session()
+    try:
+        query = select(Jobs.job_id).order_by(Jobs.job_id)
+        if args.job_id is not None:
+            query = query.where(Jobs.job_id == args.job_id)
+        job_ids = list(db.scalars(query))
+
+        written = 0
+        for start in range(0, len(job_ids), args.batch):
+            batch = job_ids[start:start + args.batch]
+            written += len(rebuild_job_stats(db, batch, missing_only=not args.recount))
+            print(f"up to job {batch[-1]}: {written} stats rows written")
+        print(f"checked {len(job_ids)} jobs, wrote {written} stats rows")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
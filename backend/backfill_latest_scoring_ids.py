@@ -0,0 +1,46 @@
+import argparse
+
+from sqlalchemy import select
+
+from core.config import settings
+from core.db import Database
+from core.scoring_db import backfill_latest_scoring_ids
+from models import Jobs
+
+BACKFILL_BATCH = 500
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Point applications without a latest_scoring_id at their newest scoring result")
+    parser.add_argument("--job-id", type=int, default=None)
+    parser.add_argument("--batch", type=int, default=BACKFILL_BATCH)
+    args = parser.parse_args()
+
+    database = Database(
+        dbtype=settings.DB_TYPE,
+        dbname=settings.DB_NAME,
+        user=settings.DB_USER,
+        password=settings.DB_PASSWORD,
+        host=settings.DB_HOST,
+        port=settings.DB_PORT
+    )
+
+    db = database.get_session()
+    try:
+        query = select(Jobs.job_id).order_by(Jobs.job_id)
+        if args.job_id is not None:
+            query = query.where(Jobs.job_id == args.job_id)
+        job_ids = list(db.scalars(query))
+
+        updated = 0
+        for start in range(0, len(job_ids), args.batch):
+            batch = job_ids[start:start + args.batch]
+            updated += backfill_latest_scoring_ids(db, batch)
+            print(f"up to job {batch[-1]}: {updated} applications updated")
+        print(f"checked {len(job_ids)} jobs, updated {updated} applications")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from models import Base, Users, Jobs, Applications, ChatSessions, ChatMessages, MessageType
+from api.routers.applications import get_application_details
+from benchmarks.bench_dashboard_queries import QueryCounter
+
+SESSION_COUNTS = [100, 10_000]
+MESSAGES_PER_SESSION = 6
+REPEATS = 5
+
+
+def prepare(session_count: int):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+
+    poster = Users(full_name="Recruiter", email="recruiter@example.com", password_hash="x")
+    db.add(poster)
+    db.flush()
+    job = Jobs(title="Backend Engineer", company="Example", poster_id=poster.user_id)
+    db.add(job)
+    db.flush()
+
+    application_ids = db.execute(
+        insert(Applications).returning(Applications.application_id, sort_by_parameter_order=True),
+        [{"job_id": job.job_id, "user_id": poster.user_id, "cv": "cv", "application_status": "submitted"} for _ in range(session_count)]
+    ).scalars().all()
+    session_ids = db.execute(
+        insert(ChatSessions).returning(ChatSessions.session_id, sort_by_parameter_order=True),
+        [{"user_id": poster.user_id, "application_id": application_id} for application_id in application_ids]
+    ).scalars().all()
+    db.execute(insert(ChatMessages), [
+        {
+            "session_id": session_id,
+            "message_type": MessageType.question.name if position % 2 else MessageType.user.name,
+            "content": "Can you explain the gap in your experience?" if position % 2 else "Sure, I was studying.",
+            "message_metadata": '{"discrepancies": ["Experience below requirement"]}' if position == 1 else None
+        }
+        for session_id in session_ids
+        for position in range(MESSAGES_PER_SESSION)
+    ])
+    db.commit()
+    return engine, db, application_ids[len(application_ids) // 2]
+
+
+if __name__ == "__main__":
+    counts = set()
+    for session_count in SESSION_COUNTS:
+        engine, db, application_id = prepare(session_count)
+        counter = QueryCounter(engine)
+
+        timings = []
+        for _ in range(REPEATS):
+            db.expunge_all()
+            queries, seconds = counter.measure(lambda: asyncio.run(get_application_details(application_id, db)))
+            timings.append(seconds)
+        details = asyncio.run(get_application_details(application_id, db))
+        counts.add(queries)
+
+        print(
+            f"chat_sessions={session_count:<7} | {queries} queries | {min(timings) * 1000:6.2f} ms | "
+            f"{len(details.chat_history)} messages, {len(details.discrepancies or [])} discrepancies"
+        )
+        db.close()
+
+    assert counts == {2}, f"details endpoint issued {sorted(counts)} queries"
+    print("Details are loaded in two queries regardless of chat_sessions size")
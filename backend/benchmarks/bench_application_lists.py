@@ -0,0 +1,104 @@
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from models import Base, Users, Jobs, Applications
+from api.schemas import ApplicationResponse
+from api.routers.applications import fetch_applications_by_recruiter, fetch_applications_by_recruiter_filtered, NEXT_CURSOR_HEADER
+from benchmarks.bench_dashboard_queries import QueryCounter
+
+APPLICATION_COUNT = 10_000
+CV_TEXT = "Experienced backend engineer with Python, SQL and distributed systems. " * 60
+COVER_LETTER_TEXT = "I am excited to apply for this role and believe my background fits well. " * 20
+PAGE_SIZE = 100
+
+
+def prepare(count: int):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    started = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    recruiter = Users(full_name="Recruiter", email="recruiter@example.com", password_hash="x")
+    db.add(recruiter)
+    db.flush()
+    job = Jobs(title="Backend Engineer", company="Example", poster_id=recruiter.user_id)
+    db.add(job)
+    db.flush()
+    db.execute(insert(Applications), [
+        {
+            "job_id": job.job_id,
+            "user_id": recruiter.user_id,
+            "cv": CV_TEXT,
+            "cover_letter": COVER_LETTER_TEXT,
+            "application_status": "submitted",
+            "score": None if position % 7 == 0 else float(position % 100),
+            "created_at": started + timedelta(seconds=position // 3)
+        }
+        for position in range(count)
+    ])
+    db.commit()
+    return engine, db, recruiter.user_id
+
+
+def call(endpoint, *args, **kwargs):
+    response = asyncio.run(endpoint(*args, **kwargs))
+    return json.loads(response.body), response.headers.get(NEXT_CURSOR_HEADER)
+
+
+def walk(endpoint, recruiter_id: int, db, **kwargs) -> list:
+    applications = []
+    cursor = None
+    while True:
+        page, cursor = call(endpoint, recruiter_id, cursor=cursor, limit=PAGE_SIZE, db=db, **kwargs)
+        applications.extend(page)
+        if cursor is None:
+            return applications
+
+
+if __name__ == "__main__":
+    engine, db, recruiter_id = prepare(APPLICATION_COUNT)
+    counter = QueryCounter(engine)
+
+    legacy = [
+        ApplicationResponse.model_validate(application).model_dump(mode="json")
+        for application in db.query(Applications).order_by(Applications.created_at.desc(), Applications.application_id.desc())
+    ]
+    db.expunge_all()
+
+    full, _ = call(fetch_applications_by_recruiter, recruiter_id, fields=None, limit=None, cursor=None, db=db)
+    assert full == legacy, "full projection differs from ApplicationResponse"
+    paged = walk(fetch_applications_by_recruiter, recruiter_id, db, fields=None)
+    assert paged == legacy, "pages differ from the unpaginated list"
+    filtered = walk(
+        fetch_applications_by_recruiter_filtered, recruiter_id, db,
+        min_score=None, max_score=None, recommended_only=False, fields="application_id,score"
+    )
+    assert len(filtered) == len({application["application_id"] for application in filtered}) == APPLICATION_COUNT
+
+    variants = {
+        "all rows, all fields (previous behaviour)": dict(fields=None, limit=None),
+        "all rows, fields=application_id,application_status,score": dict(fields="application_id,application_status,score", limit=None),
+        f"page of {PAGE_SIZE}, all fields": dict(fields=None, limit=PAGE_SIZE),
+        f"page of {PAGE_SIZE}, fields=application_id,application_status,score": dict(fields="application_id,application_status,score", limit=PAGE_SIZE),
+    }
+    print(f"{APPLICATION_COUNT} applications, cv {len(CV_TEXT)} chars, cover letter {len(COVER_LETTER_TEXT)} chars")
+    for name, options in variants.items():
+        db.expunge_all()
+        started = time.perf_counter()
+        page, _ = call(fetch_applications_by_recruiter, recruiter_id, cursor=None, db=db, **options)
+        seconds = time.perf_counter() - started
+        payload = len(json.dumps(page))
+        fetched = sum(len(str(value)) for application in page for value in application.values() if value is not None)
+        print(
+            f"{name:<60} | {len(page):6d} rows | payload {payload / 1024:9.1f} KiB | "
+            f"values fetched {fetched / 1024:9.1f} KiB | {seconds * 1000:8.1f} ms"
+        )
@@ -0,0 +1,131 @@
+import csv
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import zstandard
+from sqlalchemy import create_engine, insert, update
+from sqlalchemy.orm import sessionmaker
+
+from models import Base, Users, Jobs, Applications, ScoringResults
+from services.export_service import EXPORT_FIELDS, stream_applications_export
+
+APPLICATION_COUNTS = [10_000, 50_000]
+JOBS = 20
+HISTORY_PER_APPLICATION = 2
+
+
+def prepare(path: str, application_count: int):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    started = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    recruiter = Users(full_name="Recruiter", email="recruiter@example.com", password_hash="x")
+    db.add(recruiter)
+    db.flush()
+    candidate_ids = db.execute(
+        insert(Users).returning(Users.user_id, sort_by_parameter_order=True),
+        [{"full_name": f"Candidate {index}", "email": f"candidate{index}@example.com", "password_hash": "x"} for index in range(1000)]
+    ).scalars().all()
+    job_ids = db.execute(
+        insert(Jobs).returning(Jobs.job_id, sort_by_parameter_order=True),
+        [{"title": f"Engineer {index}", "company": "Example", "poster_id": recruiter.user_id} for index in range(JOBS)]
+    ).scalars().all()
+
+    application_ids = db.execute(
+        insert(Applications).returning(Applications.application_id, sort_by_parameter_order=True),
+        [
+            {
+                "job_id": job_ids[index % JOBS],
+                "user_id": candidate_ids[index % len(candidate_ids)],
+                "cv": "Experienced engineer. " * 50,
+                "application_status": "submitted",
+                "created_at": started + timedelta(minutes=index)
+            }
+            for index in range(application_count)
+        ]
+    ).scalars().all()
+
+    scored = application_ids[: application_count * 4 // 5]
+    scoring_ids = db.execute(
+        insert(ScoringResults).returning(ScoringResults.scoring_id, sort_by_parameter_order=True),
+        [
+            {
+                "application_id": application_id,
+                "primary_score": 40.0 + (application_id * 7 + attempt) % 60,
+                "secondary_score": 10.0 + application_id % 20,
+                "final_score": 30.0 + (application_id * 13 + attempt) % 70,
+                "decision": "PASS" if (application_id + attempt) % 3 else "REJECT",
+                "created_at": started + timedelta(days=attempt, minutes=application_id)
+            }
+            for application_id in scored
+            for attempt in range(HISTORY_PER_APPLICATION)
+        ]
+    ).scalars().all()
+    db.execute(
+        update(Applications),
+        [
+            {"application_id": application_id, "latest_scoring_id": scoring_ids[position * HISTORY_PER_APPLICATION + HISTORY_PER_APPLICATION - 1]}
+            for position, application_id in enumerate(scored)
+        ]
+    )
+    recruiter_id = recruiter.user_id
+    db.commit()
+    db.close()
+    return engine, sessionmaker(bind=engine), recruiter_id, len(scored)
+
+
+def timed_export(session_factory, recruiter_id: int, export_format: str, compression):
+    started = time.perf_counter()
+    payload = b"".join(stream_applications_export(session_factory, recruiter_id, None, export_format, compression))
+    return payload, time.perf_counter() - started
+
+
+def peak_memory(session_factory, recruiter_id: int, export_format: str) -> int:
+    tracemalloc.start()
+    for _ in stream_applications_export(session_factory, recruiter_id, None, export_format, "zstd"):
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def decode(payload: bytes, export_format: str) -> list:
+    text = payload.decode()
+    if export_format == "ndjson":
+        return [json.loads(line) for line in text.splitlines()]
+    return list(csv.DictReader(io.StringIO(text)))
+
+
+if __name__ == "__main__":
+    for application_count in APPLICATION_COUNTS:
+        with tempfile.TemporaryDirectory() as directory:
+            engine, session_factory, recruiter_id, scored_count = prepare(os.path.join(directory, "export.db"), application_count)
+
+            for export_format in ("ndjson", "csv"):
+                payload, seconds = timed_export(session_factory, recruiter_id, export_format, None)
+                rows = decode(payload, export_format)
+                assert len(rows) == application_count, f"{export_format} exported {len(rows)} rows"
+                assert list(rows[0]) == EXPORT_FIELDS
+                assert sum(1 for row in rows if row["final_score"] not in (None, "")) == scored_count
+                assert [int(row["application_id"]) for row in rows] == sorted(int(row["application_id"]) for row in rows)
+
+                compressed, compressed_seconds = timed_export(session_factory, recruiter_id, export_format, "zstd")
+                assert zstandard.ZstdDecompressor().decompressobj().decompress(compressed) == payload
+                peak = peak_memory(session_factory, recruiter_id, export_format)
+
+                print(
+                    f"applications={application_count:<6} {export_format:<6} | {len(payload) / 1024:8.0f} KiB in {seconds * 1000:6.0f} ms "
+                    f"({application_count / seconds:7.0f} rows/s) | zstd {len(compressed) / 1024:6.0f} KiB in {compressed_seconds * 1000:6.0f} ms, "
+                    f"peak {peak / 1024:6.0f} KiB traced"
+                )
+            engine.dispose()
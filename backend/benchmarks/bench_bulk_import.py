@@ -0,0 +1,202 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.orm import sessionmaker
+
+import core.bulk_rescore as bulk_rescore
+from models import Base, Users, Jobs, Applications, ApplicationStatus
+from core.job_stats import record_status_changes, get_job_stats, rebuild_job_stats, summarize_job_stats
+from services.application_service import auto_score_application, extract_pdf_text_content
+from services.scoring_service import create_job_description_data, create_candidate_data
+from services.import_service import import_applications_file
+
+ITEMS = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+PER_ITEM_SAMPLE = 200
+JOBS = 5
+CITIES = ["Berlin", "Munich", "Almaty", "Warsaw", "Remote"]
+SKILLS = ["Python", "FastAPI", "PostgreSQL", "Docker", "Kubernetes", "React", "Go"]
+
+
+def make_pdf(lines: list) -> bytes:
+    text = " ".join(
+        f"({line.replace(chr(92), chr(92) * 2).replace('(', '[').replace(')', ']')}) Tj 0 -14 Td" for line in lines
+    )
+    stream = f"BT /F1 11 Tf 72 720 Td {text} ET"
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream",
+    ]
+
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += f"{number} 0 obj\n{body}\nendobj\n".encode()
+    xref = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    pdf += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return pdf
+
+
+def cv_lines(index: int) -> list:
+    return [
+        f"Candidate {index}",
+        f"Location: {CITIES[index % len(CITIES)]}",
+        f"{2 + index % 9} years of experience as a backend developer",
+        "Skills: " + ", ".join(SKILLS[index % 3: index % 3 + 4]),
+        "Education: Bachelor of Computer Science",
+    ]
+
+
+def prepare(path: str):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    db = session_factory()
+
+    recruiter = Users(full_name="Recruiter", email="recruiter@example.com", password_hash="x")
+    candidate = Users(full_name="Candidate", email="candidate@example.com", password_hash="x")
+    db.add_all([recruiter, candidate])
+    db.flush()
+    jobs = [
+        Jobs(
+            title=f"Backend Engineer {index}", company="Example", poster_id=recruiter.user_id,
+            desired_location=CITIES[index], desired_skills=SKILLS[index:index + 3]
+        )
+        for index in range(JOBS)
+    ]
+    db.add_all(jobs)
+    db.commit()
+    ids = ([job.job_id for job in jobs], candidate.user_id)
+    db.close()
+    return engine, session_factory, ids
+
+
+def build_jsonl(job_ids: list, user_id: int) -> tuple:
+    lines = [
+        json.dumps({"job_id": job_ids[index % JOBS], "user_id": user_id, "cv": "\n".join(cv_lines(index)), "candidate": {}})
+        for index in range(ITEMS)
+    ]
+    lines[10] = "{not json"
+    lines[20] = json.dumps({"job_id": 999_999, "user_id": user_id, "cv": "cv"})
+    lines[30] = json.dumps({"user_id": user_id, "cv": "cv", "job_id": "abc"})
+    return ("\n".join(lines) + "\n").encode(), 3
+
+
+def build_archive(job_ids: list, user_id: int) -> tuple:
+    buffer = io.BytesIO()
+    manifest = []
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for index in range(ITEMS):
+            name = f"cvs/{index}.pdf"
+            manifest.append({"job_id": job_ids[index % JOBS], "user_id": user_id, "cv_file": name, "cover_letter": "Hello"})
+            if index == 40:
+                archive.writestr(name, b"%PDF-1.4 truncated")
+            elif index != 50:
+                archive.writestr(name, make_pdf(cv_lines(index)))
+        manifest.append({"job_id": job_ids[0], "user_id": user_id})
+        archive.writestr("manifest.jsonl", "\n".join(json.dumps(entry) for entry in manifest))
+    return buffer.getvalue(), 3
+
+
+def per_item_rate(session_factory, job_id: int, user_id: int) -> float:
+    pdf = make_pdf(cv_lines(0))
+    db = session_factory()
+    started = time.perf_counter()
+    for _ in range(PER_ITEM_SAMPLE):
+        application = Applications(job_id=job_id, user_id=user_id, cv=extract_pdf_text_content(pdf), application_status=ApplicationStatus.submitted)
+        db.add(application)
+        record_status_changes(db, [(job_id, None, ApplicationStatus.submitted)])
+        db.commit()
+        job, user = db.get(Jobs, job_id), db.get(Users, user_id)
+        auto_score_application(db, application.application_id, create_job_description_data(job), create_candidate_data(user, application))
+    elapsed = time.perf_counter() - started
+    db.close()
+    return PER_ITEM_SAMPLE / elapsed
+
+
+def run_import(session_factory, payload: bytes, filename: str, expected_errors: int) -> dict:
+    db = session_factory()
+    summary = import_applications_file(db, io.BytesIO(payload), filename)
+    db.close()
+
+    assert summary["received"] == ITEMS + (filename.endswith(".zip")), summary["received"]
+    assert summary["failed"] == expected_errors == len(summary["errors"]), summary["errors"]
+    assert summary["imported"] == summary["scored"] == summary["received"] - expected_errors
+    return summary
+
+
+def check_row_isolation(engine, session_factory, job_ids: list, user_id: int):
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TRIGGER reject_insert BEFORE INSERT ON applications WHEN NEW.cv = 'reject-insert' "
+            "BEGIN SELECT RAISE(ABORT, 'rejected insert'); END"
+        ))
+        connection.execute(text(
+            "CREATE TRIGGER reject_score BEFORE INSERT ON scoring_results "
+            "WHEN (SELECT cv FROM applications WHERE application_id = NEW.application_id) = 'reject-score' "
+            "BEGIN SELECT RAISE(ABORT, 'rejected score'); END"
+        ))
+
+    cvs = ["\n".join(cv_lines(index)) for index in range(20)]
+    cvs[5], cvs[9] = "reject-insert", "reject-score"
+    payload = "\n".join(json.dumps({"job_id": job_ids[0], "user_id": user_id, "cv": cv}) for cv in cvs).encode()
+
+    db = session_factory()
+    summary = import_applications_file(db, io.BytesIO(payload), "isolation.jsonl")
+    db.close()
+    with engine.begin() as connection:
+        connection.execute(text("DROP TRIGGER reject_insert"))
+        connection.execute(text("DROP TRIGGER reject_score"))
+
+    assert (summary["imported"], summary["scored"]) == (19, 18), summary
+    assert [(error["index"], error["error"][:15]) for error in summary["errors"]] == [(6, "Insert failed: "), (10, "Imported but no")], summary["errors"]
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        engine, session_factory, (job_ids, user_id) = prepare(os.path.join(directory, "import.db"))
+
+        baseline = per_item_rate(session_factory, job_ids[0], user_id)
+        print(f"per-item extract + insert + score : {baseline:8.1f} applications/s ({PER_ITEM_SAMPLE} items)")
+
+        jsonl, jsonl_errors = build_jsonl(job_ids, user_id)
+        summary = run_import(session_factory, jsonl, "applications.jsonl", jsonl_errors)
+        print(
+            f"bulk JSONL  {ITEMS} items ({len(jsonl) / 1024 / 1024:5.1f} MiB) : {summary['rate_per_second']:8.1f} applications/s "
+            f"in {summary['elapsed_seconds']:6.1f} s | errors: {[error['error'][:40] for error in summary['errors']]}"
+        )
+
+        archive, archive_errors = build_archive(job_ids, user_id)
+        summary = run_import(session_factory, archive, "applications.zip", archive_errors)
+        print(
+            f"bulk zip    {ITEMS} PDFs ({len(archive) / 1024 / 1024:5.1f} MiB), {bulk_rescore.RESCORE_WORKERS} extract workers : "
+            f"{summary['rate_per_second']:8.1f} applications/s in {summary['elapsed_seconds']:6.1f} s | "
+            f"errors: {[error['error'][:40] for error in summary['errors']]}"
+        )
+        bulk_rescore.shutdown_rescore_pool()
+        check_row_isolation(engine, session_factory, job_ids, user_id)
+        print("a failing row fails alone on insert and on scoring")
+
+        db = session_factory()
+        for job_id in job_ids:
+            incremental = summarize_job_stats(get_job_stats(db, job_id))
+            rebuilt = summarize_job_stats(list(rebuild_job_stats(db, [job_id]).values()))
+            assert incremental["statuses"] == rebuilt["statuses"] and incremental["scored_applications"] == rebuilt["scored_applications"]
+        unscored = db.scalar(select(func.count()).select_from(Applications).where(Applications.latest_scoring_id.is_(None), Applications.cv != "reject-score"))
+        assert unscored == 0, f"{unscored} imported applications were not scored"
+        db.close()
+        engine.dispose()
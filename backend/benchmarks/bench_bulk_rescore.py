@@ -0,0 +1,51 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import core.bulk_rescore as bulk_rescore
+from benchmarks.bench_score_batch import generate_candidates, JOB_DESCRIPTION
+
+POOL_SIZE = 20_000
+RULES_CONFIG = {
+    "criminal_background": "HARD_NO",
+    "location_relocation": "PREFERABLE",
+    "years_experience": "YES",
+    "core_title_role": "YES",
+    "education": "PREFERABLE",
+    "languages": "PREFERABLE",
+    "employment_type": "YES",
+    "salary_range": "PREFERABLE",
+    "required_skills": "YES",
+}
+
+
+def run(batch: list, workers: int) -> float:
+    bulk_rescore.shutdown_rescore_pool()
+    bulk_rescore.RESCORE_WORKERS = workers
+    if workers > 1:
+        bulk_rescore.score_partitioned(JOB_DESCRIPTION, batch[:workers * bulk_rescore.RESCORE_INLINE_THRESHOLD], RULES_CONFIG, workers)
+
+    started = time.perf_counter()
+    results = bulk_rescore.score_partitioned(JOB_DESCRIPTION, batch, RULES_CONFIG, workers)
+    elapsed = time.perf_counter() - started
+
+    assert len(results) == len(batch)
+    return elapsed
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else POOL_SIZE
+    worker_counts = [int(arg) for arg in sys.argv[2:]] or sorted({1, 2, 4, bulk_rescore.RESCORE_WORKERS})
+    batch = list(enumerate(generate_candidates(size)))
+
+    baseline = None
+    for workers in worker_counts:
+        elapsed = run(batch, workers)
+        baseline = baseline or elapsed
+        print(
+            f"{workers:>3} workers | {size / elapsed:9.0f} applications/s | "
+            f"{elapsed * 1000:8.1f} ms | {baseline / elapsed:4.1f}x"
+        )
+    bulk_rescore.shutdown_rescore_pool()
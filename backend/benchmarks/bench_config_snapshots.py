@@ -0,0 +1,100 @@
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, insert, update
+from sqlalchemy.orm import sessionmaker
+
+from models import Base, Users, Jobs, Applications, ScoringResults
+from core.scoring import ScoringEngine, ScoringConfig
+from core.scoring_db import save_scoring_results, get_scoring_results
+from benchmarks.bench_scoring import generate_pool, RULES_CONFIG
+
+RESULT_COUNT = 20_000
+BATCH_SIZE = 1_000
+RULES_JSON = {name: category.value for name, category in RULES_CONFIG.items()}
+
+
+def build(path: str, inline: bool, count: int):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+
+    poster = Users(full_name="Recruiter", email="recruiter@example.com", password_hash="x")
+    db.add(poster)
+    db.flush()
+    job = Jobs(title="Backend Engineer", company="Example", poster_id=poster.user_id)
+    db.add(job)
+    db.flush()
+    application_ids = db.execute(
+        insert(Applications).returning(Applications.application_id, sort_by_parameter_order=True),
+        [{"job_id": job.job_id, "user_id": poster.user_id, "application_status": "submitted"} for _ in range(count)]
+    ).scalars().all()
+    db.commit()
+
+    scoring_engine = ScoringEngine()
+    scoring_config = ScoringConfig()
+    job_description, candidates, _ = generate_pool(count)
+    for start in range(0, count, BATCH_SIZE):
+        entries = [
+            (application_id, scoring_engine.score_candidate(job_description, candidate, RULES_CONFIG, []), None, None)
+            for application_id, candidate in zip(application_ids[start:start + BATCH_SIZE], candidates[start:start + BATCH_SIZE])
+        ]
+        save_scoring_results(db, entries, RULES_JSON, scoring_config)
+
+    if inline:
+        db.execute(update(ScoringResults).values(
+            rules_config=json.dumps(RULES_JSON),
+            scoring_config=json.dumps(scoring_config.__dict__),
+            config_snapshot_id=None
+        ))
+        db.commit()
+
+    return engine, db, list(application_ids)
+
+
+def table_bytes(engine, table: str) -> int:
+    with engine.connect() as connection:
+        return connection.exec_driver_sql(
+            "SELECT coalesce(sum(pgsize), 0) FROM dbstat WHERE name = ?", (table,)
+        ).scalar()
+
+
+def read_seconds(db, application_ids: list) -> float:
+    timings = []
+    for _ in range(3):
+        db.expunge_all()
+        started = time.perf_counter()
+        get_scoring_results(db, application_ids)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else RESULT_COUNT
+
+    with tempfile.TemporaryDirectory() as directory:
+        measurements = {}
+        for label, inline in (("inline json (before)", True), ("config snapshots", False)):
+            path = os.path.join(directory, f"{inline}.db")
+            engine, db, application_ids = build(path, inline, count)
+            with engine.connect() as connection:
+                connection.exec_driver_sql("VACUUM")
+            measurements[label] = (
+                table_bytes(engine, "scoring_results"),
+                table_bytes(engine, "scoring_config_snapshots"),
+                read_seconds(db, application_ids[:1000])
+            )
+            db.close()
+            engine.dispose()
+
+    for label, (results_bytes, snapshot_bytes, seconds) in measurements.items():
+        print(
+            f"{label:<22} | scoring_results {results_bytes / 1024:9.0f} KiB | snapshots {snapshot_bytes / 1024:5.0f} KiB | "
+            f"{count} rows | load 1000 results {seconds * 1000:6.1f} ms"
+        )
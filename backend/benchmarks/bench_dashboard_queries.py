@@ -0,0 +1,135 @@
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from models import Base, Users, Jobs, Applications
+from core.scoring import ScoringEngine
+from core.scoring_db import save_scoring_results, get_scoring_summary_for_recruiter
+from services.scoring_service import get_recruiter_dashboard_data, get_scoring_insights_data
+from benchmarks.bench_scoring import generate_pool, RULES_CONFIG
+
+PAGE_SIZES = [10, 50, 200]
+POOL_SIZE = 400
+INSIGHTS_POOL_SIZES = [400, 4_000]
+DEEP_PAGE_SIZE = 50
+
+
+class QueryCounter:
+
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._increment)
+
+    def _increment(self, *args):
+        self.count += 1
+
+    def measure(self, function) -> tuple:
+        self.count = 0
+        started = time.perf_counter()
+        function()
+        return self.count, time.perf_counter() - started
+
+
+def prepare(pool_size: int):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+
+    poster = Users(full_name="Recruiter", email="recruiter@example.com", password_hash="x")
+    db.add(poster)
+    db.flush()
+    job = Jobs(title="Backend Engineer", company="Example", poster_id=poster.user_id)
+    db.add(job)
+    db.flush()
+
+    applicants = [
+        Users(full_name=f"Candidate {position}", email=f"candidate{position}@example.com", password_hash="x")
+        for position in range(pool_size)
+    ]
+    db.add_all(applicants)
+    db.flush()
+    started = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    applications = [
+        Applications(job_id=job.job_id, user_id=applicant.user_id, created_at=started + timedelta(seconds=position))
+        for position, applicant in enumerate(applicants)
+    ]
+    db.add_all(applications)
+    db.commit()
+
+    application_ids = [application.application_id for application in applications]
+    scoring_engine = ScoringEngine()
+    job_description, candidates, answers = generate_pool(pool_size)
+    save_scoring_results(
+        db,
+        [
+            (application_id, scoring_engine.score_candidate(job_description, candidate, RULES_CONFIG, candidate_answers), None, None)
+            for application_id, candidate, candidate_answers in zip(application_ids, candidates, answers)
+        ],
+        {name: category.value for name, category in RULES_CONFIG.items()}
+    )
+    db.expunge_all()
+    return engine, db, application_ids
+
+
+if __name__ == "__main__":
+    engine, db, application_ids = prepare(POOL_SIZE)
+    counter = QueryCounter(engine)
+
+    get_recruiter_dashboard_data(db, None, 1)
+    db.expunge_all()
+
+    dashboard_counts = set()
+    for page_size in PAGE_SIZES:
+        queries, seconds = counter.measure(lambda: get_recruiter_dashboard_data(db, None, page_size))
+        per_application, _ = counter.measure(
+            lambda: [get_scoring_summary_for_recruiter(db, application_id) for application_id in application_ids[:page_size]]
+        )
+        dashboard_counts.add(queries)
+        print(
+            f"dashboard limit={page_size:<4} | {queries:3d} queries | {seconds * 1000:7.1f} ms | "
+            f"per-application summaries would issue {per_application} queries"
+        )
+        db.expunge_all()
+
+    assert len(dashboard_counts) == 1, f"dashboard query count grows with page size: {sorted(dashboard_counts)}"
+    print("Query count is constant across page sizes")
+
+    insights_counts = set()
+    for pool_size in INSIGHTS_POOL_SIZES:
+        engine, db, application_ids = prepare(pool_size)
+        counter = QueryCounter(engine)
+        insights_queries, seconds = counter.measure(lambda: get_scoring_insights_data(db, None))
+        insights_counts.add(insights_queries)
+        print(f"insights pool={pool_size:<6} | {insights_queries:3d} queries | {seconds * 1000:7.1f} ms")
+
+    get_recruiter_dashboard_data(db, None, 1)
+    for sort in ("recent", "score"):
+        pages = []
+        seen = set()
+        cursor = None
+        while True:
+            db.expunge_all()
+            queries, seconds = counter.measure(
+                lambda: pages.append(get_recruiter_dashboard_data(db, None, DEEP_PAGE_SIZE, sort, cursor))
+            )
+            seen.update(application["application_id"] for application in pages[-1]["applications"])
+            cursor = pages[-1]["next_cursor"]
+            if len(pages) == 1:
+                first = (queries, seconds)
+            if cursor is None:
+                break
+        assert len(seen) == pages[-1]["total_count"], f"{sort} pages returned {len(seen)} of {pages[-1]['total_count']}"
+        print(
+            f"pages sort={sort:<6} | {len(pages)} pages of {DEEP_PAGE_SIZE} | first page {first[0]} queries "
+            f"{first[1] * 1000:6.1f} ms | last page {queries} queries {seconds * 1000:6.1f} ms"
+        )
+    db.close()
+
+    assert len(insights_counts) == 1, f"insights query count grows with pool size: {sorted(insights_counts)}"
+    print("Insights are aggregated in the database over the whole pool")
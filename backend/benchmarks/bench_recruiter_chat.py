@@ -0,0 +1,136 @@
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker, Session
+
+from models import Base, Users, Jobs, Applications, ChatSessions, ChatMessages, MessageType
+from services.application_service import get_recruiter_applications_with_chat_data, get_chat_sessions_for_application
+from benchmarks.bench_dashboard_queries import QueryCounter
+
+APPLICATION_COUNTS = [100, 1_000]
+PAGE_SIZE = 50
+SEED = 1234
+
+
+def applications_with_chat_per_application(db: Session, recruiter_id: int) -> list:
+    applications = db.query(Applications).join(Jobs).filter(Jobs.poster_id == recruiter_id).order_by(
+        Applications.created_at.desc(), Applications.application_id.desc()
+    ).all()
+
+    summaries = []
+    for app in applications:
+        chat_sessions = get_chat_sessions_for_application(db, app.application_id)
+        total_messages = sum(
+            db.query(ChatMessages).filter(ChatMessages.session_id == session.session_id).count()
+            for session in chat_sessions
+        )
+        latest_chat_activity = None
+        if chat_sessions:
+            latest_session = max(chat_sessions, key=lambda s: (s.created_at, s.session_id))
+            latest_message = db.query(ChatMessages).filter(
+                ChatMessages.session_id == latest_session.session_id
+            ).order_by(ChatMessages.created_at.desc(), ChatMessages.message_id.desc()).first()
+            if latest_message:
+                latest_chat_activity = {
+                    "last_message_at": latest_message.created_at.isoformat(),
+                    "last_message_type": latest_message.message_type.value,
+                    "last_message_preview": latest_message.content[:100] + "..." if len(latest_message.content) > 100 else latest_message.content
+                }
+        summaries.append((app.application_id, len(chat_sessions), total_messages, latest_chat_activity))
+    return summaries
+
+
+def prepare(application_count: int):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    rng = random.Random(SEED)
+    started = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    recruiter = Users(full_name="Recruiter", email="recruiter@example.com", password_hash="x")
+    db.add(recruiter)
+    db.flush()
+    job = Jobs(title="Backend Engineer", company="Example", poster_id=recruiter.user_id)
+    db.add(job)
+    db.flush()
+
+    application_ids = db.execute(
+        insert(Applications).returning(Applications.application_id, sort_by_parameter_order=True),
+        [
+            {
+                "job_id": job.job_id,
+                "user_id": recruiter.user_id,
+                "application_status": "submitted",
+                "created_at": started + timedelta(minutes=position // 2)
+            }
+            for position in range(application_count)
+        ]
+    ).scalars().all()
+
+    sessions = [
+        {"user_id": recruiter.user_id, "application_id": application_id, "created_at": started + timedelta(hours=rng.randint(0, 500))}
+        for application_id in application_ids
+        for _ in range(rng.choice([0, 1, 1, 2, 3]))
+    ]
+    session_ids = db.execute(
+        insert(ChatSessions).returning(ChatSessions.session_id, sort_by_parameter_order=True), sessions
+    ).scalars().all()
+    db.execute(insert(ChatMessages), [
+        {
+            "session_id": session_id,
+            "message_type": rng.choice([MessageType.user, MessageType.ai, MessageType.question]).name,
+            "content": "Tell me about your experience. " * rng.randint(1, 6),
+            "created_at": started + timedelta(hours=rng.randint(0, 500), seconds=position)
+        }
+        for session_id in session_ids
+        for position in range(rng.choice([0, 2, 5, 10]))
+    ])
+    db.commit()
+    return engine, db, recruiter.user_id
+
+
+def walk_pages(db: Session, recruiter_id: int) -> list:
+    pages = []
+    cursor = None
+    while True:
+        pages.append(get_recruiter_applications_with_chat_data(db, recruiter_id, PAGE_SIZE, cursor))
+        cursor = pages[-1]["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+if __name__ == "__main__":
+    for application_count in APPLICATION_COUNTS:
+        engine, db, recruiter_id = prepare(application_count)
+        counter = QueryCounter(engine)
+
+        before_queries, before_seconds = counter.measure(lambda: applications_with_chat_per_application(db, recruiter_id))
+        expected = applications_with_chat_per_application(db, recruiter_id)
+        db.expunge_all()
+        page_queries, page_seconds = counter.measure(lambda: get_recruiter_applications_with_chat_data(db, recruiter_id, PAGE_SIZE))
+
+        pages = walk_pages(db, recruiter_id)
+        actual = [
+            (
+                application["application_id"],
+                application["chat_summary"]["total_sessions"],
+                application["chat_summary"]["total_messages"],
+                application["chat_summary"]["latest_activity"]
+            )
+            for page in pages
+            for application in page["applications_with_chat"]
+        ]
+        assert actual == expected, "paged summaries differ from the per-application queries"
+        assert all(page["total_applications"] == application_count for page in pages)
+
+        print(
+            f"applications={application_count:<6} | per-application: {before_queries:5d} queries {before_seconds * 1000:8.1f} ms | "
+            f"page of {PAGE_SIZE}: {page_queries} query {page_seconds * 1000:6.1f} ms | {len(pages)} pages match"
+        )
+        db.close()
@@ -0,0 +1,52 @@
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.scoring import ScoringEngine, DetailLevel
+from benchmarks.bench_score_batch import generate_candidates, JOB_DESCRIPTION, RULES_CONFIG
+
+POOL_SIZE = 5_000
+
+
+def measure(detail_level: DetailLevel, render_text: bool, candidates: list):
+    engine = ScoringEngine(detail_level=detail_level)
+    engine.score_candidate(JOB_DESCRIPTION, candidates[0], RULES_CONFIG, [])
+    gc.collect()
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    started = time.perf_counter()
+    reports = [engine.score_candidate(JOB_DESCRIPTION, candidate, RULES_CONFIG, []) for candidate in candidates]
+    if render_text:
+        for report in reports:
+            report.summary
+            report.fail_reason
+            for criterion in report.primary_breakdown:
+                criterion.notes
+    elapsed = time.perf_counter() - started
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    retained_bytes = sum(stat.size_diff for stat in stats)
+    retained_blocks = sum(stat.count_diff for stat in stats)
+
+    label = f"{detail_level.value}{' + text read' if render_text else ''}"
+    print(
+        f"{label:<18} | {retained_bytes / len(candidates):7.0f} bytes/report | "
+        f"{retained_blocks / len(candidates):5.1f} blocks/report | "
+        f"{elapsed / len(candidates) * 1e6:6.1f} us/score (traced)"
+    )
+    return reports
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else POOL_SIZE
+    candidates = generate_candidates(size)
+    measure(DetailLevel.FULL, True, candidates)
+    measure(DetailLevel.FULL, False, candidates)
+    measure(DetailLevel.SCORES, False, candidates)
@@ -0,0 +1,94 @@
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.scoring import ScoringEngine, CriterionCategory
+
+POOL_SIZES = [10_000, 100_000]
+SEED = 42
+
+SKILLS = ["Python", "SQL", "FastAPI", "React", "Docker", "AWS", "Go", "Kubernetes", "python3", " sql ", "golang", "K8s"]
+EDUCATION = ["Bachelor's", "Master's", "PhD", "High School"]
+EMPLOYMENT_TYPES = ["full_time", "part_time", "contract"]
+
+RULES_CONFIG = {
+    "criminal_background": CriterionCategory.HARD_NO,
+    "location_relocation": CriterionCategory.PREFERABLE,
+    "years_experience": CriterionCategory.YES,
+    "core_title_role": CriterionCategory.YES,
+    "education": CriterionCategory.PREFERABLE,
+    "languages": CriterionCategory.PREFERABLE,
+    "employment_type": CriterionCategory.YES,
+    "salary_range": CriterionCategory.PREFERABLE,
+    "required_skills": CriterionCategory.YES,
+}
+
+JOB_DESCRIPTION = {
+    "title": "Backend Engineer",
+    "years_experience": 4,
+    "required_skills": ["Python", "SQL", "FastAPI"],
+    "employment_type": "full_time",
+    "salary_range": {"max": 4000},
+    "location_relocation": "required",
+    "core_title_role": "Backend Engineer",
+    "education": "Bachelor's",
+    "languages": True,
+}
+
+
+def generate_candidates(count: int, seed: int = SEED) -> list:
+    rng = random.Random(seed)
+    candidates = []
+    for _ in range(count):
+        candidates.append({
+            "years_experience": rng.choice([None, rng.randint(0, 12), rng.uniform(0, 12)]),
+            "salary_range": rng.choice([None, rng.randint(1500, 6000)]),
+            "required_skills": rng.sample(SKILLS, rng.randint(0, len(SKILLS))),
+            "employment_type": rng.choice(EMPLOYMENT_TYPES),
+            "location_relocation": rng.choice(["yes", "no", True, False, None]),
+            "core_title_role": rng.choice(["backend engineer", "Frontend Engineer", None]),
+            "education": rng.choice(EDUCATION),
+            "languages": rng.choice([True, False, "present"]),
+            "criminal_background": rng.choice([None, None, None, False, "yes"]),
+        })
+    return candidates
+
+
+def assert_identical(expected: list, actual: list):
+    for left, right in zip(expected, actual):
+        if left != right:
+            raise AssertionError(f"Batch result differs from per-candidate result:\n{left}\n{right}")
+
+
+def run(pool_size: int):
+    engine = ScoringEngine()
+    candidates = generate_candidates(pool_size)
+
+    started = time.perf_counter()
+    expected = [engine.score_candidate(JOB_DESCRIPTION, candidate, RULES_CONFIG, []) for candidate in candidates]
+    loop_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batch = engine.score_batch(JOB_DESCRIPTION, candidates, RULES_CONFIG)
+    batch_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    reports = batch.reports()
+    reports_seconds = time.perf_counter() - started
+
+    assert_identical(expected, reports)
+
+    print(
+        f"{pool_size:>8} candidates | per-candidate {loop_seconds * 1000:9.1f} ms | "
+        f"batch {batch_seconds * 1000:8.1f} ms ({loop_seconds / batch_seconds:5.1f}x) | "
+        f"+reports {reports_seconds * 1000:9.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or POOL_SIZES
+    for size in sizes:
+        run(size)
@@ -0,0 +1,204 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.scoring import ScoringEngine, CriterionCategory
+
+POOL_SIZES = [100, 1_000, 10_000]
+REPEATS = 5
+SEED = 1234
+REGRESSION_TOLERANCE = 0.3
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "scoring.json"
+
+SKILLS = ["Python", "SQL", "FastAPI", "React", "Docker", "AWS", "Go", "Kubernetes", "python3", " sql ", "golang", "K8s", "TypeScript"]
+TITLES = ["Backend Engineer", "Frontend Engineer", "Data Engineer", "backend engineer"]
+EDUCATION = ["Bachelor's", "Master's", "PhD", "High School"]
+EMPLOYMENT_TYPES = ["full_time", "part_time", "contract"]
+ANSWER_CATEGORIES = ["YES", "PREFERABLE", "HARD_NO"]
+
+RULES_CONFIG = {
+    "criminal_background": CriterionCategory.HARD_NO,
+    "years_experience": CriterionCategory.YES,
+    "salary_range": CriterionCategory.PREFERABLE,
+    "required_skills": CriterionCategory.YES,
+    "core_title_role": CriterionCategory.YES,
+    "education": CriterionCategory.PREFERABLE,
+    "employment_type": CriterionCategory.YES,
+    "languages": CriterionCategory.PREFERABLE,
+    "location_relocation": CriterionCategory.PREFERABLE,
+}
+
+
+def generate_job(rng: random.Random) -> dict:
+    return {
+        "title": rng.choice(TITLES),
+        "years_experience": rng.choice([2, 4, 5.5]),
+        "salary_range": rng.choice([{"max": rng.randint(3000, 6000)}, {"max_salary": 4500}, rng.randint(3000, 6000)]),
+        "required_skills": rng.sample(SKILLS, rng.randint(1, 4)),
+        "core_title_role": rng.choice(TITLES),
+        "education": rng.choice(EDUCATION),
+        "employment_type": rng.choice(EMPLOYMENT_TYPES),
+        "languages": rng.choice([True, "required", False]),
+        "location_relocation": rng.choice(["required", "no"]),
+        "criminal_background": True,
+    }
+
+
+def generate_candidate(rng: random.Random) -> dict:
+    return {
+        "years_experience": rng.choice([None, rng.randint(0, 12), rng.uniform(0, 12)]),
+        "salary_range": rng.choice([None, rng.randint(1500, 8000), float(rng.randint(1500, 8000))]),
+        "required_skills": rng.sample(SKILLS, rng.randint(0, len(SKILLS))),
+        "core_title_role": rng.choice(TITLES + [None]),
+        "education": rng.choice(EDUCATION),
+        "employment_type": rng.choice(EMPLOYMENT_TYPES),
+        "languages": rng.choice([True, False, "present", "no"]),
+        "location_relocation": rng.choice(["yes", "no", True, False, None]),
+        "criminal_background": rng.choice([None, None, None, False, "yes"]),
+    }
+
+
+def generate_answers(rng: random.Random) -> list:
+    return [
+        {
+            "question_id": f"q{position}",
+            "category": rng.choice(ANSWER_CATEGORIES),
+            "rationale": "Synthetic answer rationale"
+        }
+        for position in range(rng.randint(0, 6))
+    ]
+
+
+def generate_pool(count: int, seed: int = SEED) -> tuple:
+    rng = random.Random(seed)
+    job = generate_job(rng)
+    candidates = [generate_candidate(rng) for _ in range(count)]
+    answers = [generate_answers(rng) for _ in range(count)]
+    return job, candidates, answers
+
+
+def best_of(repeats: int, function) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def calibrate(repeats: int) -> float:
+    return best_of(repeats, lambda: sum(value * value for value in range(200_000))) * 1000
+
+
+def measure(pool_size: int, repeats: int, seed: int) -> dict:
+    engine = ScoringEngine()
+    job, candidates, answers = generate_pool(pool_size, seed)
+    primaries = [engine.score_primary(job, candidate, RULES_CONFIG) for candidate in candidates]
+    secondaries = [engine.score_secondary(candidate_answers)[0] for candidate_answers in answers]
+    finals = [
+        engine.config.primary_weight * primary[0] + engine.config.secondary_weight * secondary
+        for primary, secondary in zip(primaries, secondaries)
+    ]
+
+    benchmarks = {
+        "score_primary": lambda: [engine.score_primary(job, candidate, RULES_CONFIG) for candidate in candidates],
+        "score_secondary": lambda: [engine.score_secondary(candidate_answers) for candidate_answers in answers],
+        "score_candidate": lambda: [
+            engine.score_candidate(job, candidate, RULES_CONFIG, candidate_answers)
+            for candidate, candidate_answers in zip(candidates, answers)
+        ],
+        "_generate_summary": lambda: [
+            engine._generate_summary(
+                primary[0], secondary, final,
+                "PASS" if final >= engine.config.pass_threshold else "REJECT",
+                primary[1]
+            )
+            for primary, secondary, final in zip(primaries, secondaries, finals)
+        ],
+    }
+
+    results = {}
+    for name, function in benchmarks.items():
+        seconds = best_of(repeats, function)
+        results[name] = {
+            "total_ms": seconds * 1000,
+            "per_call_us": seconds / pool_size * 1e6
+        }
+    return results
+
+
+def run(pool_sizes: list, repeats: int, seed: int) -> dict:
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "seed": seed,
+            "repeats": repeats,
+            "pool_sizes": pool_sizes,
+            "calibration_ms": calibrate(repeats)
+        },
+        "results": {str(size): measure(size, repeats, seed) for size in pool_sizes}
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list:
+    # normalise by the calibration loop so a slower or busier machine does not read as a regression
+    speed = current["meta"]["calibration_ms"] / baseline["meta"]["calibration_ms"]
+    regressions = []
+    for size, functions in current["results"].items():
+        for name, timing in functions.items():
+            expected = baseline["results"].get(size, {}).get(name)
+            if expected is None:
+                continue
+            ratio = timing["per_call_us"] / (expected["per_call_us"] * speed)
+            if ratio > 1 + tolerance:
+                regressions.append(
+                    f"{name} @ {size}: {timing['per_call_us']:.2f} us/call vs baseline "
+                    f"{expected['per_call_us']:.2f} us/call ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def print_results(results: dict):
+    for size, functions in results["results"].items():
+        for name, timing in functions.items():
+            print(f"{int(size):>7} | {name:<18} | {timing['total_ms']:9.2f} ms | {timing['per_call_us']:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Microbenchmarks for core/scoring.py")
+    parser.add_argument("--sizes", type=int, nargs="+", default=POOL_SIZES)
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, default=None, help=f"compare against a baseline (default {BASELINE_PATH.name})")
+    parser.add_argument("--check", action="store_true", help="exit non-zero on regressions against the baseline")
+    parser.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.repeats, args.seed)
+    print_results(results)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    baseline_path = args.baseline or BASELINE_PATH
+    if args.update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(results, indent=2))
+        print(f"Baseline written to {baseline_path}")
+    elif args.check or args.baseline:
+        regressions = compare(results, json.loads(baseline_path.read_text()), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions and args.check:
+            sys.exit(1)
+        if not regressions:
+            print(f"No regressions beyond {args.tolerance:.0%} of {baseline_path}")
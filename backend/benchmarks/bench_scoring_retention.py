@@ -0,0 +1,130 @@
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, func, insert, select, update
+from sqlalchemy.orm import sessionmaker
+
+from models import Base, Users, Jobs, Applications, ScoringResults, ScoringBreakdown
+from core.scoring_retention import RetentionPolicy, compact_scoring_history
+from benchmarks.bench_scoring import SEED
+
+APPLICATION_COUNT = 1_000
+HISTORY_PER_APPLICATION = 20
+HISTORY_DAYS = 30
+CRITERIA_PER_RESULT = 9
+
+
+def prepare(url: str, applications: int, history: int, seed: int):
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    rng = random.Random(seed)
+
+    poster = Users(full_name="Benchmark Recruiter", email=f"bench-{time.time_ns()}@example.com", password_hash="x")
+    db.add(poster)
+    db.flush()
+    job = Jobs(title="Benchmark", company="Benchmark", poster_id=poster.user_id)
+    db.add(job)
+    db.flush()
+    application_ids = db.execute(
+        insert(Applications).returning(Applications.application_id, sort_by_parameter_order=True),
+        [{"job_id": job.job_id, "user_id": poster.user_id} for _ in range(applications)]
+    ).scalars().all()
+
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "application_id": application_id,
+            "primary_score": rng.uniform(0, 100),
+            "secondary_score": rng.uniform(0, 100),
+            "final_score": rng.uniform(0, 100),
+            "decision": rng.choice(["PASS", "REJECT"]),
+            "summary": "Synthetic scoring summary " * 8,
+            "created_at": now - timedelta(days=HISTORY_DAYS * position / history, minutes=rng.randint(0, 59))
+        }
+        for application_id in application_ids
+        for position in range(history)
+    ]
+    scoring_ids = db.execute(
+        insert(ScoringResults).returning(ScoringResults.scoring_id, sort_by_parameter_order=True), rows
+    ).scalars().all()
+    db.execute(insert(ScoringBreakdown), [
+        {
+            "scoring_id": scoring_id,
+            "criterion_name": f"criterion_{position}",
+            "category": "YES",
+            "weight": 10.0,
+            "passed": True,
+            "points_awarded": 10.0,
+            "notes": "Synthetic criterion note"
+        }
+        for scoring_id in scoring_ids
+        for position in range(CRITERIA_PER_RESULT)
+    ])
+
+    # most pointers sit on the newest result, some on an older one to make sure pinned rows survive compaction
+    pointers = {
+        application_id: scoring_ids[index * history + (rng.randrange(history) if rng.random() < 0.1 else 0)]
+        for index, application_id in enumerate(application_ids)
+    }
+    for application_id, scoring_id in pointers.items():
+        db.execute(
+            update(Applications).where(Applications.application_id == application_id).values(latest_scoring_id=scoring_id)
+        )
+    db.commit()
+    return engine, db, pointers
+
+
+def count(db, model) -> int:
+    return db.scalar(select(func.count()).select_from(model))
+
+
+def run(url: str, applications: int, history: int, policy: RetentionPolicy):
+    engine, db, pointers = prepare(url, applications, history, SEED)
+    before = {model.__tablename__: count(db, model) for model in (ScoringResults, ScoringBreakdown)}
+
+    preview = list(compact_scoring_history(db, policy, dry_run=True))[-1]
+    report = list(compact_scoring_history(db, policy))[-1]
+    after = {model.__tablename__: count(db, model) for model in (ScoringResults, ScoringBreakdown)}
+
+    surviving = set(db.scalars(select(ScoringResults.scoring_id).where(ScoringResults.scoring_id.in_(pointers.values()))))
+    assert surviving == set(pointers.values()), "compaction deleted a result an application still points to"
+    assert preview["rows_reclaimed"] == report["rows_reclaimed"]
+    for table, counts in report["tables"].items():
+        if table in before:
+            assert before[table] - after[table] == counts["rows"]
+
+    per_application = select(func.count().label("results")).select_from(ScoringResults).group_by(ScoringResults.application_id).subquery()
+    per_result = db.scalar(select(func.max(per_application.c.results)))
+
+    print(f"{applications} applications x {history} results on {engine.dialect.name}, policy {policy}")
+    for table, counts in report["tables"].items():
+        print(f"{table:<20} | {counts['rows']:8d} rows | {counts['bytes'] / 1024:9.0f} KiB reclaimed")
+    print(
+        f"total                | {report['rows_reclaimed']:8d} rows | {report['bytes_reclaimed'] / 1024:9.0f} KiB | "
+        f"{report['batches']} delete batches | {report['elapsed_seconds'] * 1000:.0f} ms"
+    )
+    print(f"results per application after compaction: at most {per_result}; all {len(pointers)} latest pointers intact")
+    db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scoring history compaction")
+    parser.add_argument("--url", default="sqlite://")
+    parser.add_argument("--applications", type=int, default=APPLICATION_COUNT)
+    parser.add_argument("--history", type=int, default=HISTORY_PER_APPLICATION)
+    parser.add_argument("--keep-latest", type=int, default=3)
+    parser.add_argument("--daily-window-days", type=int, default=7)
+    args = parser.parse_args()
+    run(
+        args.url,
+        args.applications,
+        args.history,
+        RetentionPolicy(keep_latest=args.keep_latest, daily_window_days=args.daily_window_days)
+    )
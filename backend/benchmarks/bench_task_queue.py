@@ -0,0 +1,220 @@
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+import core.task_queue as task_queue
+from models import Base, Users, Jobs, Applications, ApplicationStatus, QueuedTasks, ScoringResults
+from core.job_stats import record_status_changes, get_job_stats, rebuild_job_stats, summarize_job_stats
+from services.application_service import auto_score_application
+from services.scoring_service import create_job_description_data, create_candidate_data
+from services.task_service import enqueue_application_intake, run_score_application_task
+
+APPLICATIONS = 300
+WORKERS = 2
+CV = "Senior Python developer with 6 years of experience in Berlin. Skills: Python, FastAPI, PostgreSQL, Docker."
+
+
+def prepare(path: str):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"timeout": 30})
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    db = session_factory()
+
+    recruiter = Users(full_name="Recruiter", email="recruiter@example.com", password_hash="x")
+    candidate = Users(full_name="Candidate", email="candidate@example.com", password_hash="x", location="Berlin")
+    db.add_all([recruiter, candidate])
+    db.flush()
+    job = Jobs(
+        title="Backend Engineer", company="Example", poster_id=recruiter.user_id,
+        desired_location="Berlin", desired_skills=["Python", "FastAPI", "PostgreSQL"]
+    )
+    db.add(job)
+    db.commit()
+    ids = (job.job_id, candidate.user_id)
+    db.close()
+    return engine, session_factory, ids
+
+
+def new_application(job_id: int, user_id: int) -> Applications:
+    return Applications(job_id=job_id, user_id=user_id, cv=CV, application_status=ApplicationStatus.submitted)
+
+
+def intake_inline(session_factory, job_id: int, user_id: int) -> float:
+    db = session_factory()
+    started = time.perf_counter()
+    for _ in range(APPLICATIONS):
+        application = new_application(job_id, user_id)
+        db.add(application)
+        record_status_changes(db, [(job_id, None, ApplicationStatus.submitted)])
+        db.commit()
+        db.refresh(application)
+        job, user = db.get(Jobs, job_id), db.get(Users, user_id)
+        auto_score_application(db, application.application_id, create_job_description_data(job), create_candidate_data(user, application))
+        db.refresh(application)
+    elapsed = time.perf_counter() - started
+    db.close()
+    return elapsed
+
+
+def intake_queued(session_factory, job_id: int, user_id: int) -> float:
+    db = session_factory()
+    started = time.perf_counter()
+    for _ in range(APPLICATIONS):
+        application = new_application(job_id, user_id)
+        db.add(application)
+        db.flush()
+        record_status_changes(db, [(job_id, None, ApplicationStatus.submitted)])
+        enqueue_application_intake(db, application, prepare_interview=True)
+        db.commit()
+        db.refresh(application)
+    elapsed = time.perf_counter() - started
+    db.close()
+    return elapsed
+
+
+def drain_with_pool(session_factory) -> tuple:
+    executions = Counter()
+
+    def score(db, payload):
+        executions[("score", payload["application_id"])] += 1
+        return run_score_application_task(db, payload)
+
+    def prepare_interview(db, payload):
+        executions[("interview", payload["application_id"])] += 1
+        return {"rating_score": 80, "discrepancies": [], "questions": []}
+
+    pool = task_queue.TaskWorkerPool(
+        session_factory,
+        {task_queue.TASK_SCORE_APPLICATION: score, task_queue.TASK_PREPARE_INTERVIEW: prepare_interview},
+        workers=WORKERS,
+        poll_seconds=0.05
+    )
+    started = time.perf_counter()
+    pool.start()
+    db = session_factory()
+    try:
+        while db.scalar(select(func.count()).select_from(QueuedTasks).where(QueuedTasks.status != "done")):
+            time.sleep(0.05)
+    finally:
+        db.close()
+        pool.stop()
+    return time.perf_counter() - started, executions, pool.stats()
+
+
+def check_retries(session_factory):
+    task_queue.QUEUE_RETRY_BASE_SECONDS = 0
+    calls = Counter()
+
+    def flaky(db, payload):
+        calls[payload["name"]] += 1
+        if payload["name"] == "broken" or calls[payload["name"]] < 3:
+            raise RuntimeError(f"attempt {calls[payload['name']]} failed")
+        return {"calls": calls[payload["name"]]}
+
+    db = session_factory()
+    flaky_task = task_queue.enqueue_task(db, "flaky", {"name": "flaky"})
+    broken_task = task_queue.enqueue_task(db, "flaky", {"name": "broken"}, max_attempts=2)
+    db.commit()
+
+    pool = task_queue.TaskWorkerPool(session_factory, {"flaky": flaky}, workers=1)
+    while pool.run_once():
+        pass
+
+    db.refresh(flaky_task)
+    db.refresh(broken_task)
+    assert (flaky_task.status, flaky_task.attempts) == ("done", 3), (flaky_task.status, flaky_task.attempts)
+    assert (broken_task.status, broken_task.attempts) == ("failed", 2), (broken_task.status, broken_task.attempts)
+    assert broken_task.last_error == "RuntimeError: attempt 2 failed"
+    assert pool.stats()["tasks"]["flaky"] == {"completed": 1, "retried": 3, "failed": 1, "average_seconds": pool.stats()["tasks"]["flaky"]["average_seconds"]}
+    db.close()
+
+
+def check_visibility_timeout(session_factory):
+    db = session_factory()
+    task = task_queue.enqueue_task(db, "lease", {}, max_attempts=2)
+    db.commit()
+
+    first = task_queue.claim_tasks(db, "worker-a", visibility_timeout=0, task_types=["lease"])
+    assert [claimed["task_id"] for claimed in first] == [task.task_id]
+    second = task_queue.claim_tasks(db, "worker-b", visibility_timeout=0, task_types=["lease"])
+    assert [claimed["attempts"] for claimed in second] == [2], "expired lease was not reclaimed"
+    assert not task_queue.complete_task(db, first[0]), "stale worker completed a reclaimed task"
+
+    assert task_queue.claim_tasks(db, "worker-c", task_types=["lease"]) == []
+    db.refresh(task)
+    assert (task.status, task.last_error) == ("failed", task_queue.VISIBILITY_TIMEOUT_ERROR)
+    db.close()
+
+
+def check_batch_lease(session_factory):
+    db = session_factory()
+    first = task_queue.enqueue_task(db, "batched", {"name": "first"})
+    second = task_queue.enqueue_task(db, "batched", {"name": "second"}, delay_seconds=-60)
+    db.commit()
+    runs = Counter()
+
+    def slow(handler_db, payload):
+        runs[payload["name"]] += 1
+        if payload["name"] == "first":
+            time.sleep(0.3)
+            other = session_factory()
+            stolen = task_queue.claim_tasks(other, "worker-b", limit=1, task_types=["batched"])
+            assert [task["task_id"] for task in stolen] == [second.task_id], "expired batch task was not reclaimed"
+            runs["second"] += 1
+            task_queue.complete_task(other, stolen[0])
+            other.close()
+        return {}
+
+    pool = task_queue.TaskWorkerPool(session_factory, {"batched": slow}, workers=1, visibility_timeout=0.1, claim_batch=2)
+    assert pool.run_once() == 2
+    assert runs == {"first": 1, "second": 1}, f"a reclaimed batch task ran twice: {dict(runs)}"
+    db.refresh(first)
+    assert first.status == "done"
+    db.close()
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        engine, session_factory, (job_id, user_id) = prepare(os.path.join(directory, "queue.db"))
+
+        inline_seconds = intake_inline(session_factory, job_id, user_id)
+        queued_seconds = intake_queued(session_factory, job_id, user_id)
+
+        db = session_factory()
+        depth = task_queue.get_queue_depth(db)
+        assert {queue["ready"] for queue in depth.values()} == {APPLICATIONS}, depth
+        db.close()
+
+        drain_seconds, executions, stats = drain_with_pool(session_factory)
+        assert len(executions) == 2 * APPLICATIONS and set(executions.values()) == {1}, "a task ran more than once"
+
+        db = session_factory()
+        unscored = db.scalar(select(func.count()).select_from(Applications).where(Applications.latest_scoring_id.is_(None)))
+        assert unscored == 0, f"{unscored} applications were not scored"
+        assert db.scalar(select(func.count()).select_from(ScoringResults)) >= 2 * APPLICATIONS
+        incremental = summarize_job_stats(get_job_stats(db, job_id))
+        rebuilt = summarize_job_stats(list(rebuild_job_stats(db, [job_id]).values()))
+        assert incremental["statuses"] == rebuilt["statuses"] and incremental["scored_applications"] == rebuilt["scored_applications"]
+        assert task_queue.get_queue_depth(db) == {}
+        db.close()
+
+        check_retries(session_factory)
+        check_visibility_timeout(session_factory)
+        check_batch_lease(session_factory)
+
+        print(f"intake inline scoring : {inline_seconds / APPLICATIONS * 1000:6.2f} ms per application")
+        print(f"intake enqueue        : {queued_seconds / APPLICATIONS * 1000:6.2f} ms per application")
+        print(
+            f"{WORKERS} workers drained {2 * APPLICATIONS} tasks in {drain_seconds:5.2f} s "
+            f"({2 * APPLICATIONS / drain_seconds:6.0f} tasks/s) | {stats['tasks']}"
+        )
+        print("retries, permanent failures, visibility-timeout reclaims and batch lease renewal behave as expected")
+        engine.dispose()
@@ -0,0 +1,125 @@
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from models import Base, Users, Jobs, Applications, ApplicationStatus
+from core.scoring import ScoringConfig, ScoringEngine
+from core.scoring_db import save_scoring_results
+from core.scoring_replay import replay_job_scores
+from benchmarks.bench_score_batch import generate_candidates, JOB_DESCRIPTION, RULES_CONFIG
+
+POOL_SIZE = 50_000
+CHUNK_SIZE = 5_000
+RUNS = 5
+SAMPLE = 300
+LANGUAGES_DISABLED_EVERY = 10
+
+WHAT_IF_WEIGHTS = {
+    **ScoringConfig().weights,
+    "criminal_background": 10.0,
+    "years_experience": 30.0,
+    "required_skills": 5.0,
+}
+WHAT_IF = ScoringConfig(weights=WHAT_IF_WEIGHTS, experience_tolerance=2.0, salary_soft_overage=0.2, pass_threshold=65.0)
+
+
+def prepare(path: str, size: int):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    db = session_factory()
+
+    recruiter = Users(full_name="Recruiter", email="recruiter@example.com", password_hash="x")
+    candidate = Users(full_name="Candidate", email="candidate@example.com", password_hash="x")
+    db.add_all([recruiter, candidate])
+    db.flush()
+    job = Jobs(title="Backend Engineer", company="Example", poster_id=recruiter.user_id)
+    db.add(job)
+    db.flush()
+
+    application_ids = db.execute(
+        insert(Applications).returning(Applications.application_id, sort_by_parameter_order=True),
+        [{"job_id": job.job_id, "user_id": candidate.user_id, "cv": "cv", "application_status": ApplicationStatus.submitted}] * size
+    ).scalars().all()
+
+    default_engine = ScoringEngine()
+    without_languages = ScoringEngine(ScoringConfig(weights={**ScoringConfig().weights, "languages": None}))
+    rules = {name: category.value for name, category in RULES_CONFIG.items()}
+    candidates = generate_candidates(size)
+
+    for start in range(0, size, CHUNK_SIZE):
+        for scoring_engine, offset in ((default_engine, 1), (without_languages, 0)):
+            entries = [
+                (application_ids[position], scoring_engine.score_candidate(JOB_DESCRIPTION, candidates[position], RULES_CONFIG, []), None, None)
+                for position in range(start, min(start + CHUNK_SIZE, size))
+                if (position % LANGUAGES_DISABLED_EVERY != 0) == offset
+            ]
+            save_scoring_results(db, entries, rules, scoring_engine.config)
+    db.commit()
+
+    job_id = job.job_id
+    db.close()
+    return engine, session_factory, job_id, dict(zip(application_ids, candidates))
+
+
+def timed_replay(session_factory, job_id: int, config: ScoringConfig) -> tuple:
+    timings = []
+    for _ in range(RUNS):
+        db = session_factory()
+        started = time.perf_counter()
+        replay = replay_job_scores(db, job_id, config)
+        timings.append(time.perf_counter() - started)
+        db.close()
+    return statistics.median(timings), replay
+
+
+def check_against_engine(session_factory, job_id: int, candidates: dict, size: int):
+    db = session_factory()
+    replay = replay_job_scores(db, job_id, WHAT_IF, top_deltas=size)
+    db.close()
+
+    flagged = set(replay["requires_rescore"])
+    new_scores = {delta["application_id"]: delta["new_score"] for delta in replay["largest_deltas"]}
+    positions = {application_id: position for position, application_id in enumerate(candidates)}
+    assert all(positions[application_id] % LANGUAGES_DISABLED_EVERY == 0 for application_id in flagged), "scored application flagged"
+
+    engine = ScoringEngine(WHAT_IF)
+    checked = 0
+    for application_id, candidate in list(candidates.items())[:SAMPLE * LANGUAGES_DISABLED_EVERY]:
+        if application_id in flagged:
+            continue
+        report = engine.score_candidate(JOB_DESCRIPTION, candidate, RULES_CONFIG, [])
+        assert abs(report.final_score - new_scores[application_id]) < 1e-6, (application_id, report.final_score, new_scores[application_id])
+        checked += 1
+    return replay, checked
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else POOL_SIZE
+    with tempfile.TemporaryDirectory() as directory:
+        started = time.perf_counter()
+        engine, session_factory, job_id, candidates = prepare(os.path.join(directory, "replay.db"), size)
+        print(f"scored and stored {size} applications in {time.perf_counter() - started:6.1f} s")
+
+        unchanged_seconds, unchanged = timed_replay(session_factory, job_id, ScoringConfig())
+        assert unchanged["summary"]["flipped_to_pass"] == unchanged["summary"]["flipped_to_reject"] == 0
+        assert all(abs(delta["delta"]) < 1e-9 for delta in unchanged["largest_deltas"])
+
+        what_if_seconds, what_if = timed_replay(session_factory, job_id, WHAT_IF)
+        replay, checked = check_against_engine(session_factory, job_id, candidates, size)
+
+        print(f"replay, unchanged config : {unchanged_seconds * 1000:8.1f} ms (median of {RUNS})")
+        print(
+            f"replay, what-if config   : {what_if_seconds * 1000:8.1f} ms (median of {RUNS}) | "
+            f"{what_if['summary']} | {len(what_if['largest_deltas'])} deltas returned"
+        )
+        print(f"{checked} replayed scores match the engine; {len(replay['requires_rescore'])} applications without a languages row flagged for rescore")
+        engine.dispose()
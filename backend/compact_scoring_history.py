@@ -0,0 +1,54 @@
+import argparse
+import json
+
+from core.config import settings
+from core.db import Database
+from core.scoring_retention import RetentionPolicy, compact_scoring_history, RETENTION_APPLICATION_BATCH, RETENTION_DELETE_BATCH
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Delete scoring history outside the retention policy")
+    parser.add_argument("--keep-latest", type=int, default=3, help="results kept per application regardless of age")
+    parser.add_argument("--no-keep-daily", dest="keep_daily", action="store_false", help="do not keep one result per day")
+    parser.add_argument("--daily-window-days", type=int, default=90, help="how far back one result per day is kept, 0 for forever")
+    parser.add_argument("--job-id", type=int, default=None)
+    parser.add_argument("--application-batch", type=int, default=RETENTION_APPLICATION_BATCH)
+    parser.add_argument("--delete-batch", type=int, default=RETENTION_DELETE_BATCH)
+    parser.add_argument("--pause", type=float, default=0.0, help="seconds to sleep between delete batches")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    policy = RetentionPolicy(
+        keep_latest=args.keep_latest,
+        keep_daily=args.keep_daily,
+        daily_window_days=args.daily_window_days or None,
+        application_batch=args.application_batch,
+        delete_batch=args.delete_batch,
+        pause_seconds=args.pause
+    )
+
+    database = Database(
+        dbtype=settings.DB_TYPE,
+        dbname=settings.DB_NAME,
+        user=settings.DB_USER,
+        password=settings.DB_PASSWORD,
+        host=settings.DB_HOST,
+        port=settings.DB_PORT
+    )
+
+    db = database.get_session()
+    try:
+        for progress in compact_scoring_history(db, policy, args.job_id, args.dry_run):
+            if progress["status"] == "completed":
+                print(json.dumps(progress, indent=2))
+            else:
+                print(
+                    f"up to application {progress['last_application_id']}: {progress['rows_reclaimed']} rows, "
+                    f"{progress['bytes_reclaimed']} bytes in {progress['batches']} batches"
+                )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
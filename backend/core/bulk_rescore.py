@@ -0,0 +1,70 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from core.scoring import ScoringEngine, CriterionCategory, ScoreReport
+
+RESCORE_WORKERS = os.cpu_count() or 1
+RESCORE_INLINE_THRESHOLD = 200
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_rescore_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=RESCORE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pool
+
+
+def shutdown_rescore_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
+
+
+def score_chunk(
+    job_description: Dict,
+    chunk: List[Tuple[int, Dict]],
+    rules_config: Dict[str, str]
+) -> List[Tuple[int, ScoreReport, str, str]]:
+    engine = ScoringEngine()
+    rules = {key: CriterionCategory(value) for key, value in rules_config.items()}
+    candidates = [candidate for _, candidate in chunk]
+
+    reports = engine.score_batch(job_description, candidates, rules).reports()
+    results = []
+    for (application_id, candidate), report in zip(chunk, reports):
+        primary_fingerprint = engine.primary_fingerprint(job_description, candidate, rules)
+        results.append((
+            application_id,
+            report,
+            primary_fingerprint,
+            engine.result_fingerprint(job_description, candidate, rules, [], primary_fingerprint)
+        ))
+    return results
+
+
+def score_partitioned(
+    job_description: Dict,
+    batch: List[Tuple[int, Dict]],
+    rules_config: Dict[str, str],
+    workers: int = RESCORE_WORKERS
+) -> List[Tuple[int, ScoreReport, str, str]]:
+    if workers <= 1 or len(batch) < RESCORE_INLINE_THRESHOLD:
+        return score_chunk(job_description, batch, rules_config)
+
+    chunk_size = -(-len(batch) // workers)
+    chunks = [batch[start:start + chunk_size] for start in range(0, len(batch), chunk_size)]
+    pool = get_rescore_pool()
+    futures = [pool.submit(score_chunk, job_description, chunk, rules_config) for chunk in chunks]
+
+    results = []
+    for future in futures:
+        results.extend(future.result())
+    return results
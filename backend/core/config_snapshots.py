@@ -0,0 +1,61 @@
+import json
+from typing import Any, Dict, Iterable, Optional
+
+from cachetools import LRUCache
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models import ScoringConfigSnapshots
+from core.fingerprint import stable_hash
+
+SNAPSHOT_CACHE_SIZE = 1024
+
+_snapshot_ids = LRUCache(maxsize=SNAPSHOT_CACHE_SIZE)
+_snapshot_contents = LRUCache(maxsize=SNAPSHOT_CACHE_SIZE)
+
+
+def snapshot_content(rules_config: Dict[str, str], scoring_config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    return {"rules_config": rules_config, "scoring_config": scoring_config or {}}
+
+
+def get_or_create_snapshot_id(db: Session, rules_config: Dict[str, str], scoring_config: Optional[Dict[str, Any]] = None) -> int:
+    content = snapshot_content(rules_config, scoring_config)
+    config_hash = stable_hash(content)
+
+    snapshot_id = _snapshot_ids.get(config_hash)
+    if snapshot_id is not None:
+        return snapshot_id
+
+    snapshot_id = db.scalar(select(ScoringConfigSnapshots.snapshot_id).where(ScoringConfigSnapshots.config_hash == config_hash))
+    if snapshot_id is not None:
+        _snapshot_ids[config_hash] = snapshot_id
+        return snapshot_id
+
+    # not cached until a later lookup finds it, so a rolled-back insert never leaves a dangling id behind
+    try:
+        with db.begin_nested():
+            snapshot = ScoringConfigSnapshots(config_hash=config_hash, content=json.dumps(content, sort_keys=True, default=str))
+            db.add(snapshot)
+        return snapshot.snapshot_id
+    except IntegrityError:
+        return db.scalar(select(ScoringConfigSnapshots.snapshot_id).where(ScoringConfigSnapshots.config_hash == config_hash))
+
+
+def get_snapshots(db: Session, snapshot_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    snapshot_ids = {snapshot_id for snapshot_id in snapshot_ids if snapshot_id is not None}
+    snapshots = {
+        snapshot_id: _snapshot_contents[snapshot_id]
+        for snapshot_id in snapshot_ids if snapshot_id in _snapshot_contents
+    }
+
+    missing = snapshot_ids - snapshots.keys()
+    if missing:
+        for snapshot_id, content in db.execute(
+            select(ScoringConfigSnapshots.snapshot_id, ScoringConfigSnapshots.content).where(
+                ScoringConfigSnapshots.snapshot_id.in_(missing)
+            )
+        ):
+            snapshots[snapshot_id] = _snapshot_contents[snapshot_id] = json.loads(content)
+
+    return snapshots
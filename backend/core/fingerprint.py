@@ -0,0 +1,8 @@
+import json
+
+import xxhash
+
+
+def stable_hash(value) -> str:
+    payload = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return xxhash.xxh3_128_hexdigest(payload.encode("utf-8"))
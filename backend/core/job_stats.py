@@ -0,0 +1,226 @@
+import math
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, bindparam, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models import Applications, ApplicationStatus, Jobs, JobScoringStats, ScoringResults
+
+HISTOGRAM_BUCKETS = 10
+HISTOGRAM_WIDTH = 100.0 / HISTOGRAM_BUCKETS
+HISTOGRAM_COLUMNS = [f"histogram_{bucket}" for bucket in range(HISTOGRAM_BUCKETS)]
+STATUS_COLUMNS = {status: f"status_{status.value}" for status in ApplicationStatus}
+DECISION_COLUMNS = {"PASS": "passed_count", "REJECT": "rejected_count"}
+STATS_COUNTERS = [
+    column.name for column in JobScoringStats.__table__.columns
+    if column.name not in ("job_id", "created_at", "updated_at", "scoring_version")
+]
+STATS_DELTA_COLUMNS = STATS_COUNTERS + ["scoring_version"]
+
+_stats = JobScoringStats.__table__
+STATS_UPDATE = update(_stats).where(_stats.c.job_id == bindparam("stats_job_id")).values({
+    column: _stats.c[column] + bindparam(f"delta_{column}") for column in STATS_DELTA_COLUMNS
+})
+
+
+def score_bucket(score: float) -> int:
+    return max(0, min(HISTOGRAM_BUCKETS - 1, int(score // HISTOGRAM_WIDTH)))
+
+
+def scoring_delta(
+    deltas: Dict[str, float],
+    previous: Optional[Tuple[float, str]],
+    current: Tuple[float, str]
+):
+    for sign, result in ((-1, previous), (1, current)):
+        if result is None:
+            continue
+        score, decision = result
+        deltas["scored_count"] += sign
+        deltas["score_sum"] += sign * score
+        deltas["score_sum_squares"] += sign * score * score
+        deltas[HISTOGRAM_COLUMNS[score_bucket(score)]] += sign
+        if decision in DECISION_COLUMNS:
+            deltas[DECISION_COLUMNS[decision]] += sign
+
+
+def create_job_stats(db: Session, job_id: int) -> JobScoringStats:
+    stats = JobScoringStats(job_id=job_id, **{column: 0 for column in STATS_COUNTERS})
+    db.add(stats)
+    return stats
+
+
+def apply_job_stats_deltas(db: Session, deltas: Dict[int, Dict[str, float]]):
+    changed = {job_id: changes for job_id, changes in deltas.items() if any(changes.values())}
+    if not changed:
+        return
+
+    # a job without a stats row gets one counted from the flushed rows, which already include these changes
+    for job_id in insert_missing_job_stats(db, list(changed)):
+        del changed[job_id]
+
+    parameters = [
+        {"stats_job_id": job_id, **{f"delta_{column}": changes.get(column, 0) for column in STATS_DELTA_COLUMNS}}
+        for job_id, changes in changed.items()
+    ]
+    if parameters:
+        db.execute(STATS_UPDATE, parameters)
+
+
+def insert_missing_job_stats(db: Session, job_ids: List[int]) -> List[int]:
+    existing = set(db.scalars(select(JobScoringStats.job_id).where(JobScoringStats.job_id.in_(job_ids))))
+    missing = [job_id for job_id in job_ids if job_id not in existing]
+    if not missing:
+        return []
+
+    db.flush()
+    inserted = []
+    for job_id, values in count_job_stats(db, missing).items():
+        try:
+            with db.begin_nested():
+                db.execute(insert(JobScoringStats).values(job_id=job_id, **values))
+            inserted.append(job_id)
+        except IntegrityError:
+            continue
+    return inserted
+
+
+def record_status_changes(
+    db: Session,
+    transitions: List[Tuple[int, Optional[ApplicationStatus], Optional[ApplicationStatus]]]
+):
+    deltas = defaultdict(lambda: defaultdict(float))
+    for job_id, old_status, new_status in transitions:
+        if old_status == new_status:
+            continue
+        if old_status is not None:
+            deltas[job_id][STATUS_COLUMNS[old_status]] -= 1
+        if new_status is not None:
+            deltas[job_id][STATUS_COLUMNS[new_status]] += 1
+    apply_job_stats_deltas(db, deltas)
+
+
+def set_application_status(
+    db: Session,
+    application: Applications,
+    status: ApplicationStatus,
+    pending: Optional[List[Tuple]] = None
+):
+    transition = (application.job_id, application.application_status, status)
+    application.application_status = status
+    if pending is not None:
+        pending.append(transition)
+    else:
+        record_status_changes(db, [transition])
+
+
+def count_job_stats(db: Session, job_ids: List[int]) -> Dict[int, Dict[str, float]]:
+    if not job_ids:
+        return {}
+
+    score = ScoringResults.final_score
+    aggregates = [
+        func.count(ScoringResults.scoring_id).label("scored_count"),
+        func.count().filter(ScoringResults.decision == "PASS").label("passed_count"),
+        func.count().filter(ScoringResults.decision == "REJECT").label("rejected_count"),
+        func.coalesce(func.sum(score), 0.0).label("score_sum"),
+        func.coalesce(func.sum(score * score), 0.0).label("score_sum_squares"),
+    ]
+    aggregates += [
+        func.count().filter(Applications.application_status == status).label(column)
+        for status, column in STATUS_COLUMNS.items()
+    ]
+    for bucket, column in enumerate(HISTOGRAM_COLUMNS):
+        conditions = []
+        if bucket > 0:
+            conditions.append(score >= bucket * HISTOGRAM_WIDTH)
+        if bucket < HISTOGRAM_BUCKETS - 1:
+            conditions.append(score < (bucket + 1) * HISTOGRAM_WIDTH)
+        aggregates.append(func.count(score).filter(and_(*conditions)).label(column))
+
+    rows = db.execute(
+        select(Applications.job_id, *aggregates).outerjoin(
+            ScoringResults, ScoringResults.scoring_id == Applications.latest_scoring_id
+        ).where(Applications.job_id.in_(job_ids)).group_by(Applications.job_id)
+    ).mappings().all()
+    counted = {row["job_id"]: row for row in rows}
+
+    return {
+        job_id: {column: counted[job_id][column] if job_id in counted else 0 for column in STATS_COUNTERS}
+        for job_id in job_ids
+    }
+
+
+def rebuild_job_stats(db: Session, job_ids: List[int], missing_only: bool = False) -> Dict[int, JobScoringStats]:
+    rebuilt = {}
+    for job_id, values in count_job_stats(db, job_ids).items():
+        stats = db.get(JobScoringStats, job_id)
+        if stats is not None:
+            if not missing_only:
+                for column, value in values.items():
+                    setattr(stats, column, value)
+                rebuilt[job_id] = stats
+            continue
+
+        try:
+            with db.begin_nested():
+                stats = JobScoringStats(job_id=job_id, **values)
+                db.add(stats)
+            rebuilt[job_id] = stats
+        except IntegrityError:
+            continue
+
+    db.commit()
+    return rebuilt
+
+
+def get_job_stats(db: Session, job_id: Optional[int] = None) -> List[JobScoringStats]:
+    if job_id:
+        stats = db.get(JobScoringStats, job_id)
+        if stats is not None:
+            return [stats]
+        if db.get(Jobs, job_id) is None:
+            return []
+        return _counted_job_stats(db, [job_id])
+
+    stats = list(db.scalars(select(JobScoringStats)))
+    missing = list(db.scalars(
+        select(Jobs.job_id).where(~select(JobScoringStats.job_id).where(JobScoringStats.job_id == Jobs.job_id).exists())
+    ))
+    return stats + _counted_job_stats(db, missing)
+
+
+def _counted_job_stats(db: Session, job_ids: List[int]) -> List[JobScoringStats]:
+    # transient rows so a job that predates its stats row still reports without writing on a read
+    return [JobScoringStats(job_id=job_id, **values) for job_id, values in count_job_stats(db, job_ids).items()]
+
+
+def summarize_job_stats(stats: List[JobScoringStats]) -> Dict:
+    scored = sum(entry.scored_count for entry in stats)
+    score_sum = sum(entry.score_sum for entry in stats)
+    score_sum_squares = sum(entry.score_sum_squares for entry in stats)
+    average = score_sum / scored if scored else 0
+    variance = max(0.0, score_sum_squares / scored - average * average) if scored else 0
+
+    return {
+        "total_applications": sum(getattr(entry, column) for entry in stats for column in STATUS_COLUMNS.values()),
+        "scored_applications": scored,
+        "passed": sum(entry.passed_count for entry in stats),
+        "rejected": sum(entry.rejected_count for entry in stats),
+        "average_score": average,
+        "score_std_dev": math.sqrt(variance),
+        "statuses": {
+            status.value: sum(getattr(entry, column) for entry in stats)
+            for status, column in STATUS_COLUMNS.items()
+        },
+        "histogram": [
+            {
+                "min_score": bucket * HISTOGRAM_WIDTH,
+                "max_score": (bucket + 1) * HISTOGRAM_WIDTH,
+                "count": sum(getattr(entry, column) for entry in stats)
+            }
+            for bucket, column in enumerate(HISTOGRAM_COLUMNS)
+        ]
+    }
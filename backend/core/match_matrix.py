@@ -0,0 +1,189 @@
+from typing import Any, Dict, List
+
+import numpy as np
+
+from core.scoring import ScoringEngine, CriterionCategory
+
+INITIAL_ROW_CAPACITY = 64
+
+
+class MatchMatrix:
+
+    def __init__(self, engine: ScoringEngine, rules_config: Dict[str, CriterionCategory]):
+        self.engine = engine
+        self.rules_config = rules_config
+
+        self.job_ids: List[int] = []
+        self.job_descriptions: List[Dict] = []
+        self.job_versions: List[Any] = []
+        self._columns: Dict[int, int] = {}
+
+        self.candidate_ids: List[int] = []
+        self.candidates: List[Dict] = []
+        self._rows: Dict[int, int] = {}
+
+        self._scores = np.zeros((INITIAL_ROW_CAPACITY, 0))
+        self._applied = np.zeros((INITIAL_ROW_CAPACITY, 0), dtype=bool)
+        self.application_ids: Dict[tuple, int] = {}
+        self._applications: Dict[int, tuple] = {}
+        self.last_application_id = 0
+        self.synced_at: Any = None
+
+    @property
+    def scores(self) -> np.ndarray:
+        return self._scores[:len(self.candidate_ids)]
+
+    @property
+    def applied(self) -> np.ndarray:
+        return self._applied[:len(self.candidate_ids)]
+
+    @property
+    def application_count(self) -> int:
+        return len(self._applications)
+
+    def has_job(self, job_id: int) -> bool:
+        return job_id in self._columns
+
+    def set_job(self, job_id: int, job_description: Dict, version: Any = None):
+        column = self._columns.get(job_id)
+        if column is not None and self.job_versions[column] == version:
+            return
+
+        if self.candidates:
+            batch = self.engine.score_batch(job_description, self.candidates, self.rules_config)
+            job_scores = batch.final_scores
+        else:
+            job_scores = np.zeros(0)
+
+        if column is None:
+            column = len(self.job_ids)
+            self._columns[job_id] = column
+            self.job_ids.append(job_id)
+            self.job_descriptions.append(job_description)
+            self.job_versions.append(version)
+            self._scores = np.hstack([self._scores, np.zeros((len(self._scores), 1))])
+            self._applied = np.hstack([self._applied, np.zeros((len(self._applied), 1), dtype=bool)])
+        else:
+            self.job_descriptions[column] = job_description
+            self.job_versions[column] = version
+
+        self._scores[:len(job_scores), column] = job_scores
+
+    def remove_job(self, job_id: int):
+        column = self._columns.pop(job_id, None)
+        if column is None:
+            return
+
+        del self.job_ids[column]
+        del self.job_descriptions[column]
+        del self.job_versions[column]
+        self._scores = np.delete(self._scores, column, axis=1)
+        self._applied = np.delete(self._applied, column, axis=1)
+        self._columns = {existing_id: position for position, existing_id in enumerate(self.job_ids)}
+        self.application_ids = {
+            key: application_id for key, application_id in self.application_ids.items()
+            if key[0] != job_id
+        }
+        self._applications = {
+            application_id: key for application_id, key in self._applications.items()
+            if key[0] != job_id
+        }
+
+    def add_application(self, application_id: int, job_id: int, candidate_id: int, candidate: Dict):
+        row = self._rows.get(candidate_id)
+        if row is None:
+            row = self._add_candidate(candidate_id, candidate)
+
+        column = self._columns.get(job_id)
+        if column is not None:
+            self._applied[row, column] = True
+            self.application_ids[(job_id, candidate_id)] = application_id
+            self._applications[application_id] = (job_id, candidate_id)
+
+        self.last_application_id = max(self.last_application_id, application_id)
+
+    def update_candidate(self, candidate_id: int, candidate: Dict):
+        row = self._rows.get(candidate_id)
+        if row is None or self.candidates[row] == candidate:
+            return
+
+        self.candidates[row] = candidate
+        self._score_row(row)
+
+    def remove_application(self, application_id: int):
+        key = self._applications.pop(application_id, None)
+        if key is None or self.application_ids.get(key) != application_id:
+            return
+
+        remaining = [other_id for other_id, other_key in self._applications.items() if other_key == key]
+        if remaining:
+            self.application_ids[key] = max(remaining)
+            return
+
+        del self.application_ids[key]
+        self._applied[self._rows[key[1]], self._columns[key[0]]] = False
+
+    def retain_applications(self, application_ids):
+        for application_id in [existing_id for existing_id in self._applications if existing_id not in application_ids]:
+            self.remove_application(application_id)
+
+    def top_k(self, job_id: int, k: int, applicants_only: bool = False) -> List[Dict]:
+        column = self._columns[job_id]
+        job_scores = self.scores[:, column]
+        rows = np.arange(len(job_scores))
+
+        if applicants_only:
+            rows = rows[self.applied[:, column]]
+            job_scores = job_scores[rows]
+
+        if k <= 0 or len(rows) == 0:
+            return []
+
+        if k < len(rows):
+            best = np.argpartition(-job_scores, k - 1)[:k]
+        else:
+            best = np.arange(len(rows))
+        best = best[np.argsort(-job_scores[best], kind="stable")]
+
+        return [
+            {
+                "candidate_id": self.candidate_ids[rows[position]],
+                "application_id": self.application_ids.get((job_id, self.candidate_ids[rows[position]])),
+                "score": float(job_scores[position]),
+                "applied": bool(self._applied[rows[position], column])
+            }
+            for position in best.tolist()
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_ids": list(self.job_ids),
+            "candidate_ids": list(self.candidate_ids),
+            "scores": self.scores.tolist(),
+            "applied": self.applied.tolist()
+        }
+
+    def _add_candidate(self, candidate_id: int, candidate: Dict) -> int:
+        row = len(self.candidate_ids)
+        if row == len(self._scores):
+            self._grow_rows()
+
+        self._rows[candidate_id] = row
+        self.candidate_ids.append(candidate_id)
+        self.candidates.append(candidate)
+        self._score_row(row)
+        return row
+
+    def _score_row(self, row: int):
+        for column, job_description in enumerate(self.job_descriptions):
+            report = self.engine.score_candidate(job_description, self.candidates[row], self.rules_config, [])
+            self._scores[row, column] = report.final_score
+
+    def _grow_rows(self):
+        capacity = max(INITIAL_ROW_CAPACITY, len(self._scores) * 2)
+        scores = np.zeros((capacity, self._scores.shape[1]))
+        applied = np.zeros((capacity, self._applied.shape[1]), dtype=bool)
+        scores[:len(self._scores)] = self._scores
+        applied[:len(self._applied)] = self._applied
+        self._scores = scores
+        self._applied = applied
@@ -0,0 +1,30 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional
+
+
+def encode_cursor(sort: str, values: List[Any]) -> str:
+    payload = [sort] + [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], sort: str, types: List[type]) -> Optional[List[Any]]:
+    if not cursor:
+        return None
+
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        raise ValueError("Malformed cursor")
+
+    if not isinstance(payload, list) or len(payload) != len(types) + 1 or payload[0] != sort:
+        raise ValueError(f"Cursor does not belong to sort '{sort}'")
+
+    values = []
+    for value, expected in zip(payload[1:], types):
+        try:
+            values.append(datetime.fromisoformat(value) if expected is datetime else expected(value))
+        except (ValueError, TypeError):
+            raise ValueError("Malformed cursor")
+    return values
@@ -0,0 +1,74 @@
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional
+
+from cachetools import LRUCache
+
+SCORE_INDEX_CACHE_SIZE = 256
+CURVE_STEP = 1.0
+MIN_CURVE_STEP = 0.1
+
+
+class ScoreIndex:
+
+    def __init__(self, entries: Iterable[tuple] = (), version: Optional[int] = None):
+        self.version = version
+        self._scores: Dict[int, Optional[float]] = {}
+        sorted_scores = []
+        for application_id, score, hard_no in entries:
+            self._scores[application_id] = None if hard_no else score
+            if not hard_no:
+                sorted_scores.append(score)
+        sorted_scores.sort()
+        self._sorted: List[float] = sorted_scores
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def update(self, application_id: int, score: float, hard_no: bool = False):
+        previous = self._scores.get(application_id)
+        if previous is not None:
+            del self._sorted[bisect_left(self._sorted, previous)]
+
+        self._scores[application_id] = None if hard_no else score
+        if not hard_no:
+            insort(self._sorted, score)
+
+    def remove(self, application_id: int):
+        if application_id not in self._scores:
+            return
+        previous = self._scores.pop(application_id)
+        if previous is not None:
+            del self._sorted[bisect_left(self._sorted, previous)]
+
+    def count_at(self, threshold: float) -> int:
+        return len(self._sorted) - bisect_left(self._sorted, threshold)
+
+    def pass_rate_at(self, threshold: float) -> float:
+        if not self._scores:
+            return 0.0
+        return self.count_at(threshold) / len(self._scores) * 100
+
+    def curve(self, step: float = CURVE_STEP, low: float = 0.0, high: float = 100.0) -> List[Dict[str, float]]:
+        points = int(round((high - low) / step)) + 1
+        return [
+            {
+                "threshold": threshold,
+                "passed": self.count_at(threshold),
+                "pass_rate": self.pass_rate_at(threshold)
+            }
+            for threshold in (round(low + position * step, 6) for position in range(points))
+        ]
+
+
+SCORE_INDEXES = LRUCache(maxsize=SCORE_INDEX_CACHE_SIZE)
+SCORE_INDEXES_LOCK = threading.Lock()
+
+
+def record_score(job_id: int, application_id: int, score: float, hard_no: bool):
+    with SCORE_INDEXES_LOCK:
+        index = SCORE_INDEXES.get(job_id)
+        if index is not None:
+            index.update(application_id, score, hard_no)
+            if index.version is not None:
+                index.version += 1
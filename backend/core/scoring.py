@@ -1,7 +1,15 @@
 
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from core.fingerprint import stable_hash
+from core.skills import SKILL_VOCABULARY, covers_all, coverage
+
+NUMERIC_CRITERIA = ("years_experience",)
+SALARY_CRITERIA = ("salary_range", "salary_expectation")
+PLAN_CACHE_SIZE = 256
+
 
 class CriterionCategory(Enum):
     YES = "YES"
@@ -9,33 +17,244 @@ class CriterionCategory(Enum):
     HARD_NO = "HARD_NO"
 
 
-@dataclass
+class DetailLevel(Enum):
+    FULL = "full"
+    SCORES = "scores"
+
+
+OUTCOME_MISSING = -1
+MISSING_DATA_NOTE = "Missing data"
+
+NOTE_TEMPLATES = {
+    ("numeric", CriterionCategory.YES): (
+        "Meets requirement ({0} >= {1})",
+        "Below requirement ({0} < {1})",
+    ),
+    ("numeric", CriterionCategory.PREFERABLE): (
+        "Exceeds preferred level ({0} >= {1})",
+        "Within tolerance ({0} vs {1})",
+        "Below preferred level ({0} < {1})",
+    ),
+    ("numeric", CriterionCategory.HARD_NO): (
+        "Meets minimum",
+        "Below minimum requirement ({0} < {1})",
+    ),
+    ("salary", CriterionCategory.YES): (
+        "Within budget ({0} <= {1})",
+        "Above budget ({0} > {1})",
+    ),
+    ("salary", CriterionCategory.PREFERABLE): (
+        "Within preferred range ({0} <= {1})",
+        "Within soft overage ({0} vs {1})",
+        "Above preferred range ({0} > {1})",
+    ),
+    ("salary", CriterionCategory.HARD_NO): (
+        "Within budget",
+        "Above maximum budget ({0} > {1})",
+    ),
+    ("boolean", CriterionCategory.YES): (
+        "Required match",
+        "Missing required qualification",
+    ),
+    ("boolean", CriterionCategory.PREFERABLE): (
+        "Preferred qualification present",
+        "Partial match on preferred qualification",
+        "Preferred qualification not present",
+    ),
+    ("boolean", CriterionCategory.HARD_NO): (
+        "Disqualifying factor absent",
+        "Disqualifying factor present",
+    ),
+}
+
+
 class CriterionResult:
-    name: str
-    category: CriterionCategory
-    weight: float
-    passed: bool
-    points_awarded: float
-    notes: Optional[str] = None
+    __slots__ = (
+        "name", "category", "weight", "passed", "points_awarded", "coverage",
+        "kind", "outcome", "candidate_value", "job_value", "_notes"
+    )
+    
+    def __init__(
+        self,
+        name: str,
+        category: CriterionCategory,
+        weight: float,
+        passed: bool,
+        points_awarded: float,
+        notes: Optional[str] = None,
+        coverage: Optional[float] = None,
+        kind: Optional[str] = None,
+        outcome: Optional[int] = None,
+        candidate_value: Optional[float] = None,
+        job_value: Optional[float] = None
+    ):
+        self.name = name
+        self.category = category
+        self.weight = weight
+        self.passed = passed
+        self.points_awarded = points_awarded
+        self.coverage = coverage
+        self.kind = kind
+        self.outcome = outcome
+        self.candidate_value = candidate_value
+        self.job_value = job_value
+        self._notes = notes
+    
+    @property
+    def notes(self) -> Optional[str]:
+        if self._notes is not None or self.outcome is None:
+            return self._notes
+        if self.outcome == OUTCOME_MISSING:
+            return MISSING_DATA_NOTE
+        return NOTE_TEMPLATES[(self.kind, self.category)][self.outcome].format(
+            self.candidate_value, self.job_value
+        )
+    
+    def _key(self) -> Tuple:
+        return (self.name, self.category, self.weight, self.passed, self.points_awarded, self.notes, self.coverage)
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CriterionResult):
+            return NotImplemented
+        return self._key() == other._key()
+    
+    def __repr__(self) -> str:
+        return (
+            f"CriterionResult(name={self.name!r}, category={self.category}, weight={self.weight!r}, "
+            f"passed={self.passed!r}, points_awarded={self.points_awarded!r}, notes={self.notes!r}, "
+            f"coverage={self.coverage!r})"
+        )
 
 
-@dataclass
 class AnswerJudgment:
-    question_id: str
-    category: CriterionCategory
-    rationale: str
+    __slots__ = ("question_id", "category", "rationale")
+    
+    def __init__(self, question_id: str, category: CriterionCategory, rationale: str):
+        self.question_id = question_id
+        self.category = category
+        self.rationale = rationale
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, AnswerJudgment):
+            return NotImplemented
+        return (self.question_id, self.category, self.rationale) == (other.question_id, other.category, other.rationale)
+    
+    def __repr__(self) -> str:
+        return (
+            f"AnswerJudgment(question_id={self.question_id!r}, category={self.category}, "
+            f"rationale={self.rationale!r})"
+        )
 
 
-@dataclass
 class ScoreReport:
-    primary_score: float
-    secondary_score: float
-    final_score: float
-    decision: str
-    fail_reason: Optional[str] = None
-    primary_breakdown: List[CriterionResult] = None
-    secondary_judgments: List[AnswerJudgment] = None
-    summary: str = ""
+    __slots__ = (
+        "primary_score", "secondary_score", "final_score", "decision",
+        "primary_breakdown", "secondary_judgments", "hard_no_triggered",
+        "pass_threshold", "detail_level", "_fail_reason", "_summary"
+    )
+    
+    def __init__(
+        self,
+        primary_score: float,
+        secondary_score: float,
+        final_score: float,
+        decision: str,
+        fail_reason: Optional[str] = None,
+        primary_breakdown: List[CriterionResult] = None,
+        secondary_judgments: List[AnswerJudgment] = None,
+        summary: Optional[str] = None,
+        hard_no_triggered: Optional[str] = None,
+        pass_threshold: Optional[float] = None,
+        detail_level: DetailLevel = DetailLevel.FULL
+    ):
+        self.primary_score = primary_score
+        self.secondary_score = secondary_score
+        self.final_score = final_score
+        self.decision = decision
+        self.primary_breakdown = primary_breakdown
+        self.secondary_judgments = secondary_judgments
+        self.hard_no_triggered = hard_no_triggered
+        self.pass_threshold = pass_threshold
+        self.detail_level = detail_level
+        self._fail_reason = fail_reason
+        self._summary = summary
+    
+    @property
+    def fail_reason(self) -> Optional[str]:
+        if self._fail_reason is not None or self.detail_level != DetailLevel.FULL:
+            return self._fail_reason
+        if self.hard_no_triggered:
+            return f"Primary hard-no: {self.hard_no_triggered}"
+        if self.decision == "REJECT" and self.pass_threshold is not None:
+            return f"Final score {self.final_score:.1f} below threshold {self.pass_threshold}"
+        return None
+    
+    @property
+    def summary(self) -> str:
+        if self._summary is not None:
+            return self._summary
+        if self.detail_level != DetailLevel.FULL:
+            return ""
+        if self.hard_no_triggered:
+            return f"Application rejected due to critical mismatch: {self.hard_no_triggered}. " \
+                   f"Candidate does not meet essential requirements for this position."
+        return render_summary(
+            self.primary_score, self.secondary_score, self.final_score,
+            self.decision, self.primary_breakdown or []
+        )
+    
+    def _key(self) -> Tuple:
+        return (
+            self.primary_score, self.secondary_score, self.final_score, self.decision,
+            self.fail_reason, self.primary_breakdown, self.secondary_judgments, self.summary
+        )
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ScoreReport):
+            return NotImplemented
+        return self._key() == other._key()
+    
+    def __repr__(self) -> str:
+        return (
+            f"ScoreReport(primary_score={self.primary_score!r}, secondary_score={self.secondary_score!r}, "
+            f"final_score={self.final_score!r}, decision={self.decision!r}, fail_reason={self.fail_reason!r}, "
+            f"primary_breakdown={self.primary_breakdown!r}, secondary_judgments={self.secondary_judgments!r}, "
+            f"summary={self.summary!r})"
+        )
+
+
+def render_summary(
+    primary_score: float,
+    secondary_score: float,
+    final_score: float,
+    decision: str,
+    primary_breakdown: List[CriterionResult]
+) -> str:
+    
+    if decision == "REJECT":
+        return f"Candidate scored {final_score:.1f}/100 and did not meet the minimum threshold. " \
+               f"Primary evaluation: {primary_score:.1f}/100, Secondary evaluation: {secondary_score:.1f}/100. " \
+               f"Recommendation: Do not proceed with this candidate."
+    
+    strength_count = 0
+    concern_count = 0
+    for r in primary_breakdown:
+        if r.points_awarded > 0:
+            strength_count += 1
+        elif r.points_awarded == 0 and r.category != CriterionCategory.PREFERABLE:
+            concern_count += 1
+    
+    summary = f"Candidate scored {final_score:.1f}/100 and meets the minimum requirements. "
+    summary += f"Primary evaluation: {primary_score:.1f}/100, Secondary evaluation: {secondary_score:.1f}/100. "
+    
+    if strength_count > concern_count:
+        summary += f"Strong match with {strength_count} key qualifications met. "
+    elif concern_count > 0:
+        summary += f"Some concerns noted in {concern_count} areas. "
+    
+    summary += "Recommendation: Proceed to next stage of evaluation."
+    
+    return summary
 
 
 @dataclass
@@ -59,12 +278,84 @@ class ScoringConfig:
                 "salary_range": 10.0,
                 "required_skills": 10.0
             }
+    
+    def fingerprint(self) -> Tuple:
+        return (
+            tuple(sorted(self.weights.items())),
+            self.experience_tolerance,
+            self.salary_soft_overage,
+            self.pass_threshold,
+            self.primary_weight,
+            self.secondary_weight
+        )
+
+
+@dataclass(frozen=True)
+class CriterionDefinition:
+    name: str
+    kind: str
+    evaluator: Callable[..., CriterionResult]
+    default_weight: Optional[float] = None
+    job_default: Any = None
+    candidate_default: Any = None
+
+
+@dataclass(frozen=True)
+class PlanStep:
+    name: str
+    kind: str
+    category: CriterionCategory
+    weight: float
+    evaluator: Callable[..., CriterionResult]
+    job_default: Any = None
+    candidate_default: Any = None
+    
+    def job_value(self, job_description: Dict):
+        value = job_description.get(self.name)
+        return self.job_default if value is None else value
+    
+    def candidate_value(self, candidate: Dict):
+        value = candidate.get(self.name)
+        return self.candidate_default if value is None else value
+    
+    def evaluate(self, engine: "ScoringEngine", job_description: Dict, candidate: Dict) -> CriterionResult:
+        candidate_value = self.candidate_value(candidate)
+        job_value = self.job_value(job_description)
+        
+        if candidate_value is None or job_value is None:
+            return engine._missing_result(self.name, self.category, self.weight)
+        
+        return self.evaluator(
+            engine, self.name, self.category, self.weight, candidate_value, job_value
+        )
+
+
+@dataclass(frozen=True)
+class ScoringPlan:
+    steps: Tuple[PlanStep, ...]
+    total_weight: float
+    config_fingerprint: Tuple
+    
+    def input_fingerprint(self, job_description: Dict, candidate: Dict) -> str:
+        experience_tolerance, salary_soft_overage = self.config_fingerprint[1:3]
+        return stable_hash([
+            experience_tolerance,
+            salary_soft_overage,
+            [
+                (
+                    step.name, step.category.value, step.weight,
+                    step.job_value(job_description), step.candidate_value(candidate)
+                )
+                for step in self.steps
+            ]
+        ])
 
 
 class ScoringEngine:
     
-    def __init__(self, config: Optional[ScoringConfig] = None):
+    def __init__(self, config: Optional[ScoringConfig] = None, detail_level: DetailLevel = DetailLevel.FULL):
         self.config = config or ScoringConfig()
+        self.detail_level = detail_level
     
     def score_primary(
         self, 
@@ -72,31 +363,24 @@ class ScoringEngine:
         candidate: Dict, 
         rules_config: Dict[str, CriterionCategory]
     ) -> Tuple[float, List[CriterionResult], Optional[str]]:
+        plan = self.compile_plan(rules_config)
         breakdown = []
-        total_weight = 0.0
         total_points = 0.0
-        hard_no_triggered = None
         
-        for rule_name, category in rules_config.items():
-            if rule_name not in self.config.weights:
-                continue
-                
-            weight = self.config.weights[rule_name]
-            total_weight += weight
-            
-            result = self._evaluate_criterion(
-                rule_name, category, weight, job_description, candidate
-            )
+        for step in plan.steps:
+            result = step.evaluate(self, job_description, candidate)
             breakdown.append(result)
             
-            if category == CriterionCategory.HARD_NO and not result.passed:
-                hard_no_triggered = rule_name
-                return 0.0, breakdown, hard_no_triggered
+            if step.category == CriterionCategory.HARD_NO and not result.passed:
+                return 0.0, breakdown, step.name
             
             total_points += result.points_awarded
         
-        score = (total_points / total_weight * 100) if total_weight > 0 else 0.0
-        return score, breakdown, hard_no_triggered
+        score = (total_points / plan.total_weight * 100) if plan.total_weight > 0 else 0.0
+        return score, breakdown, None
+    
+    def compile_plan(self, rules_config: Dict[str, CriterionCategory]) -> ScoringPlan:
+        return compile_plan(rules_config, self.config)
     
     def score_secondary(self, answers: List[Dict]) -> Tuple[float, List[AnswerJudgment]]:
         if not answers:
@@ -141,83 +425,139 @@ class ScoringEngine:
             job_description, candidate, rules_config
         )
         
+        return self.score_from_primary(
+            primary_score, primary_breakdown, hard_no_triggered, chat_answers
+        )
+    
+    def score_from_primary(
+        self,
+        primary_score: float,
+        primary_breakdown: List[CriterionResult],
+        hard_no_triggered: Optional[str],
+        chat_answers: List[Dict]
+    ) -> ScoreReport:
         if hard_no_triggered:
-            return ScoreReport(
-                primary_score=0.0,
-                secondary_score=0.0,
-                final_score=0.0,
-                decision="REJECT",
-                fail_reason=f"Primary hard-no: {hard_no_triggered}",
-                primary_breakdown=primary_breakdown,
-                secondary_judgments=[],
-                summary=f"Application rejected due to critical mismatch: {hard_no_triggered}. "
-                       f"Candidate does not meet essential requirements for this position."
-            )
+            return self._hard_no_report(hard_no_triggered, primary_breakdown)
         
         secondary_score, secondary_judgments = self.score_secondary(chat_answers)
         
+        return self._final_report(
+            primary_score, secondary_score, primary_breakdown, secondary_judgments
+        )
+    
+    def primary_fingerprint(
+        self,
+        job_description: Dict,
+        candidate: Dict,
+        rules_config: Dict[str, CriterionCategory]
+    ) -> str:
+        return self.compile_plan(rules_config).input_fingerprint(job_description, candidate)
+    
+    def result_fingerprint(
+        self,
+        job_description: Dict,
+        candidate: Dict,
+        rules_config: Dict[str, CriterionCategory],
+        chat_answers: List[Dict],
+        primary_fingerprint: Optional[str] = None
+    ) -> str:
+        return stable_hash([
+            primary_fingerprint or self.primary_fingerprint(job_description, candidate, rules_config),
+            self.config.pass_threshold,
+            self.config.primary_weight,
+            self.config.secondary_weight,
+            self.detail_level.value,
+            chat_answers
+        ])
+    
+    def score_batch(
+        self,
+        job_description: Dict,
+        candidates: List[Dict],
+        rules_config: Dict[str, CriterionCategory],
+        chat_answers: Optional[List[List[Dict]]] = None
+    ):
+        from core.scoring_batch import score_batch
+        
+        return score_batch(self, job_description, candidates, rules_config, chat_answers)
+    
+    def _hard_no_report(
+        self,
+        hard_no_triggered: str,
+        primary_breakdown: List[CriterionResult]
+    ) -> ScoreReport:
+        return ScoreReport(
+            primary_score=0.0,
+            secondary_score=0.0,
+            final_score=0.0,
+            decision="REJECT",
+            primary_breakdown=primary_breakdown,
+            secondary_judgments=[],
+            hard_no_triggered=hard_no_triggered,
+            pass_threshold=self.config.pass_threshold,
+            detail_level=self.detail_level
+        )
+    
+    def _final_report(
+        self,
+        primary_score: float,
+        secondary_score: float,
+        primary_breakdown: List[CriterionResult],
+        secondary_judgments: List[AnswerJudgment]
+    ) -> ScoreReport:
         final_score = (
             self.config.primary_weight * primary_score + 
             self.config.secondary_weight * secondary_score
         )
         
         decision = "PASS" if final_score >= self.config.pass_threshold else "REJECT"
-        fail_reason = None if decision == "PASS" else f"Final score {final_score:.1f} below threshold {self.config.pass_threshold}"
-        
-        summary = self._generate_summary(
-            primary_score, secondary_score, final_score, decision, 
-            primary_breakdown
-        )
         
         return ScoreReport(
             primary_score=primary_score,
             secondary_score=secondary_score,
             final_score=final_score,
             decision=decision,
-            fail_reason=fail_reason,
             primary_breakdown=primary_breakdown,
             secondary_judgments=secondary_judgments,
-            summary=summary
+            pass_threshold=self.config.pass_threshold,
+            detail_level=self.detail_level
         )
     
-    def _evaluate_criterion(
-        self, 
-        rule_name: str, 
-        category: CriterionCategory, 
+    def _criterion(
+        self,
+        rule_name: str,
+        category: CriterionCategory,
         weight: float,
-        job_description: Dict, 
-        candidate: Dict
+        passed: bool,
+        points: float,
+        kind: str,
+        outcome: int,
+        candidate_value: Optional[float] = None,
+        job_value: Optional[float] = None,
+        coverage: Optional[float] = None
     ) -> CriterionResult:
+        if self.detail_level != DetailLevel.FULL:
+            return CriterionResult(rule_name, category, weight, passed, points, coverage=coverage)
         
-        candidate_value = candidate.get(rule_name)
-        job_value = job_description.get(rule_name)
-        
-        if candidate_value is None or job_value is None:
-            passed = category == CriterionCategory.PREFERABLE
-            points = 0.0 if not passed else weight * 0.5
-            notes = "Missing data"
-            
-            return CriterionResult(
-                name=rule_name,
-                category=category,
-                weight=weight,
-                passed=passed,
-                points_awarded=points,
-                notes=notes
-            )
+        return CriterionResult(
+            rule_name, category, weight, passed, points,
+            coverage=coverage,
+            kind=kind,
+            outcome=outcome,
+            candidate_value=candidate_value,
+            job_value=job_value
+        )
+    
+    def _missing_result(
+        self,
+        rule_name: str,
+        category: CriterionCategory,
+        weight: float
+    ) -> CriterionResult:
+        passed = category == CriterionCategory.PREFERABLE
+        points = 0.0 if not passed else weight * 0.5
         
-        if rule_name in ["years_experience"]:
-            return self._evaluate_numeric_criterion(
-                rule_name, category, weight, candidate_value, job_value
-            )
-        elif rule_name in ["salary_range", "salary_expectation"]:
-            return self._evaluate_salary_criterion(
-                rule_name, category, weight, candidate_value, job_value
-            )
-        else:
-            return self._evaluate_boolean_criterion(
-                rule_name, category, weight, candidate_value, job_value
-            )
+        return self._criterion(rule_name, category, weight, passed, points, None, OUTCOME_MISSING)
     
     def _evaluate_boolean_criterion(
         self, 
@@ -228,12 +568,13 @@ class ScoringEngine:
         job_value: Union[bool, str, list]
     ) -> CriterionResult:
         
+        skill_coverage = None
+        
         if isinstance(candidate_value, list) and isinstance(job_value, list):
-            candidate_skills = [s.lower() for s in candidate_value]
-            required_skills = [s.lower() for s in job_value]
+            candidate_mask, required_mask = SKILL_VOCABULARY.masks(candidate_value, job_value)
             
-            has_all_skills = all(skill in candidate_skills for skill in required_skills)
-            candidate_bool = has_all_skills
+            skill_coverage = coverage(candidate_mask, required_mask)
+            candidate_bool = covers_all(candidate_mask, required_mask)
             job_bool = True
             
         else:
@@ -254,32 +595,28 @@ class ScoringEngine:
         if category == CriterionCategory.YES:
             passed = candidate_bool and job_bool
             points = weight if passed else 0.0
-            notes = "Required match" if passed else "Missing required qualification"
+            outcome = 0 if passed else 1
             
         elif category == CriterionCategory.PREFERABLE:
             if candidate_bool and job_bool:
                 points = weight
-                notes = "Preferred qualification present"
+                outcome = 0
             elif candidate_bool:
                 points = weight * 0.5
-                notes = "Partial match on preferred qualification"
+                outcome = 1
             else:
                 points = 0.0
-                notes = "Preferred qualification not present"
+                outcome = 2
             passed = True  
             
         else:  
             passed = not (candidate_bool and job_bool)
             points = weight if passed else 0.0
-            notes = "Disqualifying factor absent" if passed else "Disqualifying factor present"
+            outcome = 0 if passed else 1
         
-        return CriterionResult(
-            name=rule_name,
-            category=category,
-            weight=weight,
-            passed=passed,
-            points_awarded=points,
-            notes=notes
+        return self._criterion(
+            rule_name, category, weight, passed, points, "boolean", outcome,
+            coverage=skill_coverage
         )
     
     def _evaluate_numeric_criterion(
@@ -294,40 +631,26 @@ class ScoringEngine:
         candidate_num = float(candidate_value)
         job_num = float(job_value)
         
-        if category == CriterionCategory.YES:
+        if category == CriterionCategory.PREFERABLE:
             if candidate_num >= job_num:
-                passed = True
                 points = weight
-                notes = f"Meets requirement ({candidate_num} >= {job_num})"
-            else:
-                passed = False
-                points = 0.0
-                notes = f"Below requirement ({candidate_num} < {job_num})"
-                
-        elif category == CriterionCategory.PREFERABLE:
-            if candidate_num >= job_num:
-                points = weight
-                notes = f"Exceeds preferred level ({candidate_num} >= {job_num})"
+                outcome = 0
             elif candidate_num >= job_num - self.config.experience_tolerance:
                 points = weight * 0.7
-                notes = f"Within tolerance ({candidate_num} vs {job_num})"
+                outcome = 1
             else:
                 points = 0.0
-                notes = f"Below preferred level ({candidate_num} < {job_num})"
+                outcome = 2
             passed = True  
             
         else:  
             passed = candidate_num >= job_num
             points = weight if passed else 0.0
-            notes = f"Meets minimum" if passed else f"Below minimum requirement ({candidate_num} < {job_num})"
+            outcome = 0 if passed else 1
         
-        return CriterionResult(
-            name=rule_name,
-            category=category,
-            weight=weight,
-            passed=passed,
-            points_awarded=points,
-            notes=notes
+        return self._criterion(
+            rule_name, category, weight, passed, points, "numeric", outcome,
+            candidate_num, job_num
         )
     
     def _evaluate_salary_criterion(
@@ -346,40 +669,26 @@ class ScoringEngine:
         else:
             job_max = float(job_value)
         
-        if category == CriterionCategory.YES:
+        if category == CriterionCategory.PREFERABLE:
             if candidate_salary <= job_max:
-                passed = True
                 points = weight
-                notes = f"Within budget ({candidate_salary} <= {job_max})"
-            else:
-                passed = False
-                points = 0.0
-                notes = f"Above budget ({candidate_salary} > {job_max})"
-                
-        elif category == CriterionCategory.PREFERABLE:
-            if candidate_salary <= job_max:
-                points = weight
-                notes = f"Within preferred range ({candidate_salary} <= {job_max})"
+                outcome = 0
             elif candidate_salary <= job_max * (1 + self.config.salary_soft_overage):
                 points = weight * 0.5
-                notes = f"Within soft overage ({candidate_salary} vs {job_max})"
+                outcome = 1
             else:
                 points = 0.0
-                notes = f"Above preferred range ({candidate_salary} > {job_max})"
+                outcome = 2
             passed = True  
             
         else: 
             passed = candidate_salary <= job_max
             points = weight if passed else 0.0
-            notes = f"Within budget" if passed else f"Above maximum budget ({candidate_salary} > {job_max})"
+            outcome = 0 if passed else 1
         
-        return CriterionResult(
-            name=rule_name,
-            category=category,
-            weight=weight,
-            passed=passed,
-            points_awarded=points,
-            notes=notes
+        return self._criterion(
+            rule_name, category, weight, passed, points, "salary", outcome,
+            candidate_salary, job_max
         )
     
     def _generate_summary(
@@ -390,26 +699,88 @@ class ScoringEngine:
         decision: str,
         primary_breakdown: List[CriterionResult],
     ) -> str:
+        return render_summary(primary_score, secondary_score, final_score, decision, primary_breakdown)
+
+
+CRITERION_EVALUATORS = {
+    "numeric": ScoringEngine._evaluate_numeric_criterion,
+    "salary": ScoringEngine._evaluate_salary_criterion,
+    "boolean": ScoringEngine._evaluate_boolean_criterion,
+}
+
+CRITERIA_REGISTRY: Dict[str, CriterionDefinition] = {}
+
+
+def register_criterion(
+    name: str,
+    kind: str = "boolean",
+    default_weight: Optional[float] = None,
+    evaluator: Optional[Callable[..., CriterionResult]] = None,
+    job_default: Any = None,
+    candidate_default: Any = None
+) -> CriterionDefinition:
+    if evaluator is None and kind not in CRITERION_EVALUATORS:
+        raise ValueError(f"Unknown criterion kind '{kind}' requires a custom evaluator")
+    
+    definition = CriterionDefinition(
+        name=name,
+        kind=kind,
+        evaluator=evaluator or CRITERION_EVALUATORS[kind],
+        default_weight=default_weight,
+        job_default=job_default,
+        candidate_default=candidate_default
+    )
+    CRITERIA_REGISTRY[name] = definition
+    _compile_plan.cache_clear()
+    return definition
+
+
+def get_criterion_definition(name: str) -> CriterionDefinition:
+    definition = CRITERIA_REGISTRY.get(name)
+    if definition is None:
+        definition = CriterionDefinition(name=name, kind="boolean", evaluator=CRITERION_EVALUATORS["boolean"])
+    return definition
+
+
+def compile_plan(rules_config: Dict[str, CriterionCategory], config: ScoringConfig) -> ScoringPlan:
+    return _compile_plan(tuple(rules_config.items()), config.fingerprint())
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _compile_plan(rules: Tuple[Tuple[str, CriterionCategory], ...], config_fingerprint: Tuple) -> ScoringPlan:
+    weights = dict(config_fingerprint[0])
+    steps = []
+    
+    for rule_name, category in rules:
+        definition = get_criterion_definition(rule_name)
+        weight = weights.get(rule_name, definition.default_weight)
+        if weight is None:
+            continue
         
-        if decision == "REJECT":
-            return f"Candidate scored {final_score:.1f}/100 and did not meet the minimum threshold. " \
-                   f"Primary evaluation: {primary_score:.1f}/100, Secondary evaluation: {secondary_score:.1f}/100. " \
-                   f"Recommendation: Do not proceed with this candidate."
-        
-        strengths = [r for r in primary_breakdown if r.points_awarded > 0]
-        concerns = [r for r in primary_breakdown if r.points_awarded == 0 and r.category != CriterionCategory.PREFERABLE]
-        
-        strength_count = len(strengths)
-        concern_count = len(concerns)
-        
-        summary = f"Candidate scored {final_score:.1f}/100 and meets the minimum requirements. "
-        summary += f"Primary evaluation: {primary_score:.1f}/100, Secondary evaluation: {secondary_score:.1f}/100. "
-        
-        if strength_count > concern_count:
-            summary += f"Strong match with {strength_count} key qualifications met. "
-        elif concern_count > 0:
-            summary += f"Some concerns noted in {concern_count} areas. "
-        
-        summary += "Recommendation: Proceed to next stage of evaluation."
-        
-        return summary
+        steps.append(PlanStep(
+            name=rule_name,
+            kind=definition.kind,
+            category=category,
+            weight=weight,
+            evaluator=definition.evaluator,
+            job_default=definition.job_default,
+            candidate_default=definition.candidate_default
+        ))
+    
+    # HARD_NO checks first so a disqualified candidate short-circuits before the rest are evaluated
+    steps.sort(key=lambda step: step.category != CriterionCategory.HARD_NO)
+    
+    return ScoringPlan(
+        steps=tuple(steps),
+        total_weight=sum(step.weight for step in steps),
+        config_fingerprint=config_fingerprint
+    )
+
+
+for _rule_name in NUMERIC_CRITERIA:
+    register_criterion(_rule_name, kind="numeric")
+
+for _rule_name in SALARY_CRITERIA:
+    register_criterion(_rule_name, kind="salary")
+
+register_criterion("criminal_background", default_weight=10.0, job_default=True, candidate_default=False)
@@ -0,0 +1,356 @@
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from core.scoring import (
+    ScoringEngine, CriterionCategory, CriterionResult, AnswerJudgment, ScoreReport,
+    PlanStep, CRITERION_EVALUATORS, OUTCOME_MISSING
+)
+from core.skills import SKILL_VOCABULARY, count_bits
+
+TRUTHY_CANDIDATE_VALUES = ['true', 'yes', '1', 'present']
+TRUTHY_JOB_VALUES = ['true', 'yes', '1', 'required']
+
+
+@dataclass
+class CriterionColumn:
+    name: str
+    kind: str
+    category: CriterionCategory
+    weight: float
+    job_value: float
+    candidate_values: np.ndarray
+    passed: np.ndarray
+    points: np.ndarray
+    outcomes: np.ndarray
+    notes: Optional[List[str]] = None
+    coverage: Optional[np.ndarray] = None
+
+
+@dataclass
+class BatchScoreResult:
+    engine: ScoringEngine
+    columns: List[CriterionColumn]
+    primary_scores: np.ndarray
+    secondary_scores: np.ndarray
+    final_scores: np.ndarray
+    hard_no_mask: np.ndarray
+    hard_no_index: np.ndarray
+    pass_mask: np.ndarray
+    secondary_results: List[Tuple[float, List[AnswerJudgment]]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.final_scores)
+
+    @property
+    def decisions(self) -> List[str]:
+        return ["PASS" if passed else "REJECT" for passed in self.pass_mask.tolist()]
+
+    def breakdown(self, index: int) -> List[CriterionResult]:
+        stop = int(self.hard_no_index[index])
+        columns = self.columns if stop < 0 else self.columns[:stop + 1]
+        return [_criterion_result(self.engine, column, index) for column in columns]
+
+    def report(self, index: int) -> ScoreReport:
+        primary_breakdown = self.breakdown(index)
+
+        if self.hard_no_mask[index]:
+            hard_no_triggered = self.columns[int(self.hard_no_index[index])].name
+            return self.engine._hard_no_report(hard_no_triggered, primary_breakdown)
+
+        if self.secondary_results:
+            secondary_score, secondary_judgments = self.secondary_results[index]
+        else:
+            secondary_score, secondary_judgments = 0.0, []
+
+        return self.engine._final_report(
+            float(self.primary_scores[index]), secondary_score,
+            primary_breakdown, secondary_judgments
+        )
+
+    def reports(self) -> List[ScoreReport]:
+        return [self.report(i) for i in range(len(self))]
+
+
+def score_batch(
+    engine: ScoringEngine,
+    job_description: Dict,
+    candidates: List[Dict],
+    rules_config: Dict[str, CriterionCategory],
+    chat_answers: Optional[List[List[Dict]]] = None
+) -> BatchScoreResult:
+    config = engine.config
+    size = len(candidates)
+
+    plan = engine.compile_plan(rules_config)
+    columns = [_evaluate_column(engine, step, job_description, candidates) for step in plan.steps]
+
+    total_points = np.zeros(size)
+    hard_no_index = np.full(size, -1, dtype=np.int64)
+    for position, column in enumerate(columns):
+        total_points += column.points
+        if column.category == CriterionCategory.HARD_NO:
+            triggered = (hard_no_index < 0) & ~column.passed
+            hard_no_index[triggered] = position
+
+    hard_no_mask = hard_no_index >= 0
+
+    if plan.total_weight > 0:
+        primary_scores = total_points / plan.total_weight * 100
+    else:
+        primary_scores = np.zeros(size)
+    primary_scores[hard_no_mask] = 0.0
+
+    secondary_results = []
+    secondary_scores = np.zeros(size)
+    if chat_answers is not None:
+        for index, answers in enumerate(chat_answers):
+            if hard_no_mask[index]:
+                secondary_results.append((0.0, []))
+                continue
+            secondary_results.append(engine.score_secondary(answers))
+            secondary_scores[index] = secondary_results[-1][0]
+
+    final_scores = (
+        config.primary_weight * primary_scores +
+        config.secondary_weight * secondary_scores
+    )
+    final_scores[hard_no_mask] = 0.0
+
+    pass_mask = (final_scores >= config.pass_threshold) & ~hard_no_mask
+
+    return BatchScoreResult(
+        engine=engine,
+        columns=columns,
+        primary_scores=primary_scores,
+        secondary_scores=secondary_scores,
+        final_scores=final_scores,
+        hard_no_mask=hard_no_mask,
+        hard_no_index=hard_no_index,
+        pass_mask=pass_mask,
+        secondary_results=secondary_results
+    )
+
+
+def _evaluate_column(
+    engine: ScoringEngine,
+    step: PlanStep,
+    job_description: Dict,
+    candidates: List[Dict]
+) -> CriterionColumn:
+    if step.evaluator is not CRITERION_EVALUATORS.get(step.kind):
+        return _evaluate_column_per_candidate(engine, step, job_description, candidates)
+
+    category = step.category
+    weight = step.weight
+    job_value = step.job_value(job_description)
+    candidate_values = [step.candidate_value(candidate) for candidate in candidates]
+
+    size = len(candidate_values)
+    missing = np.array([value is None for value in candidate_values], dtype=bool)
+    if job_value is None:
+        missing[:] = True
+
+    skill_coverage = None
+
+    if step.kind == "numeric":
+        job_num = np.nan if job_value is None else float(job_value)
+        values = _numeric_column(candidate_values, missing)
+        passed, points, outcomes = _score_threshold(
+            category, weight,
+            values >= job_num,
+            values >= job_num - engine.config.experience_tolerance,
+            0.7
+        )
+    elif step.kind == "salary":
+        job_num = np.nan if job_value is None else _job_salary_max(job_value)
+        values = _numeric_column(candidate_values, missing)
+        passed, points, outcomes = _score_threshold(
+            category, weight,
+            values <= job_num,
+            values <= job_num * (1 + engine.config.salary_soft_overage),
+            0.5
+        )
+    else:
+        job_num = None
+        values = np.full(size, np.nan)
+        candidate_bools, job_bools, skill_coverage = _boolean_columns(job_value, candidate_values, missing)
+        passed, points, outcomes = _score_boolean(category, weight, candidate_bools, job_bools)
+
+    if missing.any():
+        passed[missing] = category == CriterionCategory.PREFERABLE
+        points[missing] = weight * 0.5 if category == CriterionCategory.PREFERABLE else 0.0
+        outcomes[missing] = OUTCOME_MISSING
+
+    return CriterionColumn(
+        name=step.name,
+        kind=step.kind,
+        category=category,
+        weight=weight,
+        job_value=job_num,
+        candidate_values=values,
+        passed=passed,
+        points=points,
+        outcomes=outcomes,
+        coverage=skill_coverage
+    )
+
+
+def _evaluate_column_per_candidate(
+    engine: ScoringEngine,
+    step: PlanStep,
+    job_description: Dict,
+    candidates: List[Dict]
+) -> CriterionColumn:
+    results = [step.evaluate(engine, job_description, candidate) for candidate in candidates]
+
+    return CriterionColumn(
+        name=step.name,
+        kind=step.kind,
+        category=step.category,
+        weight=step.weight,
+        job_value=None,
+        candidate_values=np.full(len(results), np.nan),
+        passed=np.array([result.passed for result in results], dtype=bool),
+        points=np.array([result.points_awarded for result in results], dtype=np.float64),
+        outcomes=np.zeros(len(results), dtype=np.int8),
+        notes=[result.notes for result in results],
+        coverage=np.array(
+            [np.nan if result.coverage is None else result.coverage for result in results],
+            dtype=np.float64
+        )
+    )
+
+
+def _numeric_column(candidate_values: list, missing: np.ndarray) -> np.ndarray:
+    return np.array(
+        [np.nan if is_missing else float(value) for value, is_missing in zip(candidate_values, missing.tolist())],
+        dtype=np.float64
+    )
+
+
+def _job_salary_max(job_value) -> float:
+    if isinstance(job_value, dict):
+        return float(job_value.get('max', job_value.get('max_salary', 0)))
+    return float(job_value)
+
+
+def _score_threshold(
+    category: CriterionCategory,
+    weight: float,
+    meets: np.ndarray,
+    within_tolerance: np.ndarray,
+    tolerance_factor: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    size = len(meets)
+
+    if category == CriterionCategory.PREFERABLE:
+        points = np.where(meets, weight, np.where(within_tolerance, weight * tolerance_factor, 0.0))
+        outcomes = np.where(meets, 0, np.where(within_tolerance, 1, 2)).astype(np.int8)
+        passed = np.ones(size, dtype=bool)
+    else:
+        passed = meets.copy()
+        points = np.where(passed, weight, 0.0)
+        outcomes = np.where(passed, 0, 1).astype(np.int8)
+
+    return passed, points, outcomes
+
+
+def _boolean_columns(job_value, candidate_values: list, missing: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    size = len(candidate_values)
+    candidate_bools = np.zeros(size, dtype=bool)
+    job_bools = np.zeros(size, dtype=bool)
+    skill_coverage = np.full(size, np.nan)
+
+    if job_value is None:
+        return candidate_bools, job_bools, skill_coverage
+
+    skill_rows = []
+    skill_lists = []
+    for index, candidate_value in enumerate(candidate_values):
+        if missing[index]:
+            continue
+
+        if isinstance(candidate_value, list) and isinstance(job_value, list):
+            skill_rows.append(index)
+            skill_lists.append(candidate_value)
+            job_bools[index] = True
+        elif isinstance(candidate_value, str) and isinstance(job_value, str):
+            candidate_bools[index] = candidate_value.lower() == job_value.lower()
+            job_bools[index] = True
+        else:
+            if isinstance(candidate_value, str):
+                candidate_bools[index] = candidate_value.lower() in TRUTHY_CANDIDATE_VALUES
+            else:
+                candidate_bools[index] = bool(candidate_value)
+
+            if isinstance(job_value, str):
+                job_bools[index] = job_value.lower() in TRUTHY_JOB_VALUES
+            else:
+                job_bools[index] = bool(job_value)
+
+    if skill_rows:
+        required_mask, *candidate_masks = SKILL_VOCABULARY.masks(job_value, *skill_lists)
+        required_count = count_bits(required_mask)
+        rows = np.array(skill_rows, dtype=np.int64)
+        covered = np.array([count_bits(mask & required_mask) for mask in candidate_masks], dtype=np.int64)
+        candidate_bools[rows] = covered == required_count
+        skill_coverage[rows] = covered / required_count if required_count else 1.0
+
+    return candidate_bools, job_bools, skill_coverage
+
+
+def _score_boolean(
+    category: CriterionCategory,
+    weight: float,
+    candidate_bools: np.ndarray,
+    job_bools: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    size = len(candidate_bools)
+    matched = candidate_bools & job_bools
+
+    if category == CriterionCategory.YES:
+        passed = matched
+        points = np.where(passed, weight, 0.0)
+        outcomes = np.where(passed, 0, 1).astype(np.int8)
+    elif category == CriterionCategory.PREFERABLE:
+        points = np.where(matched, weight, np.where(candidate_bools, weight * 0.5, 0.0))
+        outcomes = np.where(matched, 0, np.where(candidate_bools, 1, 2)).astype(np.int8)
+        passed = np.ones(size, dtype=bool)
+    else:
+        passed = ~matched
+        points = np.where(passed, weight, 0.0)
+        outcomes = np.where(passed, 0, 1).astype(np.int8)
+
+    return passed, points, outcomes
+
+
+def _criterion_result(engine: ScoringEngine, column: CriterionColumn, index: int) -> CriterionResult:
+    skill_coverage = None
+    if column.coverage is not None and not np.isnan(column.coverage[index]):
+        skill_coverage = float(column.coverage[index])
+
+    passed = bool(column.passed[index])
+    points = float(column.points[index])
+
+    if column.notes is not None:
+        return CriterionResult(
+            column.name, column.category, column.weight, passed, points,
+            notes=column.notes[index],
+            coverage=skill_coverage
+        )
+
+    outcome = int(column.outcomes[index])
+    if outcome == OUTCOME_MISSING or column.kind == "boolean":
+        return engine._criterion(
+            column.name, column.category, column.weight, passed, points,
+            None if outcome == OUTCOME_MISSING else column.kind, outcome,
+            coverage=skill_coverage
+        )
+
+    return engine._criterion(
+        column.name, column.category, column.weight, passed, points,
+        column.kind, outcome,
+        float(column.candidate_values[index]), column.job_value
+    )
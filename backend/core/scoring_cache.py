@@ -0,0 +1,99 @@
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from cachetools import LRUCache
+from sqlalchemy.orm import Session
+
+from core.scoring import ScoringEngine, ScoreReport, CriterionCategory
+from core.scoring_db import save_scoring_result, get_latest_result_fingerprint, load_score_report
+
+SCORING_CACHE_SIZE = 4096
+
+
+class ScoringCache:
+
+    def __init__(self, maxsize: int = SCORING_CACHE_SIZE):
+        self._reports = LRUCache(maxsize=maxsize)
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.inserts_skipped = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[ScoreReport]:
+        with self._lock:
+            return self._reports.get(key)
+
+    def put(self, key: str, report: ScoreReport):
+        with self._lock:
+            self._reports[key] = report
+
+    def clear(self):
+        with self._lock:
+            self._reports.clear()
+
+    def record(self, memory_hits: int = 0, db_hits: int = 0, misses: int = 0, inserts_skipped: int = 0):
+        with self._lock:
+            self.memory_hits += memory_hits
+            self.db_hits += db_hits
+            self.misses += misses
+            self.inserts_skipped += inserts_skipped
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.memory_hits + self.db_hits + self.misses
+            hits = self.memory_hits + self.db_hits
+            return {
+                "size": len(self._reports),
+                "max_size": self._reports.maxsize,
+                "lookups": lookups,
+                "memory_hits": self.memory_hits,
+                "db_hits": self.db_hits,
+                "misses": self.misses,
+                "inserts_skipped": self.inserts_skipped,
+                "hit_rate": hits / lookups if lookups else 0.0
+            }
+
+
+SCORING_CACHE = ScoringCache()
+
+
+def score_with_cache(
+    db: Session,
+    application_id: int,
+    engine: ScoringEngine,
+    job_description: Dict,
+    candidate: Dict,
+    rules_config: Dict[str, str],
+    chat_answers: List[Dict],
+    rules: Optional[Dict[str, CriterionCategory]] = None,
+    cache: ScoringCache = SCORING_CACHE
+) -> Tuple[int, ScoreReport, bool]:
+    if rules is None:
+        rules = {key: CriterionCategory(value) for key, value in rules_config.items()}
+    primary_fingerprint = engine.primary_fingerprint(job_description, candidate, rules)
+    result_fingerprint = engine.result_fingerprint(job_description, candidate, rules, chat_answers, primary_fingerprint)
+
+    report = cache.get(result_fingerprint)
+    latest = get_latest_result_fingerprint(db, application_id)
+
+    if latest is not None and latest.result_fingerprint == result_fingerprint:
+        if report is not None:
+            cache.record(memory_hits=1, inserts_skipped=1)
+        else:
+            report = load_score_report(db, latest.scoring_id, engine.config.pass_threshold)
+            cache.put(result_fingerprint, report)
+            cache.record(db_hits=1, inserts_skipped=1)
+        return latest.scoring_id, report, True
+
+    if report is not None:
+        cache.record(memory_hits=1)
+    else:
+        report = engine.score_candidate(job_description, candidate, rules, chat_answers)
+        cache.put(result_fingerprint, report)
+        cache.record(misses=1)
+
+    scoring_id = save_scoring_result(
+        db, application_id, report, rules_config, None, primary_fingerprint, result_fingerprint
+    )
+    return scoring_id, report, False
@@ -1,7 +1,14 @@
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from models import ScoringResults, ScoringBreakdown, ScoringJudgments, Applications, Jobs, Users
-from core.scoring import ScoreReport, ScoringConfig
+from collections import defaultdict
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import and_, bindparam, case, exists, func, insert, or_, select, tuple_, update
+from sqlalchemy.orm import Session, contains_eager
+from models import ScoringResults, ScoringBreakdown, ScoringJudgments, Applications, Jobs, JobScoringStats, Users
+from core.scoring import ScoreReport, ScoringConfig, CriterionResult, CriterionCategory, AnswerJudgment
+from core.score_index import ScoreIndex, SCORE_INDEXES, SCORE_INDEXES_LOCK, record_score
+from core.config_snapshots import get_or_create_snapshot_id, get_snapshots
+from core.pagination import encode_cursor, decode_cursor
+from core.job_stats import apply_job_stats_deltas, scoring_delta
 import json
 
 
@@ -10,55 +17,327 @@ def save_scoring_result(
     application_id: int,
     report: ScoreReport,
     rules_config: Dict[str, str],
-    scoring_config: Optional[ScoringConfig] = None
+    scoring_config: Optional[ScoringConfig] = None,
+    primary_fingerprint: Optional[str] = None,
+    result_fingerprint: Optional[str] = None
 ) -> int:
     
-    scoring_result = ScoringResults(
-        application_id=application_id,
-        primary_score=report.primary_score,
-        secondary_score=report.secondary_score,
-        final_score=report.final_score,
-        decision=report.decision,
-        fail_reason=report.fail_reason,
-        summary=report.summary,
-        rules_config=json.dumps(rules_config),
-        scoring_config=json.dumps(scoring_config.__dict__) if scoring_config else None
+    return save_scoring_results(
+        db, [(application_id, report, primary_fingerprint, result_fingerprint)], rules_config, scoring_config
+    )[0]
+
+
+def save_scoring_results(
+    db: Session,
+    entries: List[Tuple[int, ScoreReport, Optional[str], Optional[str]]],
+    rules_config: Dict[str, str],
+    scoring_config: Optional[ScoringConfig] = None
+) -> List[int]:
+    
+    if not entries:
+        return []
+    
+    previous = {
+        row.application_id: row
+        for row in db.execute(
+            select(
+                Applications.application_id, Applications.job_id, Applications.latest_scoring_id,
+                ScoringResults.final_score, ScoringResults.decision
+            ).outerjoin(
+                ScoringResults, ScoringResults.scoring_id == Applications.latest_scoring_id
+            ).where(
+                Applications.application_id.in_({application_id for application_id, _, _, _ in entries})
+            ).with_for_update(of=Applications)
+        )
+    }
+    
+    snapshot_id = get_or_create_snapshot_id(db, rules_config, scoring_config.__dict__ if scoring_config else None)
+    
+    scoring_ids = db.execute(
+        insert(ScoringResults).returning(ScoringResults.scoring_id, sort_by_parameter_order=True),
+        [
+            {
+                "application_id": application_id,
+                "primary_score": report.primary_score,
+                "secondary_score": report.secondary_score,
+                "final_score": report.final_score,
+                "decision": report.decision,
+                "fail_reason": report.fail_reason,
+                "summary": report.summary,
+                "config_snapshot_id": snapshot_id,
+                "primary_fingerprint": primary_fingerprint,
+                "result_fingerprint": result_fingerprint
+            }
+            for application_id, report, primary_fingerprint, result_fingerprint in entries
+        ]
+    ).scalars().all()
+    
+    breakdown_rows = [
+        {
+            "scoring_id": scoring_id,
+            "criterion_name": criterion.name,
+            "category": criterion.category.value,
+            "weight": criterion.weight,
+            "passed": criterion.passed,
+            "points_awarded": criterion.points_awarded,
+            "notes": criterion.notes,
+            "coverage": criterion.coverage,
+            "candidate_value": criterion.candidate_value,
+            "job_value": criterion.job_value
+        }
+        for scoring_id, (_, report, _, _) in zip(scoring_ids, entries)
+        for criterion in report.primary_breakdown
+    ]
+    if breakdown_rows:
+        db.execute(insert(ScoringBreakdown), breakdown_rows)
+    
+    judgment_rows = [
+        {
+            "scoring_id": scoring_id,
+            "question_id": judgment.question_id,
+            "category": judgment.category.value,
+            "rationale": judgment.rationale
+        }
+        for scoring_id, (_, report, _, _) in zip(scoring_ids, entries)
+        for judgment in report.secondary_judgments
+    ]
+    if judgment_rows:
+        db.execute(insert(ScoringJudgments), judgment_rows)
+    
+    applications = Applications.__table__
+    db.execute(
+        update(applications).where(
+            applications.c.application_id == bindparam("pointer_application_id")
+        ).values(
+            latest_scoring_id=case(
+                (or_(
+                    applications.c.latest_scoring_id.is_(None),
+                    applications.c.latest_scoring_id < bindparam("pointer_scoring_id")
+                ), bindparam("pointer_scoring_id")),
+                else_=applications.c.latest_scoring_id
+            )
+        ),
+        [
+            {"pointer_application_id": application_id, "pointer_scoring_id": scoring_id}
+            for scoring_id, (application_id, _, _, _) in zip(scoring_ids, entries)
+        ]
     )
     
-    db.add(scoring_result)
-    db.flush()  
-    
-    for criterion in report.primary_breakdown:
-        breakdown = ScoringBreakdown(
-            scoring_id=scoring_result.scoring_id,
-            criterion_name=criterion.name,
-            category=criterion.category.value,
-            weight=criterion.weight,
-            passed=criterion.passed,
-            points_awarded=criterion.points_awarded,
-            notes=criterion.notes
+    apply_job_stats_deltas(db, _job_stats_deltas(previous, scoring_ids, entries))
+    index_entries = _score_index_entries(previous, scoring_ids, entries)
+    db.commit()
+    
+    for entry in index_entries:
+        record_score(*entry)
+    
+    return list(scoring_ids)
+
+
+def _job_stats_deltas(previous: Dict[int, Any], scoring_ids: List[int], entries: List[Tuple]) -> Dict[int, Dict[str, float]]:
+    latest = {
+        application_id: (row.latest_scoring_id, (row.final_score, row.decision) if row.final_score is not None else None)
+        for application_id, row in previous.items()
+    }
+    deltas = defaultdict(lambda: defaultdict(float))
+    for scoring_id, (application_id, report, _, _) in zip(scoring_ids, entries):
+        if application_id not in latest:
+            continue
+        latest_scoring_id, result = latest[application_id]
+        if latest_scoring_id is not None and latest_scoring_id > scoring_id:
+            continue
+        current = (report.final_score, report.decision)
+        scoring_delta(deltas[previous[application_id].job_id], result, current)
+        deltas[previous[application_id].job_id]["scoring_version"] += 1
+        latest[application_id] = (scoring_id, current)
+    return deltas
+
+
+def _score_index_entries(previous: Dict[int, Any], scoring_ids: List[int], entries: List[Tuple]) -> List[Tuple]:
+    if not SCORE_INDEXES:
+        return []
+    
+    latest = {application_id: row.latest_scoring_id for application_id, row in previous.items()}
+    index_entries = []
+    for scoring_id, (application_id, report, _, _) in zip(scoring_ids, entries):
+        application = previous.get(application_id)
+        if application is None or application.job_id not in SCORE_INDEXES:
+            continue
+        if latest[application_id] is not None and latest[application_id] > scoring_id:
+            continue
+        index_entries.append((
+            application.job_id, application_id, report.final_score, report.hard_no_triggered is not None
+        ))
+        latest[application_id] = scoring_id
+    return index_entries
+
+
+def latest_scoring_ids_for_job(job_id: int):
+    return select(Applications.latest_scoring_id).where(
+        Applications.job_id == job_id,
+        Applications.latest_scoring_id.isnot(None)
+    )
+
+
+def latest_scoring_result(application_id: int):
+    return select(ScoringResults).join(
+        Applications, Applications.latest_scoring_id == ScoringResults.scoring_id
+    ).where(Applications.application_id == application_id)
+
+
+def backfill_latest_scoring_ids(db: Session, job_ids: Optional[List[int]] = None) -> int:
+    
+    latest_id = select(func.max(ScoringResults.scoring_id)).where(
+        ScoringResults.application_id == Applications.application_id
+    ).scalar_subquery()
+    
+    statement = update(Applications).where(
+        Applications.latest_scoring_id.is_(None),
+        latest_id.isnot(None)
+    ).values(latest_scoring_id=latest_id)
+    if job_ids is not None:
+        statement = statement.where(Applications.job_id.in_(job_ids))
+    
+    updated = db.execute(statement, execution_options={"synchronize_session": False}).rowcount
+    if updated:
+        versions = update(JobScoringStats).values(scoring_version=JobScoringStats.scoring_version + 1)
+        if job_ids is not None:
+            versions = versions.where(JobScoringStats.job_id.in_(job_ids))
+        db.execute(versions, execution_options={"synchronize_session": False})
+    db.commit()
+    return updated
+
+
+def get_score_index_version(db: Session, job_id: int) -> Optional[int]:
+    return db.scalar(select(JobScoringStats.scoring_version).where(JobScoringStats.job_id == job_id))
+
+
+def get_job_score_index(db: Session, job_id: int) -> ScoreIndex:
+    version = get_score_index_version(db, job_id)
+    with SCORE_INDEXES_LOCK:
+        index = SCORE_INDEXES.get(job_id)
+        if index is not None and index.version == version:
+            return index
+    
+    hard_no = exists().where(and_(
+        ScoringBreakdown.scoring_id == ScoringResults.scoring_id,
+        ScoringBreakdown.category == CriterionCategory.HARD_NO.value,
+        ScoringBreakdown.passed == False
+    ))
+    entries = db.execute(
+        select(ScoringResults.application_id, ScoringResults.final_score, hard_no).join(
+            Applications, Applications.latest_scoring_id == ScoringResults.scoring_id
+        ).where(Applications.job_id == job_id)
+    ).all()
+    
+    index = ScoreIndex(entries, version)
+    with SCORE_INDEXES_LOCK:
+        SCORE_INDEXES[job_id] = index
+    return index
+
+
+def get_primary_result(db: Session, application_id: int) -> Optional[Dict[str, Any]]:
+
+    scoring_result = db.scalars(latest_scoring_result(application_id)).first()
+    
+    if not scoring_result or not scoring_result.primary_fingerprint:
+        return None
+    
+    breakdown_records = db.query(ScoringBreakdown).filter(
+        ScoringBreakdown.scoring_id == scoring_result.scoring_id
+    ).order_by(ScoringBreakdown.breakdown_id).all()
+    
+    primary_breakdown = [
+        CriterionResult(
+            name=b.criterion_name,
+            category=CriterionCategory(b.category),
+            weight=b.weight,
+            passed=b.passed,
+            points_awarded=b.points_awarded,
+            notes=b.notes,
+            coverage=b.coverage,
+            candidate_value=b.candidate_value,
+            job_value=b.job_value
         )
-        db.add(breakdown)
-    
-    # Save secondary judgments
-    for judgment in report.secondary_judgments:
-        judgment_record = ScoringJudgments(
-            scoring_id=scoring_result.scoring_id,
-            question_id=judgment.question_id,
-            category=judgment.category.value,
-            rationale=judgment.rationale
+        for b in breakdown_records
+    ]
+    
+    hard_no_triggered = next(
+        (r.name for r in primary_breakdown if r.category == CriterionCategory.HARD_NO and not r.passed),
+        None
+    )
+    
+    return {
+        "scoring_id": scoring_result.scoring_id,
+        "primary_fingerprint": scoring_result.primary_fingerprint,
+        "primary_score": scoring_result.primary_score,
+        "primary_breakdown": primary_breakdown,
+        "hard_no_triggered": hard_no_triggered
+    }
+
+
+def get_latest_result_fingerprint(db: Session, application_id: int) -> Optional[Tuple[int, Optional[str]]]:
+    
+    return db.query(ScoringResults.scoring_id, ScoringResults.result_fingerprint).join(
+        Applications, Applications.latest_scoring_id == ScoringResults.scoring_id
+    ).filter(Applications.application_id == application_id).first()
+
+
+def load_score_report(db: Session, scoring_id: int, pass_threshold: Optional[float] = None) -> Optional[ScoreReport]:
+    
+    scoring_result = db.query(ScoringResults).filter(ScoringResults.scoring_id == scoring_id).first()
+    if not scoring_result:
+        return None
+    
+    breakdown_records = db.query(ScoringBreakdown).filter(
+        ScoringBreakdown.scoring_id == scoring_id
+    ).order_by(ScoringBreakdown.breakdown_id).all()
+    
+    judgment_records = db.query(ScoringJudgments).filter(
+        ScoringJudgments.scoring_id == scoring_id
+    ).order_by(ScoringJudgments.judgment_id).all()
+    
+    primary_breakdown = [
+        CriterionResult(
+            name=b.criterion_name,
+            category=CriterionCategory(b.category),
+            weight=b.weight,
+            passed=b.passed,
+            points_awarded=b.points_awarded,
+            notes=b.notes,
+            coverage=b.coverage,
+            candidate_value=b.candidate_value,
+            job_value=b.job_value
         )
-        db.add(judgment_record)
+        for b in breakdown_records
+    ]
     
-    db.commit()
-    return scoring_result.scoring_id
+    return ScoreReport(
+        primary_score=scoring_result.primary_score,
+        secondary_score=scoring_result.secondary_score,
+        final_score=scoring_result.final_score,
+        decision=scoring_result.decision,
+        fail_reason=scoring_result.fail_reason,
+        primary_breakdown=primary_breakdown,
+        secondary_judgments=[
+            AnswerJudgment(
+                question_id=j.question_id,
+                category=CriterionCategory(j.category),
+                rationale=j.rationale
+            )
+            for j in judgment_records
+        ],
+        summary=scoring_result.summary,
+        hard_no_triggered=next(
+            (r.name for r in primary_breakdown if r.category == CriterionCategory.HARD_NO and not r.passed),
+            None
+        ),
+        pass_threshold=pass_threshold
+    )
 
 
 def get_scoring_result(db: Session, application_id: int) -> Optional[Dict[str, Any]]:
  
-    scoring_result = db.query(ScoringResults).filter(
-        ScoringResults.application_id == application_id
-    ).order_by(ScoringResults.created_at.desc()).first()
+    scoring_result = db.scalars(latest_scoring_result(application_id)).first()
     
     if not scoring_result:
         return None
@@ -71,7 +350,59 @@ def get_scoring_result(db: Session, application_id: int) -> Optional[Dict[str, A
         ScoringJudgments.scoring_id == scoring_result.scoring_id
     ).all()
     
-    result = {
+    return _format_scoring_result(
+        scoring_result, breakdown_records, judgment_records,
+        get_snapshots(db, [scoring_result.config_snapshot_id])
+    )
+
+
+def get_scoring_results(db: Session, application_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+
+    if not application_ids:
+        return {}
+    
+    scoring_results = db.query(ScoringResults).join(
+        Applications, Applications.latest_scoring_id == ScoringResults.scoring_id
+    ).filter(Applications.application_id.in_(application_ids)).all()
+    scoring_ids = [scoring_result.scoring_id for scoring_result in scoring_results]
+    if not scoring_ids:
+        return {}
+    
+    breakdowns: Dict[int, List[ScoringBreakdown]] = {scoring_id: [] for scoring_id in scoring_ids}
+    for b in db.query(ScoringBreakdown).filter(
+        ScoringBreakdown.scoring_id.in_(scoring_ids)
+    ).order_by(ScoringBreakdown.breakdown_id):
+        breakdowns[b.scoring_id].append(b)
+    
+    judgments: Dict[int, List[ScoringJudgments]] = {scoring_id: [] for scoring_id in scoring_ids}
+    for j in db.query(ScoringJudgments).filter(
+        ScoringJudgments.scoring_id.in_(scoring_ids)
+    ).order_by(ScoringJudgments.judgment_id):
+        judgments[j.scoring_id].append(j)
+    
+    snapshots = get_snapshots(db, [scoring_result.config_snapshot_id for scoring_result in scoring_results])
+    
+    return {
+        scoring_result.application_id: _format_scoring_result(
+            scoring_result, breakdowns[scoring_result.scoring_id], judgments[scoring_result.scoring_id], snapshots
+        )
+        for scoring_result in scoring_results
+    }
+
+
+def _format_scoring_result(
+    scoring_result: ScoringResults,
+    breakdown_records: List[ScoringBreakdown],
+    judgment_records: List[ScoringJudgments],
+    snapshots: Dict[int, Dict[str, Any]]
+) -> Dict[str, Any]:
+    
+    configuration = snapshots.get(scoring_result.config_snapshot_id) or {
+        "rules_config": json.loads(scoring_result.rules_config) if scoring_result.rules_config else {},
+        "scoring_config": json.loads(scoring_result.scoring_config) if scoring_result.scoring_config else {}
+    }
+    
+    return {
         "scoring_id": scoring_result.scoring_id,
         "application_id": scoring_result.application_id,
         "scores": {
@@ -93,6 +424,7 @@ def get_scoring_result(db: Session, application_id: int) -> Optional[Dict[str, A
                 "points_awarded": b.points_awarded,
                 "points_missed": b.weight - b.points_awarded,
                 "notes": b.notes,
+                "coverage": b.coverage,
                 "score_percentage": (b.points_awarded / b.weight * 100) if b.weight > 0 else 0
             }
             for b in breakdown_records
@@ -105,14 +437,9 @@ def get_scoring_result(db: Session, application_id: int) -> Optional[Dict[str, A
             }
             for j in judgment_records
         ],
-        "configuration": {
-            "rules_config": json.loads(scoring_result.rules_config) if scoring_result.rules_config else {},
-            "scoring_config": json.loads(scoring_result.scoring_config) if scoring_result.scoring_config else {}
-        },
+        "configuration": configuration,
         "created_at": scoring_result.created_at.isoformat() if scoring_result.created_at else None
     }
-    
-    return result
 
 
 def get_scoring_summary_for_recruiter(db: Session, application_id: int) -> Optional[Dict[str, Any]]:
@@ -121,6 +448,19 @@ def get_scoring_summary_for_recruiter(db: Session, application_id: int) -> Optio
     if not result:
         return None
     
+    return _build_recruiter_summary(result)
+
+
+def get_scoring_summaries_for_recruiter(db: Session, application_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+
+    return {
+        application_id: _build_recruiter_summary(result)
+        for application_id, result in get_scoring_results(db, application_ids).items()
+    }
+
+
+def _build_recruiter_summary(result: Dict[str, Any]) -> Dict[str, Any]:
+    
     total_possible_points = sum(criterion["weight"] for criterion in result["primary_breakdown"])
     total_awarded_points = sum(criterion["points_awarded"] for criterion in result["primary_breakdown"])
     total_missed_points = total_possible_points - total_awarded_points
@@ -229,20 +569,57 @@ def _generate_recommendations(result: Dict, major_deductions: List, concerns: Li
     return recommendations
 
 
+DASHBOARD_SORTS = ("recent", "score")
+UNSCORED_SORT_VALUE = -1.0
+
+
 def get_applications_with_scores(db: Session, job_id: Optional[int] = None, limit: int = 50) -> List[Dict[str, Any]]:
 
+    return get_applications_with_scores_page(db, job_id, limit)[0]
+
+
+def get_applications_with_scores_page(
+    db: Session,
+    job_id: Optional[int] = None,
+    limit: int = 50,
+    sort: str = "recent",
+    cursor: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+
+    if sort not in DASHBOARD_SORTS:
+        raise ValueError(f"Unknown sort '{sort}', expected one of {', '.join(DASHBOARD_SORTS)}")
+    
+    if sort == "score":
+        sort_key = func.coalesce(ScoringResults.final_score, UNSCORED_SORT_VALUE)
+        after = decode_cursor(cursor, sort, [float, int])
+    else:
+        sort_key = Applications.created_at
+        after = decode_cursor(cursor, sort, [datetime, int])
     
-    query = db.query(Applications).join(Users).join(Jobs)
+    query = db.query(Applications, sort_key).join(Applications.applicant).join(Applications.job).options(
+        contains_eager(Applications.applicant),
+        contains_eager(Applications.job)
+    )
+    if sort == "score":
+        query = query.outerjoin(ScoringResults, ScoringResults.scoring_id == Applications.latest_scoring_id)
     
     if job_id:
         query = query.filter(Applications.job_id == job_id)
+    if after is not None:
+        query = query.filter(tuple_(sort_key, Applications.application_id) < tuple_(*after))
+    
+    rows = query.order_by(sort_key.desc(), Applications.application_id.desc()).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_application, last_key = rows[-1]
+        next_cursor = encode_cursor(sort, [last_key, last_application.application_id])
     
-    applications = query.order_by(Applications.created_at.desc()).limit(limit).all()
+    applications = [app for app, _ in rows]
+    scoring_summaries = get_scoring_summaries_for_recruiter(db, [app.application_id for app in applications])
     
     results = []
     for app in applications:
-        scoring_summary = get_scoring_summary_for_recruiter(db, app.application_id)
-        
         results.append({
             "application_id": app.application_id,
             "job_title": app.job.title,
@@ -251,7 +628,83 @@ def get_applications_with_scores(db: Session, job_id: Optional[int] = None, limi
             "candidate_email": app.applicant.email,
             "application_status": app.application_status.value,
             "applied_at": app.created_at.isoformat() if app.created_at else None,
-            "scoring": scoring_summary
+            "scoring": scoring_summaries.get(app.application_id)
         })
     
-    return results
+    return results, next_cursor
+
+
+SCORE_BUCKETS = (("excellent", 90), ("good", 80), ("fair", 70))
+
+
+def get_scoring_totals(db: Session, job_id: Optional[int] = None) -> Dict[str, Any]:
+
+    final_score = ScoringResults.final_score
+    bucket = case(
+        *[(final_score >= lower_bound, name) for name, lower_bound in SCORE_BUCKETS],
+        else_="poor"
+    )
+    bucket = case((final_score.is_(None), None), else_=bucket).label("bucket")
+    
+    pool = select(
+        bucket,
+        func.count().label("applications"),
+        func.count(ScoringResults.scoring_id).label("scored"),
+        func.count().filter(ScoringResults.decision == "PASS").label("passed"),
+        func.count().filter(ScoringResults.decision == "REJECT").label("rejected"),
+        func.sum(final_score).label("score_sum")
+    ).select_from(Applications).outerjoin(
+        ScoringResults, ScoringResults.scoring_id == Applications.latest_scoring_id
+    ).group_by(bucket)
+    
+    if job_id:
+        pool = pool.where(Applications.job_id == job_id)
+    
+    buckets = db.execute(pool).all()
+    distribution = {name: 0 for name, _ in SCORE_BUCKETS}
+    distribution["poor"] = 0
+    for row in buckets:
+        if row.bucket is not None:
+            distribution[row.bucket] = row.scored
+    
+    scored = sum(row.scored for row in buckets)
+    return {
+        "total_applications": sum(row.applications for row in buckets),
+        "scored_applications": scored,
+        "passed": sum(row.passed for row in buckets),
+        "rejected": sum(row.rejected for row in buckets),
+        "average_score": sum(row.score_sum or 0 for row in buckets) / scored if scored else 0,
+        "score_distribution": distribution
+    }
+
+
+def get_scoring_insights(db: Session, job_id: Optional[int] = None, top_deductions: int = 5) -> Dict[str, Any]:
+
+    insights = get_scoring_totals(db, job_id)
+    if not insights["scored_applications"]:
+        insights["common_deductions"] = []
+        return insights
+    
+    missed = ScoringBreakdown.weight - ScoringBreakdown.points_awarded
+    deductions = select(
+        ScoringBreakdown.criterion_name,
+        func.count().label("frequency"),
+        func.avg(missed).label("average_points_missed")
+    ).join(
+        Applications, Applications.latest_scoring_id == ScoringBreakdown.scoring_id
+    ).where(missed > 0).group_by(ScoringBreakdown.criterion_name).order_by(
+        func.count().desc(), ScoringBreakdown.criterion_name
+    ).limit(top_deductions)
+    
+    if job_id:
+        deductions = deductions.where(Applications.job_id == job_id)
+    
+    insights["common_deductions"] = [
+        {
+            "criterion": row.criterion_name,
+            "frequency": row.frequency,
+            "average_points_missed": float(row.average_points_missed)
+        }
+        for row in db.execute(deductions)
+    ]
+    return insights
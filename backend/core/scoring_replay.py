@@ -0,0 +1,213 @@
+from typing import Any, Dict
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models import ScoringResults, ScoringBreakdown
+from core.config_snapshots import get_snapshots
+from core.scoring import ScoringConfig, CriterionCategory, get_criterion_definition
+from core.scoring_db import latest_scoring_ids_for_job
+
+HARD_NO = CriterionCategory.HARD_NO.value
+PREFERABLE = CriterionCategory.PREFERABLE.value
+REPLAY_TOP_DELTAS = 20
+
+
+def replay_job_scores(db: Session, job_id: int, config: ScoringConfig, top_deltas: int = REPLAY_TOP_DELTAS) -> Dict[str, Any]:
+    latest_ids = latest_scoring_ids_for_job(job_id).scalar_subquery()
+
+    connection = db.connection()
+    results = connection.execute(
+        select(
+            ScoringResults.scoring_id,
+            ScoringResults.application_id,
+            ScoringResults.secondary_score,
+            ScoringResults.final_score,
+            ScoringResults.decision,
+            ScoringResults.config_snapshot_id
+        ).where(ScoringResults.scoring_id.in_(latest_ids)).order_by(ScoringResults.scoring_id)
+    ).all()
+
+    if not results:
+        return _replay_result([], np.zeros(0), np.zeros(0), [], [], np.zeros(0, dtype=bool), [], top_deltas)
+
+    scoring_ids, application_ids, secondary_scores, old_scores, old_decisions, snapshot_ids = zip(*results)
+
+    rows = connection.execute(
+        select(
+            ScoringBreakdown.scoring_id,
+            ScoringBreakdown.criterion_name,
+            ScoringBreakdown.category,
+            ScoringBreakdown.weight,
+            ScoringBreakdown.passed,
+            ScoringBreakdown.points_awarded,
+            ScoringBreakdown.candidate_value,
+            ScoringBreakdown.job_value
+        ).where(ScoringBreakdown.scoring_id.in_(latest_ids))
+    ).all()
+
+    size = len(scoring_ids)
+    old_scores = np.array(old_scores, dtype=np.float64)
+    secondary_scores = np.array(secondary_scores, dtype=np.float64)
+
+    if rows:
+        row_scoring_ids, names, categories, weights, passed, points, candidate_values, job_values = zip(*rows)
+    else:
+        row_scoring_ids = names = categories = weights = passed = points = candidate_values = job_values = ()
+
+    # results are ordered by scoring_id, so each breakdown row's owner is a binary search away
+    owners = np.searchsorted(np.array(scoring_ids, dtype=np.int64), np.array(row_scoring_ids, dtype=np.int64))
+    names = np.array(names, dtype=str)
+    categories = np.array(categories, dtype=str)
+    old_weights = np.array(weights, dtype=np.float64)
+    points = np.array(points, dtype=np.float64)
+    passed = np.array(passed, dtype=bool)
+    is_hard_no = categories == HARD_NO
+    is_preferable = categories == PREFERABLE
+
+    new_weights = np.zeros(len(rows))
+    dropped = np.zeros(len(rows), dtype=bool)
+    kinds = np.empty(len(rows), dtype=object)
+    for name in set(names.tolist()):
+        definition = get_criterion_definition(name)
+        weight = config.weights.get(name, definition.default_weight)
+        selected = names == name
+        if weight is None:
+            dropped[selected] = True
+        else:
+            new_weights[selected] = weight
+        kinds[selected] = definition.kind
+
+    fractions = np.divide(points, old_weights, out=np.zeros(len(rows)), where=old_weights > 0)
+    fractions = _reapply_tolerances(fractions, kinds, is_preferable, candidate_values, job_values, config)
+
+    triggered = is_hard_no & ~passed
+    blocked = np.zeros(size, dtype=bool)
+    np.logical_or.at(blocked, owners[triggered & ~dropped], True)
+    requires_rescore = np.zeros(size, dtype=bool)
+    np.logical_or.at(requires_rescore, owners[triggered & dropped], True)
+    requires_rescore |= _unscored_criteria(db, config, snapshot_ids, owners, names, size)
+    requires_rescore &= ~blocked
+
+    total_points = np.bincount(owners, weights=fractions * new_weights, minlength=size)
+    total_weight = np.bincount(owners, weights=new_weights, minlength=size)
+    primary_scores = np.divide(total_points, total_weight, out=np.zeros(size), where=total_weight > 0) * 100
+
+    new_scores = config.primary_weight * primary_scores + config.secondary_weight * secondary_scores
+    new_scores[blocked] = 0.0
+    new_scores[requires_rescore] = old_scores[requires_rescore]
+    new_pass = (new_scores >= config.pass_threshold) & ~blocked
+    new_pass[requires_rescore] = np.array(old_decisions, dtype=object)[requires_rescore] == "PASS"
+
+    return _replay_result(application_ids, old_scores, new_scores, old_decisions, scoring_ids, new_pass, requires_rescore, top_deltas)
+
+
+def _unscored_criteria(
+    db: Session,
+    config: ScoringConfig,
+    snapshot_ids: tuple,
+    owners: np.ndarray,
+    names: np.ndarray,
+    size: int
+) -> np.ndarray:
+    snapshots = get_snapshots(db, snapshot_ids)
+    enabled = {}
+    for snapshot_id in set(snapshot_ids):
+        rules = snapshots[snapshot_id]["rules_config"] if snapshot_id in snapshots else config.weights
+        enabled[snapshot_id] = {
+            name for name in rules
+            if config.weights.get(name, get_criterion_definition(name).default_weight) is not None
+        }
+
+    snapshot_ids = np.array([-1 if snapshot_id is None else snapshot_id for snapshot_id in snapshot_ids], dtype=np.int64)
+    unscored = np.zeros(size, dtype=bool)
+    for name in set().union(*enabled.values()):
+        scored = np.zeros(size, dtype=bool)
+        np.logical_or.at(scored, owners[names == name], True)
+        expected = np.isin(snapshot_ids, [
+            -1 if snapshot_id is None else snapshot_id
+            for snapshot_id, criteria in enabled.items() if name in criteria
+        ])
+        unscored |= expected & ~scored
+    return unscored
+
+
+def _reapply_tolerances(
+    fractions: np.ndarray,
+    kinds: np.ndarray,
+    is_preferable: np.ndarray,
+    candidate_values: tuple,
+    job_values: tuple,
+    config: ScoringConfig
+) -> np.ndarray:
+    candidate = np.array(candidate_values, dtype=np.float64)
+    job = np.array(job_values, dtype=np.float64)
+    known = is_preferable & ~np.isnan(candidate) & ~np.isnan(job)
+
+    numeric = known & (kinds == "numeric")
+    if numeric.any():
+        fractions[numeric] = np.where(
+            candidate[numeric] >= job[numeric], 1.0,
+            np.where(candidate[numeric] >= job[numeric] - config.experience_tolerance, 0.7, 0.0)
+        )
+
+    salary = known & (kinds == "salary")
+    if salary.any():
+        fractions[salary] = np.where(
+            candidate[salary] <= job[salary], 1.0,
+            np.where(candidate[salary] <= job[salary] * (1 + config.salary_soft_overage), 0.5, 0.0)
+        )
+
+    return fractions
+
+
+def _replay_result(
+    application_ids,
+    old_scores: np.ndarray,
+    new_scores: np.ndarray,
+    old_decisions,
+    scoring_ids,
+    new_pass: np.ndarray,
+    requires_rescore,
+    top_deltas: int
+) -> Dict[str, Any]:
+    deltas = new_scores - old_scores
+    largest = np.argsort(-np.abs(deltas), kind="stable")[:top_deltas]
+    old_pass = np.array([decision == "PASS" for decision in old_decisions], dtype=bool)
+    flipped = np.nonzero(old_pass != new_pass)[0]
+
+    return {
+        "total_applications": len(application_ids),
+        "summary": {
+            "passed_before": int(old_pass.sum()),
+            "passed_after": int(new_pass.sum()),
+            "flipped_to_pass": int((new_pass & ~old_pass).sum()),
+            "flipped_to_reject": int((old_pass & ~new_pass).sum()),
+            "average_delta": float(deltas.mean()) if len(deltas) else 0.0,
+            "requires_rescore": int(np.sum(requires_rescore))
+        },
+        "flipped": [
+            {
+                "application_id": application_ids[position],
+                "scoring_id": scoring_ids[position],
+                "old_score": float(old_scores[position]),
+                "new_score": float(new_scores[position]),
+                "old_decision": old_decisions[position],
+                "new_decision": "PASS" if new_pass[position] else "REJECT"
+            }
+            for position in flipped.tolist()
+        ],
+        "largest_deltas": [
+            {
+                "application_id": application_ids[position],
+                "old_score": float(old_scores[position]),
+                "new_score": float(new_scores[position]),
+                "delta": float(deltas[position])
+            }
+            for position in largest.tolist()
+        ],
+        "requires_rescore": [
+            application_ids[position] for position in np.nonzero(requires_rescore)[0].tolist()
+        ]
+    }
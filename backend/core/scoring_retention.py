@@ -0,0 +1,140 @@
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy import String, Text, and_, delete, func, literal_column, select
+from sqlalchemy.orm import Session
+
+from models import Applications, ScoringResults, ScoringBreakdown, ScoringJudgments
+
+RETENTION_APPLICATION_BATCH = 500
+RETENTION_DELETE_BATCH = 1000
+RETENTION_TABLES = (ScoringBreakdown, ScoringJudgments, ScoringResults)
+
+
+@dataclass
+class RetentionPolicy:
+    keep_latest: int = 3
+    keep_daily: bool = True
+    daily_window_days: Optional[int] = 90
+    application_batch: int = RETENTION_APPLICATION_BATCH
+    delete_batch: int = RETENTION_DELETE_BATCH
+    pause_seconds: float = 0.0
+
+
+def expired_scoring_ids(db: Session, application_ids: List[int], policy: RetentionPolicy) -> List[int]:
+    newest_first = (ScoringResults.created_at.desc(), ScoringResults.scoring_id.desc())
+    ranked = select(
+        ScoringResults.scoring_id,
+        ScoringResults.created_at,
+        func.row_number().over(partition_by=ScoringResults.application_id, order_by=newest_first).label("position"),
+        func.row_number().over(
+            partition_by=(ScoringResults.application_id, func.date(ScoringResults.created_at)),
+            order_by=newest_first
+        ).label("daily_position")
+    ).where(ScoringResults.application_id.in_(application_ids)).subquery()
+
+    expired = ranked.c.position > policy.keep_latest
+    if policy.keep_daily:
+        daily_kept = ranked.c.daily_position == 1
+        if policy.daily_window_days is not None:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=policy.daily_window_days)
+            daily_kept = and_(daily_kept, ranked.c.created_at >= cutoff)
+        expired = and_(expired, ~daily_kept)
+
+    pinned = select(Applications.latest_scoring_id).where(
+        Applications.application_id.in_(application_ids),
+        Applications.latest_scoring_id.is_not(None)
+    )
+
+    return list(db.scalars(
+        select(ranked.c.scoring_id)
+        .where(expired, ranked.c.scoring_id.not_in(pinned))
+        .order_by(ranked.c.scoring_id)
+    ))
+
+
+def estimate_bytes(db: Session, model, column, ids: List[int]) -> int:
+    table = model.__table__
+    if db.get_bind().dialect.name == "postgresql":
+        size = func.pg_column_size(literal_column(table.name))
+    else:
+        size = sum(
+            func.coalesce(func.length(table_column), 0) if isinstance(table_column.type, (String, Text)) else 8
+            for table_column in table.columns
+        )
+    return int(db.scalar(select(func.coalesce(func.sum(size), 0)).where(column.in_(ids))) or 0)
+
+
+def delete_scoring_ids(db: Session, ids: List[int], dry_run: bool = False) -> Dict[str, Dict[str, int]]:
+    reclaimed = {}
+    for model in RETENTION_TABLES:
+        column = model.scoring_id
+        rows = db.scalar(select(func.count()).where(column.in_(ids)))
+        reclaimed[model.__tablename__] = {"rows": rows, "bytes": estimate_bytes(db, model, column, ids)}
+        if not dry_run:
+            db.execute(delete(model).where(column.in_(ids)).execution_options(synchronize_session=False))
+
+    if dry_run:
+        db.rollback()
+    else:
+        db.commit()
+    return reclaimed
+
+
+def compact_scoring_history(
+    db: Session,
+    policy: Optional[RetentionPolicy] = None,
+    job_id: Optional[int] = None,
+    dry_run: bool = False
+) -> Iterator[Dict]:
+    policy = policy or RetentionPolicy()
+    started = time.perf_counter()
+    totals = {model.__tablename__: {"rows": 0, "bytes": 0} for model in RETENTION_TABLES}
+    batches = 0
+    last_application_id = 0
+
+    while True:
+        query = (
+            select(Applications.application_id)
+            .where(Applications.application_id > last_application_id)
+            .order_by(Applications.application_id)
+            .limit(policy.application_batch)
+        )
+        if job_id is not None:
+            query = query.where(Applications.job_id == job_id)
+        application_ids = list(db.scalars(query))
+        if not application_ids:
+            break
+        last_application_id = application_ids[-1]
+
+        expired = expired_scoring_ids(db, application_ids, policy)
+        db.rollback()
+        for start in range(0, len(expired), policy.delete_batch):
+            reclaimed = delete_scoring_ids(db, expired[start:start + policy.delete_batch], dry_run)
+            for table, counts in reclaimed.items():
+                totals[table]["rows"] += counts["rows"]
+                totals[table]["bytes"] += counts["bytes"]
+            batches += 1
+            if policy.pause_seconds:
+                time.sleep(policy.pause_seconds)
+
+        yield compaction_progress(totals, batches, last_application_id, started, dry_run, "running")
+
+    yield compaction_progress(totals, batches, last_application_id, started, dry_run, "completed")
+
+
+def compaction_progress(
+    totals: Dict, batches: int, last_application_id: int, started: float, dry_run: bool, status: str
+) -> Dict:
+    return {
+        "status": status,
+        "dry_run": dry_run,
+        "batches": batches,
+        "last_application_id": last_application_id,
+        "tables": {table: dict(counts) for table, counts in totals.items()},
+        "rows_reclaimed": sum(counts["rows"] for counts in totals.values()),
+        "bytes_reclaimed": sum(counts["bytes"] for counts in totals.values()),
+        "elapsed_seconds": round(time.perf_counter() - started, 3)
+    }
@@ -0,0 +1,120 @@
+import re
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+SKILL_MASK_CACHE_SIZE = 4096
+SKILL_VOCABULARY_MAX_SIZE = 65536
+
+SKILL_ALIASES = {
+    "js": "javascript",
+    "java script": "javascript",
+    "ecmascript": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "python3": "python",
+    "golang": "go",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "k8s": "kubernetes",
+    "react.js": "react",
+    "reactjs": "react",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "vue.js": "vue",
+    "vuejs": "vue",
+    "c sharp": "c#",
+    "csharp": "c#",
+    "cpp": "c++",
+    "ml": "machine learning",
+    "aws cloud": "aws",
+    "amazon web services": "aws",
+    "gcp": "google cloud",
+}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_skill(skill, aliases: Dict[str, str] = SKILL_ALIASES) -> str:
+    normalized = _WHITESPACE.sub(" ", str(skill).strip().lower())
+    return aliases.get(normalized, normalized)
+
+
+class SkillVocabulary:
+
+    def __init__(self, aliases: Dict[str, str] = None, max_size: int = SKILL_VOCABULARY_MAX_SIZE):
+        self.aliases = SKILL_ALIASES if aliases is None else aliases
+        self.max_size = max_size
+        self._ids: Dict[str, int] = {}
+        self._skills: List[str] = []
+        self._masks: Dict[Tuple, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._skills)
+
+    def intern(self, skill) -> int:
+        with self._lock:
+            self._ensure_capacity()
+            return self._intern(skill)
+
+    def skill(self, skill_id: int) -> str:
+        return self._skills[skill_id]
+
+    def mask(self, skills: Iterable) -> int:
+        return self.masks(skills)[0]
+
+    def masks(self, *skill_lists: Iterable) -> List[int]:
+        with self._lock:
+            self._ensure_capacity()
+            return [self._mask(tuple(skills)) for skills in skill_lists]
+
+    def skills(self, mask: int) -> List[str]:
+        return [self._skills[skill_id] for skill_id in range(mask.bit_length()) if mask >> skill_id & 1]
+
+    def _ensure_capacity(self):
+        if len(self._skills) >= self.max_size:
+            self._ids = {}
+            self._skills = []
+            self._masks = {}
+
+    def _intern(self, skill) -> int:
+        normalized = normalize_skill(skill, self.aliases)
+        skill_id = self._ids.get(normalized)
+        if skill_id is None:
+            skill_id = len(self._skills)
+            self._ids[normalized] = skill_id
+            self._skills.append(normalized)
+        return skill_id
+
+    def _mask(self, key: Tuple) -> int:
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = 0
+            for skill in key:
+                mask |= 1 << self._intern(skill)
+            if len(self._masks) >= SKILL_MASK_CACHE_SIZE:
+                self._masks.clear()
+            self._masks[key] = mask
+        return mask
+
+
+def count_bits(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+def covers_all(candidate_mask: int, required_mask: int) -> bool:
+    return required_mask & ~candidate_mask == 0
+
+
+def covers_any(candidate_mask: int, required_mask: int) -> bool:
+    return candidate_mask & required_mask != 0
+
+
+def coverage(candidate_mask: int, required_mask: int) -> float:
+    required_count = count_bits(required_mask)
+    if required_count == 0:
+        return 1.0
+    return count_bits(candidate_mask & required_mask) / required_count
+
+
+SKILL_VOCABULARY = SkillVocabulary()
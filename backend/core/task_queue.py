@@ -0,0 +1,292 @@
+import json
+import os
+import socket
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import Session
+
+from models import QueuedTasks
+
+TASK_SCORE_APPLICATION = "score_application"
+TASK_PREPARE_INTERVIEW = "prepare_interview"
+
+QUEUE_WORKERS = 2
+QUEUE_CLAIM_BATCH = 5
+QUEUE_POLL_SECONDS = 1.0
+QUEUE_VISIBILITY_TIMEOUT = 300
+QUEUE_MAX_ATTEMPTS = 5
+QUEUE_RETRY_BASE_SECONDS = 5
+QUEUE_RETRY_MAX_SECONDS = 600
+VISIBILITY_TIMEOUT_ERROR = "Visibility timeout expired on the final attempt"
+
+TaskHandler = Callable[[Session, Dict], Optional[Dict]]
+
+_tasks = QueuedTasks.__table__
+_pool: Optional["TaskWorkerPool"] = None
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def retry_delay(attempts: int) -> int:
+    return min(QUEUE_RETRY_MAX_SECONDS, QUEUE_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0))
+
+
+def enqueue_task(
+    db: Session,
+    task_type: str,
+    payload: Dict,
+    task_key: Optional[str] = None,
+    delay_seconds: float = 0,
+    max_attempts: int = QUEUE_MAX_ATTEMPTS
+) -> QueuedTasks:
+    task = QueuedTasks(
+        task_type=task_type,
+        task_key=task_key,
+        payload=json.dumps(payload),
+        status="pending",
+        attempts=0,
+        max_attempts=max_attempts,
+        run_after=_now() + timedelta(seconds=delay_seconds)
+    )
+    db.add(task)
+    return task
+
+
+def claim_tasks(
+    db: Session,
+    worker_id: str,
+    limit: int = QUEUE_CLAIM_BATCH,
+    visibility_timeout: float = QUEUE_VISIBILITY_TIMEOUT,
+    task_types: Optional[List[str]] = None
+) -> List[Dict]:
+    now = _now()
+    expired = and_(_tasks.c.status == "running", _tasks.c.locked_until < now)
+
+    db.execute(
+        update(_tasks).where(expired, _tasks.c.attempts >= _tasks.c.max_attempts).values(
+            status="failed", last_error=VISIBILITY_TIMEOUT_ERROR, locked_by=None, locked_until=None, finished_at=now
+        )
+    )
+
+    claimable = select(_tasks.c.task_id).where(
+        or_(and_(_tasks.c.status == "pending", _tasks.c.run_after <= now), expired)
+    )
+    if task_types is not None:
+        claimable = claimable.where(_tasks.c.task_type.in_(task_types))
+    claimable = claimable.order_by(_tasks.c.run_after, _tasks.c.task_id).limit(limit).with_for_update(skip_locked=True)
+
+    rows = db.execute(
+        update(_tasks).where(_tasks.c.task_id.in_(claimable)).values(
+            status="running",
+            attempts=_tasks.c.attempts + 1,
+            locked_by=worker_id,
+            locked_until=now + timedelta(seconds=visibility_timeout)
+        ).returning(_tasks.c.task_id, _tasks.c.task_type, _tasks.c.payload, _tasks.c.attempts, _tasks.c.max_attempts)
+    ).mappings().all()
+    db.commit()
+
+    tasks = [{**row, "payload": json.loads(row["payload"])} for row in rows]
+    return sorted(tasks, key=lambda task: task["task_id"])
+
+
+def extend_lease(db: Session, task: Dict, visibility_timeout: float = QUEUE_VISIBILITY_TIMEOUT) -> bool:
+    extended = db.execute(
+        update(_tasks).where(
+            _tasks.c.task_id == task["task_id"],
+            _tasks.c.status == "running",
+            _tasks.c.attempts == task["attempts"]
+        ).values(locked_until=_now() + timedelta(seconds=visibility_timeout))
+    )
+    db.commit()
+    return extended.rowcount == 1
+
+
+def _release(db: Session, task: Dict, **values) -> bool:
+    released = db.execute(
+        update(_tasks).where(
+            _tasks.c.task_id == task["task_id"],
+            _tasks.c.status == "running",
+            _tasks.c.attempts == task["attempts"]
+        ).values(locked_by=None, locked_until=None, **values)
+    )
+    db.commit()
+    return released.rowcount == 1
+
+
+def complete_task(db: Session, task: Dict, result: Optional[Dict] = None) -> bool:
+    return _release(
+        db, task,
+        status="done",
+        result=json.dumps(result) if result is not None else None,
+        last_error=None,
+        finished_at=_now()
+    )
+
+
+def fail_task(db: Session, task: Dict, error: str) -> bool:
+    if task["attempts"] >= task["max_attempts"]:
+        _release(db, task, status="failed", last_error=error, finished_at=_now())
+        return True
+
+    _release(db, task, status="pending", last_error=error, run_after=_now() + timedelta(seconds=retry_delay(task["attempts"])))
+    return False
+
+
+def get_queue_depth(db: Session) -> Dict[str, Dict]:
+    now = _now()
+    ready = and_(_tasks.c.status == "pending", _tasks.c.run_after <= now)
+
+    rows = db.execute(
+        select(
+            _tasks.c.task_type,
+            func.count().filter(ready).label("ready"),
+            func.count().filter(and_(_tasks.c.status == "pending", _tasks.c.run_after > now)).label("scheduled"),
+            func.count().filter(_tasks.c.status == "running").label("running"),
+            func.count().filter(_tasks.c.status == "failed").label("failed"),
+            func.min(_tasks.c.run_after).filter(ready).label("oldest_ready_at")
+        ).where(_tasks.c.status != "done").group_by(_tasks.c.task_type)
+    ).mappings().all()
+
+    depth = {}
+    for row in rows:
+        oldest = row["oldest_ready_at"]
+        if oldest is not None and oldest.tzinfo is None:
+            oldest = oldest.replace(tzinfo=timezone.utc)
+        depth[row["task_type"]] = {
+            "ready": row["ready"],
+            "scheduled": row["scheduled"],
+            "running": row["running"],
+            "failed": row["failed"],
+            "oldest_ready_seconds": round((now - oldest).total_seconds(), 3) if oldest is not None else None
+        }
+    return depth
+
+
+class TaskWorkerPool:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        handlers: Dict[str, TaskHandler],
+        workers: int = QUEUE_WORKERS,
+        poll_seconds: float = QUEUE_POLL_SECONDS,
+        visibility_timeout: float = QUEUE_VISIBILITY_TIMEOUT,
+        claim_batch: int = QUEUE_CLAIM_BATCH
+    ):
+        self.session_factory = session_factory
+        self.handlers = handlers
+        self.workers = workers
+        self.poll_seconds = poll_seconds
+        self.visibility_timeout = visibility_timeout
+        self.claim_batch = claim_batch
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._metrics = defaultdict(lambda: {"completed": 0, "retried": 0, "failed": 0, "seconds": 0.0})
+
+    def start(self):
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run, args=(f"{self.name}-{index}",), name=f"task-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def notify(self):
+        self._wake.set()
+
+    def run_once(self, worker_id: Optional[str] = None) -> int:
+        db = self.session_factory()
+        try:
+            tasks = claim_tasks(db, worker_id or self.name, self.claim_batch, self.visibility_timeout, list(self.handlers))
+            for position, task in enumerate(tasks):
+                # the batch shares one lease, so renew it before each later task or skip a task another worker reclaimed
+                if position and not extend_lease(db, task, self.visibility_timeout):
+                    continue
+                self._execute(db, task)
+            return len(tasks)
+        finally:
+            db.close()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            tasks = {task_type: dict(metrics) for task_type, metrics in self._metrics.items()}
+        for metrics in tasks.values():
+            handled = metrics["completed"] + metrics["retried"] + metrics["failed"]
+            metrics["average_seconds"] = round(metrics.pop("seconds") / handled, 4) if handled else None
+
+        return {
+            "workers": self.workers,
+            "alive": sum(thread.is_alive() for thread in self._threads),
+            "tasks": tasks
+        }
+
+    def _run(self, worker_id: str):
+        while not self._stop.is_set():
+            try:
+                processed = self.run_once(worker_id)
+            except Exception as e:
+                print(f"Task worker {worker_id} failed to claim tasks: {e}")
+                processed = 0
+
+            if not processed:
+                self._wake.wait(self.poll_seconds)
+                self._wake.clear()
+
+    def _execute(self, db: Session, task: Dict):
+        started = time.perf_counter()
+        try:
+            result = self.handlers[task["task_type"]](db, task["payload"])
+        except Exception as e:
+            db.rollback()
+            outcome = "failed" if fail_task(db, task, f"{type(e).__name__}: {e}") else "retried"
+        else:
+            complete_task(db, task, result)
+            outcome = "completed"
+
+        with self._lock:
+            metrics = self._metrics[task["task_type"]]
+            metrics[outcome] += 1
+            metrics["seconds"] += time.perf_counter() - started
+
+
+def start_task_workers(
+    session_factory: Callable[[], Session],
+    handlers: Dict[str, TaskHandler],
+    workers: int = QUEUE_WORKERS
+) -> TaskWorkerPool:
+    global _pool
+    if _pool is None:
+        _pool = TaskWorkerPool(session_factory, handlers, workers)
+        _pool.start()
+    return _pool
+
+
+def get_task_workers() -> Optional[TaskWorkerPool]:
+    return _pool
+
+
+def notify_task_workers():
+    if _pool is not None:
+        _pool.notify()
+
+
+def shutdown_task_workers(timeout: Optional[float] = None):
+    global _pool
+    if _pool is not None:
+        _pool.stop(timeout)
+        _pool = None
@@ -0,0 +1,37 @@
+import argparse
+import json
+
+from core.config import settings
+from core.db import Database
+from core.bulk_rescore import shutdown_rescore_pool
+from services.import_service import import_applications_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import applications from a JSONL file or a zip of PDFs with a manifest")
+    parser.add_argument("path")
+    parser.add_argument("--job-id", type=int, default=None)
+    parser.add_argument("--prepare-interviews", action="store_true")
+    args = parser.parse_args()
+
+    database = Database(
+        dbtype=settings.DB_TYPE,
+        dbname=settings.DB_NAME,
+        user=settings.DB_USER,
+        password=settings.DB_PASSWORD,
+        host=settings.DB_HOST,
+        port=settings.DB_PORT
+    )
+
+    db = database.get_session()
+    try:
+        with open(args.path, "rb") as stream:
+            summary = import_applications_file(db, stream, args.path, args.job_id, args.prepare_interviews)
+        print(json.dumps(summary, indent=2))
+    finally:
+        db.close()
+        shutdown_rescore_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,9 @@ from contextlib import asynccontextmanager
 from core.llm import LLM
 from api.router import router 
 from core.db import Database
+from core.bulk_rescore import shutdown_rescore_pool
+from core.task_queue import start_task_workers, shutdown_task_workers
+from services import build_task_handlers
 from models import Base
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -30,7 +33,12 @@ async def lifespan(app: FastAPI):
     
     Base.metadata.create_all(bind=app.state.db.engine) 
     
+    start_task_workers(app.state.db.get_session, build_task_handlers(app.state.llm))
+    
     yield
+    
+    shutdown_task_workers()
+    shutdown_rescore_pool()
 
 app = FastAPI(lifespan=lifespan)
 app.include_router(router, prefix="/api")
@@ -41,6 +49,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 if __name__ == "__main__":
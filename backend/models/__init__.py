@@ -12,7 +12,9 @@ from .user import Users
 from .job import Jobs
 from .application import Applications
 from .chat import ChatSessions, ChatMessages
-from .scoring import ScoringResults, ScoringBreakdown, ScoringJudgments
+from .scoring import ScoringResults, ScoringBreakdown, ScoringJudgments, ScoringConfigSnapshots, JobScoringStats
+from .rescore import RescoreRuns
+from .queue import QueuedTasks
 
 __all__ = [
     "Base",
@@ -32,4 +34,8 @@ __all__ = [
     "ScoringResults",
     "ScoringBreakdown",
     "ScoringJudgments",
+    "ScoringConfigSnapshots",
+    "JobScoringStats",
+    "RescoreRuns",
+    "QueuedTasks",
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Text, Float, ForeignKey, Enum as SAEnum
+from sqlalchemy import Column, Integer, Text, Float, ForeignKey, Index, Enum as SAEnum
 from sqlalchemy.orm import relationship
 
 from .base import Base, TimestampMixin
@@ -7,6 +7,10 @@ from .enums import ApplicationStatus
 
 class Applications(Base, TimestampMixin):
     __tablename__ = "applications"
+    __table_args__ = (
+        Index("ix_applications_created_at_id", "created_at", "application_id"),
+        Index("ix_applications_job_created_at_id", "job_id", "created_at", "application_id"),
+    )
 
     application_id = Column(Integer, primary_key=True, autoincrement=True)
 
@@ -29,6 +33,12 @@ class Applications(Base, TimestampMixin):
     reviewed_by = relationship("Users", back_populates="reviewed_applications", foreign_keys=[reviewed_by_id])
 
     score = Column(Float, nullable=True) 
+    latest_scoring_id = Column(
+        Integer,
+        ForeignKey("scoring_results.scoring_id", ondelete="SET NULL", use_alter=True, name="fk_applications_latest_scoring_id"),
+        nullable=True
+    )
+    latest_scoring = relationship("ScoringResults", foreign_keys=[latest_scoring_id], post_update=True)
 
     def __repr__(self):
         return f"<Application(id={self.application_id}, job_id={self.job_id}, user_id={self.user_id}, status={self.application_status})>"
@@ -10,7 +10,7 @@ class ChatSessions(Base, TimestampMixin):
 
     session_id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
-    application_id = Column(Integer, ForeignKey("applications.application_id", ondelete="CASCADE"), nullable=True)
+    application_id = Column(Integer, ForeignKey("applications.application_id", ondelete="CASCADE"), nullable=True, index=True)
     
     session_title = Column(String(255), nullable=True)
     is_active = Column(Boolean, default=True)
@@ -27,7 +27,7 @@ class ChatMessages(Base, TimestampMixin):
     __tablename__ = "chat_messages"
 
     message_id = Column(Integer, primary_key=True, autoincrement=True)
-    session_id = Column(Integer, ForeignKey("chat_sessions.session_id", ondelete="CASCADE"), nullable=False)
+    session_id = Column(Integer, ForeignKey("chat_sessions.session_id", ondelete="CASCADE"), nullable=False, index=True)
     
     message_type = Column(SAEnum(MessageType, name="message_type_enum"), nullable=False)
     content = Column(Text, nullable=False)
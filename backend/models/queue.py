@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
+
+from .base import Base, TimestampMixin
+
+
+class QueuedTasks(Base, TimestampMixin):
+    __tablename__ = "queued_tasks"
+    __table_args__ = (
+        Index("ix_queued_tasks_status_run_after", "status", "run_after", "task_id"),
+    )
+
+    task_id = Column(Integer, primary_key=True, autoincrement=True)
+    task_type = Column(String(50), nullable=False)
+    task_key = Column(String(100), nullable=True, index=True)
+    payload = Column(Text, nullable=False)
+
+    status = Column(String(20), nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    run_after = Column(DateTime(timezone=True), nullable=False)
+    locked_by = Column(String(100), nullable=True)
+    locked_until = Column(DateTime(timezone=True), nullable=True)
+
+    result = Column(Text, nullable=True)
+    last_error = Column(Text, nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<QueuedTask(task_id={self.task_id}, task_type={self.task_type}, status={self.status}, attempts={self.attempts})>"
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, Text, Float, ForeignKey, DateTime
+from sqlalchemy.orm import relationship
+
+from .base import Base, TimestampMixin
+
+
+class RescoreRuns(Base, TimestampMixin):
+    __tablename__ = "rescore_runs"
+
+    run_id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(Integer, ForeignKey("jobs.job_id", ondelete="CASCADE"), nullable=False, index=True)
+
+    status = Column(String(20), nullable=False, default="pending")
+    rules_config = Column(Text, nullable=False)
+
+    total = Column(Integer, nullable=False, default=0)
+    done = Column(Integer, nullable=False, default=0)
+    last_application_id = Column(Integer, nullable=False, default=0)
+    elapsed_seconds = Column(Float, nullable=False, default=0.0)
+    error = Column(Text, nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    job = relationship("Jobs")
+
+    def __repr__(self):
+        return f"<RescoreRun(run_id={self.run_id}, job_id={self.job_id}, status={self.status}, done={self.done}/{self.total})>"
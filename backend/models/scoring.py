@@ -8,7 +8,7 @@ class ScoringResults(Base, TimestampMixin):
     __tablename__ = "scoring_results"
 
     scoring_id = Column(Integer, primary_key=True, autoincrement=True)
-    application_id = Column(Integer, ForeignKey("applications.application_id", ondelete="CASCADE"), nullable=False)
+    application_id = Column(Integer, ForeignKey("applications.application_id", ondelete="CASCADE"), nullable=False, index=True)
     
     primary_score = Column(Float, nullable=False)
     secondary_score = Column(Float, nullable=False)
@@ -19,18 +19,32 @@ class ScoringResults(Base, TimestampMixin):
     
     rules_config = Column(Text, nullable=True) 
     scoring_config = Column(Text, nullable=True)
+    config_snapshot_id = Column(Integer, ForeignKey("scoring_config_snapshots.snapshot_id"), nullable=True)
+    primary_fingerprint = Column(String(64), nullable=True)
+    result_fingerprint = Column(String(64), nullable=True, index=True)
     
-    application = relationship("Applications", backref="scoring_results")
+    application = relationship("Applications", backref="scoring_results", foreign_keys=[application_id])
 
     def __repr__(self):
         return f"<ScoringResult(scoring_id={self.scoring_id}, application_id={self.application_id}, final_score={self.final_score}, decision={self.decision})>"
 
 
+class ScoringConfigSnapshots(Base, TimestampMixin):
+    __tablename__ = "scoring_config_snapshots"
+
+    snapshot_id = Column(Integer, primary_key=True, autoincrement=True)
+    config_hash = Column(String(32), nullable=False, unique=True)
+    content = Column(Text, nullable=False)
+
+    def __repr__(self):
+        return f"<ScoringConfigSnapshot(snapshot_id={self.snapshot_id}, config_hash={self.config_hash})>"
+
+
 class ScoringBreakdown(Base, TimestampMixin):
     __tablename__ = "scoring_breakdown"
 
     breakdown_id = Column(Integer, primary_key=True, autoincrement=True)
-    scoring_id = Column(Integer, ForeignKey("scoring_results.scoring_id", ondelete="CASCADE"), nullable=False)
+    scoring_id = Column(Integer, ForeignKey("scoring_results.scoring_id", ondelete="CASCADE"), nullable=False, index=True)
     
     criterion_name = Column(String(100), nullable=False)
     category = Column(String(20), nullable=False)
@@ -38,6 +52,9 @@ class ScoringBreakdown(Base, TimestampMixin):
     passed = Column(Boolean, nullable=False)
     points_awarded = Column(Float, nullable=False)
     notes = Column(Text, nullable=True)
+    coverage = Column(Float, nullable=True)
+    candidate_value = Column(Float, nullable=True)
+    job_value = Column(Float, nullable=True)
     
     scoring_result = relationship("ScoringResults", backref="breakdown")
 
@@ -49,7 +66,7 @@ class ScoringJudgments(Base, TimestampMixin):
     __tablename__ = "scoring_judgments"
 
     judgment_id = Column(Integer, primary_key=True, autoincrement=True)
-    scoring_id = Column(Integer, ForeignKey("scoring_results.scoring_id", ondelete="CASCADE"), nullable=False)
+    scoring_id = Column(Integer, ForeignKey("scoring_results.scoring_id", ondelete="CASCADE"), nullable=False, index=True)
     
     question_id = Column(String(100), nullable=False)
     category = Column(String(20), nullable=False)
@@ -59,3 +76,38 @@ class ScoringJudgments(Base, TimestampMixin):
 
     def __repr__(self):
         return f"<ScoringJudgment(judgment_id={self.judgment_id}, question_id={self.question_id}, category={self.category})>"
+
+
+class JobScoringStats(Base, TimestampMixin):
+    __tablename__ = "job_scoring_stats"
+
+    job_id = Column(Integer, ForeignKey("jobs.job_id", ondelete="CASCADE"), primary_key=True)
+
+    scored_count = Column(Integer, nullable=False, default=0)
+    passed_count = Column(Integer, nullable=False, default=0)
+    rejected_count = Column(Integer, nullable=False, default=0)
+    score_sum = Column(Float, nullable=False, default=0.0)
+    score_sum_squares = Column(Float, nullable=False, default=0.0)
+
+    status_submitted = Column(Integer, nullable=False, default=0)
+    status_viewed = Column(Integer, nullable=False, default=0)
+    status_shortlisted = Column(Integer, nullable=False, default=0)
+    status_rejected = Column(Integer, nullable=False, default=0)
+    status_offered = Column(Integer, nullable=False, default=0)
+    status_hired = Column(Integer, nullable=False, default=0)
+
+    histogram_0 = Column(Integer, nullable=False, default=0)
+    histogram_1 = Column(Integer, nullable=False, default=0)
+    histogram_2 = Column(Integer, nullable=False, default=0)
+    histogram_3 = Column(Integer, nullable=False, default=0)
+    histogram_4 = Column(Integer, nullable=False, default=0)
+    histogram_5 = Column(Integer, nullable=False, default=0)
+    histogram_6 = Column(Integer, nullable=False, default=0)
+    histogram_7 = Column(Integer, nullable=False, default=0)
+    histogram_8 = Column(Integer, nullable=False, default=0)
+    histogram_9 = Column(Integer, nullable=False, default=0)
+
+    scoring_version = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<JobScoringStats(job_id={self.job_id}, scored_count={self.scored_count}, passed_count={self.passed_count})>"
@@ -0,0 +1,40 @@
+import argparse
+import json
+
+from core.config import settings
+from core.db import Database
+from core.bulk_rescore import shutdown_rescore_pool
+from services.rescore_service import start_job_rescore, run_job_rescore
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rescore every application of a job")
+    parser.add_argument("job_id", type=int)
+    parser.add_argument("--rules-config", type=json.loads, default=None)
+    parser.add_argument("--restart", action="store_true")
+    args = parser.parse_args()
+
+    database = Database(
+        dbtype=settings.DB_TYPE,
+        dbname=settings.DB_NAME,
+        user=settings.DB_USER,
+        password=settings.DB_PASSWORD,
+        host=settings.DB_HOST,
+        port=settings.DB_PORT
+    )
+
+    db = database.get_session()
+    try:
+        run = start_job_rescore(db, args.job_id, args.rules_config, args.restart)
+        for progress in run_job_rescore(db, run):
+            print(
+                f"[run {progress['run_id']}] {progress['status']}: {progress['done']}/{progress['total']} "
+                f"eta {progress['eta_seconds']}s"
+            )
+    finally:
+        db.close()
+        shutdown_rescore_pool()
+
+
+if __name__ == "__main__":
+    main()
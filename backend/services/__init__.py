@@ -4,11 +4,16 @@ from .application_service import (
     get_application_by_id, 
     get_chat_sessions_for_application, 
     get_messages_for_session,
+    get_messages_for_application,
+    get_recruiter_applications_with_chat_data,
+    list_applications,
     format_chat_message_response,
     extract_pdf_text_content,
     update_application_status,
     auto_score_application,
-    get_application_discrepancies
+    score_application_with_defaults,
+    get_application_discrepancies,
+    extract_discrepancies
 )
 from .chat_service import (
     save_message,
@@ -32,13 +37,41 @@ from .scoring_service import (
     update_application_status,
     create_scoring_response,
     score_application_with_data,
+    rescore_application_with_answers,
     score_application_custom,
     get_scoring_config_data,
     get_recruiter_dashboard_data,
     get_application_scoring_details_data,
     get_application_scoring_summary_data,
-    get_scoring_insights_data
+    get_scoring_insights_data,
+    get_recruiter_match_matrix,
+    get_recruiter_match_matrix_data,
+    get_what_if_data,
+    get_job_stats_data,
+    get_pass_rate_data,
+    get_pass_rate_curve_data,
+    get_scoring_cache_stats
 )
+from .rescore_service import (
+    start_job_rescore,
+    run_job_rescore,
+    stream_job_rescore,
+    get_rescore_run_data
+)
+from .export_service import (
+    validate_export_options,
+    export_filename,
+    export_media_type,
+    stream_applications_export
+)
+from .task_service import (
+    enqueue_application_intake,
+    build_task_handlers,
+    get_prepared_interview,
+    get_task_data,
+    get_queue_stats_data
+)
+from .import_service import import_applications_file
 
 __all__ = [
     "get_job_by_id",
@@ -55,11 +88,16 @@ __all__ = [
     "get_application_by_id",
     "get_chat_sessions_for_application",
     "get_messages_for_session",
+    "get_messages_for_application",
+    "get_recruiter_applications_with_chat_data",
+    "list_applications",
     "format_chat_message_response",
     "extract_pdf_text_content",
     "update_application_status",
     "auto_score_application",
+    "score_application_with_defaults",
     "get_application_discrepancies",
+    "extract_discrepancies",
     "save_message",
     "create_message_response",
     "get_session_messages",
@@ -79,10 +117,32 @@ __all__ = [
     "update_application_status",
     "create_scoring_response",
     "score_application_with_data",
+    "rescore_application_with_answers",
     "score_application_custom",
     "get_scoring_config_data",
     "get_recruiter_dashboard_data",
     "get_application_scoring_details_data",
     "get_application_scoring_summary_data",
-    "get_scoring_insights_data"
+    "get_scoring_insights_data",
+    "get_recruiter_match_matrix",
+    "get_recruiter_match_matrix_data",
+    "get_what_if_data",
+    "get_job_stats_data",
+    "get_pass_rate_data",
+    "get_pass_rate_curve_data",
+    "get_scoring_cache_stats",
+    "start_job_rescore",
+    "run_job_rescore",
+    "stream_job_rescore",
+    "get_rescore_run_data",
+    "validate_export_options",
+    "export_filename",
+    "export_media_type",
+    "stream_applications_export",
+    "enqueue_application_intake",
+    "build_task_handlers",
+    "get_prepared_interview",
+    "get_task_data",
+    "get_queue_stats_data",
+    "import_applications_file"
 ]
@@ -1,8 +1,13 @@
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.orm import Session
-from models import Applications, ApplicationStatus, ChatSessions, ChatMessages, MessageType
+from models import Applications, ApplicationStatus, ChatSessions, ChatMessages, Jobs, MessageType
 from fastapi import HTTPException
-from core.scoring import ScoringEngine, CriterionCategory
-from core.scoring_db import save_scoring_result
+from core.scoring import ScoringEngine
+from core.job_stats import set_application_status
+from core.pagination import encode_cursor, decode_cursor
+from core.scoring_cache import score_with_cache
 import json
 import PyPDF2
 import pdfplumber
@@ -13,6 +18,12 @@ NO_CHAT_HISTORY_MSG = "No chat history found for this application"
 PDF_FILE_EXTENSION = ".pdf"
 PDF_EXTRACTION_ERROR_MSG = "Could not extract text from PDF. The PDF might be image-based or corrupted."
 PDF_ONLY_ERROR_MSG = "Only PDF files are allowed"
+MESSAGE_PREVIEW_LENGTH = 100
+RECOMMENDED_SCORE = 80.0
+APPLICATION_FIELDS = [
+    "application_id", "job_id", "user_id", "cv", "cover_letter",
+    "application_status", "reviewed_by_id", "score"
+]
 
 DEFAULT_SCORING_RULES = {
     "location_relocation": "PREFERABLE",
@@ -41,6 +52,182 @@ def get_messages_for_session(db: Session, session_id: int) -> list[ChatMessages]
         ChatMessages.session_id == session_id
     ).order_by(ChatMessages.created_at.asc()).all()
 
+def get_messages_for_application(db: Session, application_id: int) -> list[ChatMessages]:
+    return db.query(ChatMessages).join(ChatMessages.session).filter(
+        ChatSessions.application_id == application_id
+    ).order_by(ChatMessages.session_id, ChatMessages.created_at.asc(), ChatMessages.message_id).all()
+
+def parse_application_fields(fields: Optional[str]) -> List[str]:
+    if not fields:
+        return APPLICATION_FIELDS
+    
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in APPLICATION_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(APPLICATION_FIELDS)}"
+        )
+    return list(dict.fromkeys(requested))
+
+def list_applications(
+    db: Session,
+    job_id: Optional[int] = None,
+    recruiter_id: Optional[int] = None,
+    min_score: Optional[float] = None,
+    max_score: Optional[float] = None,
+    recommended_only: bool = False,
+    sort: str = "recent",
+    fields: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> tuple[list[dict], Optional[str]]:
+    selected = parse_application_fields(fields)
+    
+    if sort == "score":
+        sort_key = func.coalesce(Applications.score, -1.0)
+        types = [float, int]
+    else:
+        sort_key = Applications.created_at
+        types = [datetime, int]
+    try:
+        after = decode_cursor(cursor, sort, types)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    query = select(
+        *[getattr(Applications, field) for field in selected],
+        sort_key.label("sort_key"),
+        Applications.application_id.label("sort_id")
+    )
+    if job_id is not None:
+        query = query.where(Applications.job_id == job_id)
+    if recruiter_id is not None:
+        query = query.join(Jobs, Jobs.job_id == Applications.job_id).where(Jobs.poster_id == recruiter_id)
+    
+    if recommended_only:
+        query = query.where(Applications.score >= RECOMMENDED_SCORE)
+    elif min_score is not None:
+        query = query.where(Applications.score >= min_score)
+    if max_score is not None:
+        query = query.where(Applications.score <= max_score)
+    
+    if after is not None:
+        query = query.where(tuple_(sort_key, Applications.application_id) < tuple_(*after))
+    query = query.order_by(sort_key.desc(), Applications.application_id.desc())
+    if limit is not None:
+        query = query.limit(limit + 1)
+    
+    rows = db.execute(query).all()
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(sort, [rows[-1].sort_key, rows[-1].sort_id])
+    
+    applications = []
+    for row in rows:
+        application = {field: getattr(row, field) for field in selected}
+        if "application_status" in application:
+            application["application_status"] = application["application_status"].value
+        applications.append(application)
+    
+    return applications, next_cursor
+
+def get_recruiter_applications_with_chat_data(
+    db: Session,
+    recruiter_id: int,
+    limit: int = 50,
+    cursor: Optional[str] = None
+) -> dict:
+    try:
+        after = decode_cursor(cursor, "recent", [datetime, int])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    recruiter_applications = select(Applications.application_id).join(Jobs).where(Jobs.poster_id == recruiter_id)
+    page = select(
+        Applications.application_id, Applications.job_id, Applications.user_id,
+        Applications.application_status, Applications.score, Applications.created_at
+    ).join(Jobs).where(Jobs.poster_id == recruiter_id)
+    if after is not None:
+        page = page.where(tuple_(Applications.created_at, Applications.application_id) < tuple_(*after))
+    page = page.order_by(Applications.created_at.desc(), Applications.application_id.desc()).limit(limit + 1).cte("page")
+    
+    counts = select(
+        ChatSessions.application_id,
+        func.count(func.distinct(ChatSessions.session_id)).label("total_sessions"),
+        func.count(ChatMessages.message_id).label("total_messages")
+    ).outerjoin(ChatMessages, ChatMessages.session_id == ChatSessions.session_id).where(
+        ChatSessions.application_id.in_(select(page.c.application_id))
+    ).group_by(ChatSessions.application_id).subquery()
+    
+    ranked = select(
+        ChatSessions.application_id,
+        ChatMessages.created_at.label("last_message_at"),
+        ChatMessages.message_type.label("last_message_type"),
+        func.substr(ChatMessages.content, 1, MESSAGE_PREVIEW_LENGTH + 1).label("last_message_preview"),
+        func.row_number().over(
+            partition_by=ChatSessions.application_id,
+            order_by=(
+                ChatSessions.created_at.desc(), ChatSessions.session_id.desc(),
+                ChatMessages.created_at.desc(), ChatMessages.message_id.desc()
+            )
+        ).label("position")
+    ).outerjoin(ChatMessages, ChatMessages.session_id == ChatSessions.session_id).where(
+        ChatSessions.application_id.in_(select(page.c.application_id))
+    ).subquery()
+    latest = select(ranked).where(ranked.c.position == 1).subquery()
+    
+    rows = db.execute(
+        select(
+            page,
+            func.coalesce(counts.c.total_sessions, 0).label("total_sessions"),
+            func.coalesce(counts.c.total_messages, 0).label("total_messages"),
+            latest.c.last_message_at, latest.c.last_message_type, latest.c.last_message_preview,
+            select(func.count()).select_from(recruiter_applications.subquery()).scalar_subquery().label("total_applications")
+        ).outerjoin(counts, counts.c.application_id == page.c.application_id).outerjoin(
+            latest, latest.c.application_id == page.c.application_id
+        ).order_by(page.c.created_at.desc(), page.c.application_id.desc())
+    ).all()
+    
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor("recent", [rows[-1].created_at, rows[-1].application_id])
+    
+    applications_with_chat = []
+    for row in rows:
+        latest_chat_activity = None
+        if row.last_message_at is not None:
+            preview = row.last_message_preview
+            latest_chat_activity = {
+                "last_message_at": row.last_message_at.isoformat(),
+                "last_message_type": row.last_message_type.value,
+                "last_message_preview": preview[:MESSAGE_PREVIEW_LENGTH] + "..." if len(preview) > MESSAGE_PREVIEW_LENGTH else preview
+            }
+        
+        applications_with_chat.append({
+            "application_id": row.application_id,
+            "job_id": row.job_id,
+            "user_id": row.user_id,
+            "application_status": row.application_status.value,
+            "score": row.score,
+            "created_at": row.created_at.isoformat(),
+            "chat_summary": {
+                "total_sessions": row.total_sessions,
+                "total_messages": row.total_messages,
+                "has_chat_history": row.total_messages > 0,
+                "latest_activity": latest_chat_activity
+            }
+        })
+    
+    return {
+        "recruiter_id": recruiter_id,
+        "total_applications": rows[0].total_applications if rows else 0,
+        "next_cursor": next_cursor,
+        "applications_with_chat": applications_with_chat
+    }
+
 def format_chat_message_response(msg: ChatMessages):
     return {
         "message_id": msg.message_id,
@@ -77,71 +264,61 @@ def extract_pdf_text_content(pdf_content: bytes) -> str:
     
     return extracted_text.strip()
 
-def update_application_status(application: Applications, decision: str):
+def update_application_status(db: Session, application: Applications, decision: str, pending: Optional[List] = None):
     if decision == "REJECT":
-        application.application_status = ApplicationStatus.rejected
+        set_application_status(db, application, ApplicationStatus.rejected, pending)
     elif decision == "PASS":
-        application.application_status = ApplicationStatus.shortlisted
+        set_application_status(db, application, ApplicationStatus.shortlisted, pending)
+
+def score_application_with_defaults(db: Session, application: Applications, job_description: dict, candidate: dict) -> dict:
+    engine = ScoringEngine()
+    
+    scoring_id, report, cached = score_with_cache(
+        db, application.application_id, engine, job_description, candidate, DEFAULT_SCORING_RULES, []
+    )
+    
+    application.score = report.final_score
+    update_application_status(db, application, report.decision)
+    
+    db.commit()
+    
+    return {
+        "scoring_id": scoring_id,
+        "final_score": report.final_score,
+        "decision": report.decision,
+        "summary": report.summary,
+        "cached": cached
+    }
 
 def auto_score_application(db: Session, application_id: int, job_description: dict, candidate: dict):
     try:
         application = get_application_by_id(db, application_id)
-        
-        rules_config = {
-            key: CriterionCategory(value) 
-            for key, value in DEFAULT_SCORING_RULES.items()
-        }
-        
-        engine = ScoringEngine()
-        
-        report = engine.score_candidate(
-            job_description,
-            candidate,
-            rules_config,
-            []
-        )
-        
-        scoring_id = save_scoring_result(
-            db, application.application_id, report, DEFAULT_SCORING_RULES, None
-        )
-        
-        application.score = report.final_score
-        update_application_status(application, report.decision)
-        
-        db.commit()
-        
-        return {
-            "scoring_id": scoring_id,
-            "final_score": report.final_score,
-            "decision": report.decision,
-            "summary": report.summary
-        }
+        return score_application_with_defaults(db, application, job_description, candidate)
         
     except Exception as e:
         print(f"Error in auto scoring: {e}")
         return None
 
 def get_application_discrepancies(db: Session, application_id: int) -> list[str]:
-    chat_sessions = get_chat_sessions_for_application(db, application_id)
+    return extract_discrepancies(get_messages_for_application(db, application_id))
+
+def extract_discrepancies(messages: list[ChatMessages]) -> list[str]:
     discrepancies = []
     
-    for session in chat_sessions:
-        messages = get_messages_for_session(db, session.session_id)
+    for msg in messages:
+        if msg.message_metadata:
+            try:
+                metadata = json.loads(msg.message_metadata)
+                if 'discrepancies' in metadata:
+                    discrepancies.extend(metadata['discrepancies'])
+            except json.JSONDecodeError:
+                pass
         
-        for msg in messages:
-            if msg.message_metadata:
-                try:
-                    metadata = json.loads(msg.message_metadata)
-                    if 'discrepancies' in metadata:
-                        discrepancies.extend(metadata['discrepancies'])
-                except json.JSONDecodeError:
-                    pass
-            
-            if msg.message_type == MessageType.question and msg.content:
-                if any(keyword in msg.content.lower() for keyword in [
-                    "discrepancy", "mismatch", "gap", "difference", "concern", 
-                    "experience", "skills", "qualification", "requirement"
-                ]):
-                    discrepancies.append(msg.content)
+        if msg.message_type == MessageType.question and msg.content:
+            if any(keyword in msg.content.lower() for keyword in [
+                "discrepancy", "mismatch", "gap", "difference", "concern", 
+                "experience", "skills", "qualification", "requirement"
+            ]):
+                discrepancies.append(msg.content)
     
     return discrepancies
@@ -0,0 +1,116 @@
+import csv
+import io
+import json
+from typing import Callable, Iterator, List, Optional
+
+import zstandard
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models import Applications, Jobs, Users, ScoringResults
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+EXPORT_COMPRESSIONS = ("zstd",)
+ZSTD_LEVEL = 3
+
+EXPORT_COLUMNS = [
+    Applications.application_id,
+    Applications.job_id,
+    Jobs.title.label("job_title"),
+    Users.full_name.label("candidate_name"),
+    Users.email.label("candidate_email"),
+    Applications.application_status,
+    Applications.created_at.label("applied_at"),
+    ScoringResults.final_score,
+    ScoringResults.primary_score,
+    ScoringResults.secondary_score,
+    ScoringResults.decision,
+    ScoringResults.created_at.label("scored_at"),
+]
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+
+
+def validate_export_options(export_format: str, compression: Optional[str]):
+    if export_format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"Unsupported format '{export_format}', expected one of {', '.join(EXPORT_MEDIA_TYPES)}")
+    if compression is not None and compression not in EXPORT_COMPRESSIONS:
+        raise HTTPException(status_code=400, detail=f"Unsupported compression '{compression}', expected one of {', '.join(EXPORT_COMPRESSIONS)}")
+
+
+def export_filename(export_format: str, compression: Optional[str]) -> str:
+    return f"applications.{export_format}" + (".zst" if compression == "zstd" else "")
+
+
+def export_media_type(export_format: str, compression: Optional[str]) -> str:
+    return "application/zstd" if compression == "zstd" else EXPORT_MEDIA_TYPES[export_format]
+
+
+def applications_export_query(recruiter_id: int, job_id: Optional[int] = None):
+    query = select(*EXPORT_COLUMNS).join(
+        Jobs, Jobs.job_id == Applications.job_id
+    ).join(
+        Users, Users.user_id == Applications.user_id
+    ).outerjoin(
+        ScoringResults, ScoringResults.scoring_id == Applications.latest_scoring_id
+    ).where(Jobs.poster_id == recruiter_id).order_by(Applications.application_id)
+
+    if job_id is not None:
+        query = query.where(Applications.job_id == job_id)
+    return query.execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+
+def _export_values(row) -> List:
+    values = []
+    for value in row:
+        if hasattr(value, "isoformat"):
+            value = value.isoformat()
+        elif hasattr(value, "value"):
+            value = value.value
+        values.append(value)
+    return values
+
+
+def encode_ndjson(rows) -> bytes:
+    return "".join(
+        json.dumps(dict(zip(EXPORT_FIELDS, _export_values(row))), separators=(",", ":")) + "\n" for row in rows
+    ).encode()
+
+
+def encode_csv(rows, header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_FIELDS)
+    writer.writerows(_export_values(row) for row in rows)
+    return buffer.getvalue().encode()
+
+
+def stream_applications_export(
+    session_factory: Callable[[], Session],
+    recruiter_id: int,
+    job_id: Optional[int] = None,
+    export_format: str = "ndjson",
+    compression: Optional[str] = None
+) -> Iterator[bytes]:
+    compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj() if compression == "zstd" else None
+    
+    def encode(chunk: bytes) -> bytes:
+        return compressor.compress(chunk) if compressor else chunk
+    
+    db = session_factory()
+    try:
+        result = db.execute(applications_export_query(recruiter_id, job_id))
+        if export_format == "csv":
+            yield encode(encode_csv([], header=True))
+        
+        for rows in result.partitions():
+            chunk = encode(encode_csv(rows) if export_format == "csv" else encode_ndjson(rows))
+            if chunk:
+                yield chunk
+        
+        if compressor:
+            yield compressor.flush()
+    finally:
+        db.close()
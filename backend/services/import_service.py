@@ -0,0 +1,305 @@
+import json
+import time
+import zipfile
+from collections import defaultdict
+from itertools import islice
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, joinedload
+
+from models import Applications, ApplicationStatus, Jobs, Users
+from api.schemas import ApplicationImportItem
+from core.bulk_rescore import RESCORE_WORKERS, get_rescore_pool
+from core.job_stats import record_status_changes
+from core.scoring_db import save_scoring_results
+from core.task_queue import TASK_PREPARE_INTERVIEW, enqueue_task
+from services.application_service import DEFAULT_SCORING_RULES, extract_pdf_text_content
+from services.scoring_service import create_job_description_data
+from services.rescore_service import score_applications
+from services.task_service import task_key
+
+IMPORT_BATCH_SIZE = 500
+IMPORT_EXTRACT_INLINE_THRESHOLD = 20
+IMPORT_MANIFEST_NAMES = ("manifest.jsonl", "manifest.json")
+DEFAULT_APPLICANT_ID = 1
+MISSING_MANIFEST_MSG = f"Archive must contain {' or '.join(IMPORT_MANIFEST_NAMES)}"
+
+ImportItem = Tuple[int, Optional[Dict], Optional[str]]
+
+
+def read_jsonl_items(stream: Iterable[bytes]) -> Iterator[ImportItem]:
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line), None
+        except ValueError as e:
+            yield line_number, None, f"Invalid JSON: {e}"
+
+
+def read_manifest_items(archive: zipfile.ZipFile) -> Iterator[ImportItem]:
+    name = next((name for name in IMPORT_MANIFEST_NAMES if name in archive.namelist()), None)
+    if name is None:
+        raise HTTPException(status_code=400, detail=MISSING_MANIFEST_MSG)
+
+    if name.endswith(".jsonl"):
+        with archive.open(name) as manifest:
+            yield from read_jsonl_items(manifest)
+        return
+
+    try:
+        entries = json.loads(archive.read(name))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid manifest: {e}")
+    if not isinstance(entries, list):
+        raise HTTPException(status_code=400, detail="Manifest must be a JSON array")
+    for position, entry in enumerate(entries, start=1):
+        yield position, entry, None
+
+
+def extract_cv_chunk(chunk: List[Tuple[int, bytes]]) -> List[Tuple[int, Optional[str], Optional[str]]]:
+    results = []
+    for index, content in chunk:
+        try:
+            results.append((index, extract_pdf_text_content(content), None))
+        except HTTPException as e:
+            results.append((index, None, e.detail))
+        except Exception as e:
+            results.append((index, None, str(e)))
+    return results
+
+
+def extract_cv_texts(
+    files: List[Tuple[int, bytes]],
+    workers: int = RESCORE_WORKERS
+) -> List[Tuple[int, Optional[str], Optional[str]]]:
+    if workers <= 1 or len(files) < IMPORT_EXTRACT_INLINE_THRESHOLD:
+        return extract_cv_chunk(files)
+
+    chunk_size = -(-len(files) // workers)
+    chunks = [files[start:start + chunk_size] for start in range(0, len(files), chunk_size)]
+    pool = get_rescore_pool()
+    futures = [pool.submit(extract_cv_chunk, chunk) for chunk in chunks]
+
+    results = []
+    for future in futures:
+        results.extend(future.result())
+    return results
+
+
+class ApplicationImport:
+    def __init__(
+        self,
+        db: Session,
+        archive: Optional[zipfile.ZipFile] = None,
+        job_id: Optional[int] = None,
+        prepare_interviews: bool = False
+    ):
+        self.db = db
+        self.archive = archive
+        self.job_id = job_id
+        self.prepare_interviews = prepare_interviews
+
+        self.jobs: Dict[int, Optional[Dict]] = {}
+        self.users: Dict[int, bool] = {}
+        self.received = 0
+        self.imported = 0
+        self.scored = 0
+        self.errors: List[Dict] = []
+
+    def run(self, items: Iterator[ImportItem]) -> Dict:
+        started = time.perf_counter()
+        while True:
+            batch = list(islice(items, IMPORT_BATCH_SIZE))
+            if not batch:
+                break
+            self.received += len(batch)
+            self.import_batch(batch)
+
+        elapsed = time.perf_counter() - started
+        return {
+            "received": self.received,
+            "imported": self.imported,
+            "scored": self.scored,
+            "failed": self.received - self.imported,
+            "elapsed_seconds": round(elapsed, 3),
+            "rate_per_second": round(self.imported / elapsed, 1) if elapsed > 0 else None,
+            "errors": sorted(self.errors, key=lambda error: error["index"])
+        }
+
+    def import_batch(self, batch: List[ImportItem]):
+        rows = {}
+        files = []
+        for index, raw, error in batch:
+            row = self.validate(raw, error, index)
+            if row is None:
+                continue
+            cv_file = row.pop("cv_file")
+            if cv_file is not None:
+                try:
+                    files.append((index, self.archive.read(cv_file)))
+                except KeyError:
+                    self.fail(index, f"File '{cv_file}' not found in archive")
+                    continue
+            rows[index] = row
+
+        for index, text, error in extract_cv_texts(files):
+            if error is not None:
+                self.fail(index, error)
+                rows.pop(index)
+            else:
+                rows[index]["cv"] = text
+
+        self.load_references(rows.values())
+        for index in list(rows):
+            row = rows[index]
+            if self.jobs[row["job_id"]] is None:
+                self.fail(index, f"Job {row['job_id']} not found")
+            elif not self.users[row["user_id"]]:
+                self.fail(index, f"User {row['user_id']} not found")
+            else:
+                continue
+            rows.pop(index)
+
+        if rows:
+            self.insert(rows)
+
+    def validate(self, raw: Optional[Dict], error: Optional[str], index: int) -> Optional[Dict]:
+        if error is not None:
+            return self.fail(index, error)
+        try:
+            item = ApplicationImportItem.model_validate(raw)
+        except ValidationError as e:
+            return self.fail(index, "; ".join(f"{'.'.join(map(str, detail['loc'])) or 'item'}: {detail['msg']}" for detail in e.errors()))
+
+        job_id = item.job_id or self.job_id
+        if job_id is None:
+            return self.fail(index, "job_id is required")
+        if (item.cv is None) == (item.cv_file is None):
+            return self.fail(index, "Exactly one of cv or cv_file is required")
+        if item.cv_file is not None and self.archive is None:
+            return self.fail(index, "cv_file is only supported in zip archives")
+
+        return {
+            "job_id": job_id,
+            "user_id": item.user_id or DEFAULT_APPLICANT_ID,
+            "cv": item.cv,
+            "cv_file": item.cv_file,
+            "cover_letter": item.cover_letter
+        }
+
+    def load_references(self, rows: Iterable[Dict]):
+        job_ids, user_ids = set(), set()
+        for row in rows:
+            job_ids.add(row["job_id"])
+            user_ids.add(row["user_id"])
+
+        missing_jobs = job_ids - self.jobs.keys()
+        if missing_jobs:
+            found = {job.job_id: job for job in self.db.scalars(select(Jobs).where(Jobs.job_id.in_(missing_jobs)))}
+            for job_id in missing_jobs:
+                self.jobs[job_id] = create_job_description_data(found[job_id]) if job_id in found else None
+
+        missing_users = user_ids - self.users.keys()
+        if missing_users:
+            found = set(self.db.scalars(select(Users.user_id).where(Users.user_id.in_(missing_users))))
+            for user_id in missing_users:
+                self.users[user_id] = user_id in found
+
+    def insert(self, rows: Dict[int, Dict]):
+        indexes = list(rows)
+        try:
+            application_ids = self.insert_rows(rows, indexes)
+            self.db.commit()
+        except SQLAlchemyError:
+            self.db.rollback()
+            indexes, application_ids = self.insert_each(rows, indexes)
+
+        self.imported += len(application_ids)
+
+        by_job = defaultdict(dict)
+        for application_id, index in zip(application_ids, indexes):
+            by_job[rows[index]["job_id"]][application_id] = index
+        for job_id, job_indexes in by_job.items():
+            self.score(job_id, job_indexes)
+
+    def insert_each(self, rows: Dict[int, Dict], indexes: List[int]) -> Tuple[List[int], List[int]]:
+        inserted, application_ids = [], []
+        for index in indexes:
+            try:
+                with self.db.begin_nested():
+                    application_ids.extend(self.insert_rows(rows, [index]))
+                inserted.append(index)
+            except SQLAlchemyError as e:
+                self.fail(index, f"Insert failed: {getattr(e, 'orig', None) or e}")
+
+        try:
+            self.db.commit()
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            for index in inserted:
+                self.fail(index, f"Insert failed: {getattr(e, 'orig', None) or e}")
+            return [], []
+        return inserted, application_ids
+
+    def insert_rows(self, rows: Dict[int, Dict], indexes: List[int]) -> List[int]:
+        application_ids = self.db.execute(
+            insert(Applications).returning(Applications.application_id, sort_by_parameter_order=True),
+            [{**rows[index], "application_status": ApplicationStatus.submitted} for index in indexes]
+        ).scalars().all()
+        record_status_changes(self.db, [(rows[index]["job_id"], None, ApplicationStatus.submitted) for index in indexes])
+
+        if self.prepare_interviews:
+            for application_id in application_ids:
+                enqueue_task(
+                    self.db, TASK_PREPARE_INTERVIEW, {"application_id": application_id},
+                    task_key=task_key(TASK_PREPARE_INTERVIEW, application_id)
+                )
+        return application_ids
+
+    def score(self, job_id: int, indexes: Dict[int, int]):
+        try:
+            self.score_applications(job_id, indexes)
+        except Exception:
+            self.db.rollback()
+            for application_id, index in indexes.items():
+                try:
+                    self.score_applications(job_id, {application_id: index})
+                except Exception as e:
+                    self.db.rollback()
+                    self.fail(index, f"Imported but not scored: {e}", application_id)
+
+    def score_applications(self, job_id: int, indexes: Dict[int, int]):
+        applications = self.db.scalars(
+            select(Applications).options(joinedload(Applications.applicant)).where(Applications.application_id.in_(indexes))
+        ).all()
+        scored = score_applications(self.db, self.jobs[job_id], applications, DEFAULT_SCORING_RULES)
+        save_scoring_results(self.db, scored, DEFAULT_SCORING_RULES)
+        self.scored += len(scored)
+
+    def fail(self, index: int, error: str, application_id: Optional[int] = None) -> None:
+        self.errors.append({"index": index, "application_id": application_id, "error": error})
+
+
+def import_applications_file(
+    db: Session,
+    stream: BinaryIO,
+    filename: str = "",
+    job_id: Optional[int] = None,
+    prepare_interviews: bool = False
+) -> Dict:
+    if filename.lower().endswith(".zip") or zipfile.is_zipfile(stream):
+        stream.seek(0)
+        try:
+            archive = zipfile.ZipFile(stream)
+        except zipfile.BadZipFile as e:
+            raise HTTPException(status_code=400, detail=f"Invalid zip archive: {e}")
+        with archive:
+            return ApplicationImport(db, archive, job_id, prepare_interviews).run(read_manifest_items(archive))
+
+    stream.seek(0)
+    return ApplicationImport(db, None, job_id, prepare_interviews).run(read_jsonl_items(stream))
@@ -3,6 +3,7 @@ from models import Jobs, EmploymentType, WorkFormat
 from fastapi import HTTPException
 from typing import Optional, List
 from api.schemas import JobCreate
+from core.job_stats import create_job_stats
 
 JOB_NOT_FOUND_MSG = "Job not found"
 
@@ -42,6 +43,8 @@ def create_job(db: Session, job_data: JobCreate, poster_id: int) -> Jobs:
     )
     
     db.add(new_job)
+    db.flush()
+    create_job_stats(db, new_job.job_id)
     db.commit()
     db.refresh(new_job)
     
@@ -0,0 +1,189 @@
+import json
+import time
+from contextlib import closing
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload
+
+from models import Applications, Jobs, RescoreRuns
+from core.bulk_rescore import score_partitioned
+from core.scoring import ScoreReport
+from core.scoring_db import save_scoring_results
+from core.job_stats import record_status_changes
+from services.application_service import DEFAULT_SCORING_RULES
+from services.scoring_service import (
+    JOB_NOT_FOUND_MSG, get_job_by_id, create_job_description_data, create_candidate_data,
+    convert_rules_config, update_application_status
+)
+
+RESCORE_BATCH_SIZE = 1000
+RESCORE_STALE_SECONDS = 300
+RESCORE_RUN_NOT_FOUND_MSG = "Rescore run not found"
+RESCORE_IN_PROGRESS_MSG = "A rescore of this job is already in progress"
+
+
+def start_job_rescore(db: Session, job_id: int, rules_config: Optional[Dict[str, str]] = None, restart: bool = False) -> RescoreRuns:
+    if rules_config:
+        convert_rules_config(rules_config)
+
+    job = db.query(Jobs).filter(Jobs.job_id == job_id).with_for_update().first()
+    if not job:
+        raise HTTPException(status_code=404, detail=JOB_NOT_FOUND_MSG)
+
+    run = db.query(RescoreRuns).filter(
+        RescoreRuns.job_id == job_id,
+        RescoreRuns.status.in_(["pending", "running", "interrupted", "failed"])
+    ).order_by(RescoreRuns.run_id.desc()).first()
+
+    if run is not None and run.status == "running" and not _is_stale(run):
+        db.rollback()
+        raise HTTPException(status_code=409, detail=RESCORE_IN_PROGRESS_MSG)
+
+    if run is not None and (restart or (rules_config and json.loads(run.rules_config) != rules_config)):
+        run.status = "superseded"
+        run = None
+
+    if run is None:
+        run = RescoreRuns(
+            job_id=job_id,
+            status="pending",
+            rules_config=json.dumps(rules_config or DEFAULT_SCORING_RULES)
+        )
+        db.add(run)
+
+    run.status = "running"
+    run.error = None
+    db.commit()
+    db.refresh(run)
+    return run
+
+
+def get_rescore_run(db: Session, run_id: int) -> RescoreRuns:
+    run = db.query(RescoreRuns).filter(RescoreRuns.run_id == run_id).first()
+    if not run:
+        raise HTTPException(status_code=404, detail=RESCORE_RUN_NOT_FOUND_MSG)
+    return run
+
+
+def get_rescore_run_data(db: Session, run_id: int) -> dict:
+    return create_rescore_progress(get_rescore_run(db, run_id))
+
+
+def run_job_rescore(db: Session, run: RescoreRuns) -> Iterator[dict]:
+    job_description = create_job_description_data(get_job_by_id(db, run.job_id))
+    rules_config = json.loads(run.rules_config)
+
+    remaining = db.query(func.count(Applications.application_id)).filter(
+        Applications.job_id == run.job_id,
+        Applications.application_id > run.last_application_id
+    ).scalar()
+    run.total = run.done + remaining
+    db.commit()
+
+    started = time.perf_counter() - run.elapsed_seconds
+    completed = False
+    try:
+        yield create_rescore_progress(run)
+
+        while True:
+            applications = db.query(Applications).options(
+                joinedload(Applications.applicant)
+            ).filter(
+                Applications.job_id == run.job_id,
+                Applications.application_id > run.last_application_id
+            ).order_by(Applications.application_id).limit(RESCORE_BATCH_SIZE).all()
+
+            if not applications:
+                break
+
+            scored = score_applications(db, job_description, applications, rules_config)
+
+            run.done += len(applications)
+            run.total = max(run.total, run.done)
+            run.last_application_id = applications[-1].application_id
+            run.elapsed_seconds = time.perf_counter() - started
+            save_scoring_results(db, scored, rules_config)
+
+            yield create_rescore_progress(run)
+
+        run.status = "completed"
+        run.finished_at = datetime.now(timezone.utc)
+        db.commit()
+        completed = True
+        yield create_rescore_progress(run)
+    except Exception as e:
+        db.rollback()
+        run.status = "failed"
+        run.error = str(e)
+        db.commit()
+        completed = True
+        yield create_rescore_progress(run)
+    finally:
+        if not completed:
+            db.rollback()
+            run.status = "interrupted"
+            db.commit()
+
+
+def score_applications(
+    db: Session,
+    job_description: Dict,
+    applications: List[Applications],
+    rules_config: Dict[str, str]
+) -> List[Tuple[int, ScoreReport, str, str]]:
+    by_id = {application.application_id: application for application in applications}
+    scored = score_partitioned(
+        job_description,
+        [
+            (application.application_id, create_candidate_data(application.applicant, application))
+            for application in applications
+        ],
+        rules_config
+    )
+
+    transitions = []
+    for application_id, report, _, _ in scored:
+        application = by_id[application_id]
+        application.score = report.final_score
+        update_application_status(db, application, report.decision, transitions)
+    record_status_changes(db, transitions)
+    return scored
+
+
+def stream_job_rescore(session_factory: Callable[[], Session], run_id: int) -> Iterator[str]:
+    db = session_factory()
+    try:
+        run = get_rescore_run(db, run_id)
+        with closing(run_job_rescore(db, run)) as progress_events:
+            for progress in progress_events:
+                event = "progress" if progress["status"] == "running" else progress["status"]
+                yield f"event: {event}\ndata: {json.dumps(progress)}\n\n"
+    finally:
+        db.close()
+
+
+def create_rescore_progress(run: RescoreRuns) -> dict:
+    rate = run.done / run.elapsed_seconds if run.elapsed_seconds > 0 else None
+    remaining = max(run.total - run.done, 0)
+
+    return {
+        "run_id": run.run_id,
+        "job_id": run.job_id,
+        "status": run.status,
+        "done": run.done,
+        "total": run.total,
+        "elapsed_seconds": round(run.elapsed_seconds, 3),
+        "rate_per_second": round(rate, 1) if rate else None,
+        "eta_seconds": round(remaining / rate, 1) if rate else None,
+        "error": run.error
+    }
+
+
+def _is_stale(run: RescoreRuns) -> bool:
+    updated_at = run.updated_at
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    return (datetime.now(timezone.utc) - updated_at).total_seconds() > RESCORE_STALE_SECONDS
@@ -1,14 +1,31 @@
-from sqlalchemy.orm import Session
+import threading
+import time
+from datetime import timedelta
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session, joinedload
 from fastapi import HTTPException
 from typing import Optional, List, Dict
+from cachetools import LRUCache
 from models import Applications, ApplicationStatus, Jobs, Users
-from core.scoring import ScoringEngine, ScoringConfig, CriterionCategory
-from core.scoring_db import save_scoring_result, get_scoring_result, get_scoring_summary_for_recruiter, get_applications_with_scores
+from core.scoring import ScoringEngine, ScoringConfig, CriterionCategory, CRITERIA_REGISTRY
+from core.match_matrix import MatchMatrix
+from core.scoring_replay import REPLAY_TOP_DELTAS, replay_job_scores
+from core.job_stats import set_application_status, get_job_stats, summarize_job_stats
+from core.scoring_cache import SCORING_CACHE, score_with_cache
+from services.application_service import DEFAULT_SCORING_RULES
+from core.scoring_db import save_scoring_result, get_scoring_result, get_primary_result, get_job_score_index, get_scoring_summary_for_recruiter, get_applications_with_scores_page, get_scoring_insights
+from core.score_index import MIN_CURVE_STEP
 from api.schemas import ScoringRequest, CriterionResultResponse, AnswerJudgmentResponse, ScoringResponse
 
 APPLICATION_NOT_FOUND_MSG = "Application not found"
 JOB_NOT_FOUND_MSG = "Job not found"
 USER_NOT_FOUND_MSG = "User not found"
+MATCH_MATRIX_CACHE_SIZE = 128
+MATCH_MATRIX_SYNC_LOOKBACK = timedelta(seconds=5)
+
+_match_matrices = LRUCache(maxsize=MATCH_MATRIX_CACHE_SIZE)
+_match_matrices_lock = threading.Lock()
+_match_matrix_locks: Dict[int, threading.Lock] = {}
 
 def get_application_by_id(db: Session, application_id: int) -> Applications:
     application = db.query(Applications).filter(Applications.application_id == application_id).first()
@@ -62,11 +79,21 @@ def convert_rules_config(rules_config: Dict[str, str]) -> Dict[str, CriterionCat
         for key, value in rules_config.items()
     }
 
-def update_application_status(application: Applications, decision: str):
+def build_scoring_config(config: Dict) -> ScoringConfig:
+    return ScoringConfig(
+        weights=config.get("weights"),
+        experience_tolerance=config.get("experience_tolerance", 1.0),
+        salary_soft_overage=config.get("salary_soft_overage", 0.1),
+        pass_threshold=config.get("pass_threshold", 70.0),
+        primary_weight=config.get("primary_weight", 0.8),
+        secondary_weight=config.get("secondary_weight", 0.2)
+    )
+
+def update_application_status(db: Session, application: Applications, decision: str, pending: Optional[List] = None):
     if decision == "REJECT":
-        application.application_status = ApplicationStatus.rejected
+        set_application_status(db, application, ApplicationStatus.rejected, pending)
     elif decision == "PASS":
-        application.application_status = ApplicationStatus.shortlisted
+        set_application_status(db, application, ApplicationStatus.shortlisted, pending)
 
 def create_scoring_response(report) -> ScoringResponse:
     return ScoringResponse(
@@ -82,7 +109,8 @@ def create_scoring_response(report) -> ScoringResponse:
                 weight=r.weight,
                 passed=r.passed,
                 points_awarded=r.points_awarded,
-                notes=r.notes
+                notes=r.notes,
+                coverage=r.coverage
             )
             for r in report.primary_breakdown
         ],
@@ -100,38 +128,72 @@ def create_scoring_response(report) -> ScoringResponse:
 def score_application_with_data(db: Session, application_id: int, job_description: dict, candidate: dict, rules_config: Dict[str, str], chat_answers: List[Dict]) -> ScoringResponse:
     application = get_application_by_id(db, application_id)
     
-    rules_config_enum = convert_rules_config(rules_config)
+    rules = convert_rules_config(rules_config)
     engine = ScoringEngine()
     
-    report = engine.score_candidate(
-        job_description,
-        candidate,
-        rules_config_enum,
-        chat_answers
+    scoring_id, report, cached = score_with_cache(
+        db, application.application_id, engine, job_description, candidate, rules_config, chat_answers, rules
     )
     
+    application.score = report.final_score
+    update_application_status(db, application, report.decision)
+    
+    db.commit()
+    
+    return create_scoring_response(report)
+
+def rescore_application_with_answers(db: Session, application_id: int, chat_answers: List[Dict], rules_config: Optional[Dict[str, str]] = None) -> dict:
+    application = get_application_by_id(db, application_id)
+    job = get_job_by_id(db, application.job_id)
+    user = get_user_by_id(db, application.user_id)
+    
+    job_description = create_job_description_data(job)
+    candidate = create_candidate_data(user, application)
+    
+    rules_config = rules_config or DEFAULT_SCORING_RULES
+    rules_config_enum = convert_rules_config(rules_config)
+    engine = ScoringEngine()
+    
+    fingerprint = engine.primary_fingerprint(job_description, candidate, rules_config_enum)
+    previous = get_primary_result(db, application_id)
+    primary_reused = previous is not None and previous["primary_fingerprint"] == fingerprint
+    
+    if primary_reused:
+        report = engine.score_from_primary(
+            previous["primary_score"],
+            previous["primary_breakdown"],
+            previous["hard_no_triggered"],
+            chat_answers
+        )
+    else:
+        report = engine.score_candidate(
+            job_description,
+            candidate,
+            rules_config_enum,
+            chat_answers
+        )
+    
     scoring_id = save_scoring_result(
-        db, application.application_id, report, rules_config, None
+        db, application.application_id, report, rules_config, None, fingerprint,
+        engine.result_fingerprint(job_description, candidate, rules_config_enum, chat_answers, fingerprint)
     )
     
     application.score = report.final_score
-    update_application_status(application, report.decision)
+    update_application_status(db, application, report.decision)
     
     db.commit()
     
-    return create_scoring_response(report)
+    return {
+        "application_id": application_id,
+        "scoring_id": scoring_id,
+        "primary_reused": primary_reused,
+        "scoring": create_scoring_response(report)
+    }
 
 def score_application_custom(job_description: Dict, candidate: Dict, rules_config: Dict[str, str], chat_answers: List[Dict] = [], config: Optional[Dict] = None) -> dict:
     rules_config_enum = convert_rules_config(rules_config)
     
-    scoring_config = None
-    if config:
-        scoring_config = ScoringConfig(
-            weights=config.get("weights"),
-            experience_tolerance=config.get("experience_tolerance", 1.0),
-            salary_soft_overage=config.get("salary_soft_overage", 0.1),
-            pass_threshold=config.get("pass_threshold", 70.0)
-        )
+    scoring_config = build_scoring_config(config) if config else None
     
     engine = ScoringEngine(scoring_config)
     
@@ -155,7 +217,8 @@ def score_application_custom(job_description: Dict, candidate: Dict, rules_confi
                 "weight": r.weight,
                 "passed": r.passed,
                 "points_awarded": r.points_awarded,
-                "notes": r.notes
+                "notes": r.notes,
+                "coverage": r.coverage
             }
             for r in report.primary_breakdown
         ],
@@ -181,6 +244,13 @@ def get_scoring_config_data() -> dict:
         "primary_weight": config.primary_weight,
         "secondary_weight": config.secondary_weight,
         "available_categories": [cat.value for cat in CriterionCategory],
+        "registered_criteria": {
+            name: {
+                "kind": definition.kind,
+                "default_weight": definition.default_weight
+            }
+            for name, definition in CRITERIA_REGISTRY.items()
+        },
         "example_rules_config": {
             "years_experience": "YES",
             "required_skills": "YES", 
@@ -192,16 +262,28 @@ def get_scoring_config_data() -> dict:
         }
     }
 
-def get_recruiter_dashboard_data(db: Session, job_id: Optional[int] = None, limit: int = 50) -> dict:
-    applications = get_applications_with_scores(db, job_id, limit)
+def get_recruiter_dashboard_data(
+    db: Session,
+    job_id: Optional[int] = None,
+    limit: int = 50,
+    sort: str = "recent",
+    cursor: Optional[str] = None
+) -> dict:
+    try:
+        applications, next_cursor = get_applications_with_scores_page(db, job_id, limit, sort, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    totals = summarize_job_stats(get_job_stats(db, job_id))
     
     return {
         "applications": applications,
-        "total_count": len(applications),
+        "total_count": totals["total_applications"],
+        "next_cursor": next_cursor,
         "summary": {
-            "passed": len([app for app in applications if app.get("scoring", {}).get("overview", {}).get("decision") == "PASS"]),
-            "rejected": len([app for app in applications if app.get("scoring", {}).get("overview", {}).get("decision") == "REJECT"]),
-            "average_score": sum([app.get("scoring", {}).get("overview", {}).get("final_score", 0) for app in applications]) / len(applications) if applications else 0
+            "passed": totals["passed"],
+            "rejected": totals["rejected"],
+            "average_score": totals["average_score"]
         }
     }
 
@@ -247,60 +329,184 @@ def get_application_scoring_summary_data(db: Session, application_id: int) -> di
     return summary
 
 def get_scoring_insights_data(db: Session, job_id: Optional[int] = None) -> dict:
-    applications = get_applications_with_scores(db, job_id, 100)
+    insights = get_scoring_insights(db, job_id)
     
-    if not applications:
+    if not insights["total_applications"]:
         return {"message": "No applications found"}
     
-    all_scores = [app.get("scoring", {}).get("overview", {}).get("final_score", 0) for app in applications if app.get("scoring")]
-    passed_applications = [app for app in applications if app.get("scoring", {}).get("overview", {}).get("decision") == "PASS"]
-    rejected_applications = [app for app in applications if app.get("scoring", {}).get("overview", {}).get("decision") == "REJECT"]
-    
-    all_breakdowns = []
-    for app in applications:
-        if app.get("scoring", {}).get("detailed_breakdown"):
-            all_breakdowns.extend(app["scoring"]["detailed_breakdown"])
-    
-    deduction_patterns = {}
-    for breakdown in all_breakdowns:
-        if breakdown.get("points_missed", 0) > 0:
-            criterion = breakdown["criterion_name"]
-            if criterion not in deduction_patterns:
-                deduction_patterns[criterion] = {"count": 0, "total_missed": 0}
-            deduction_patterns[criterion]["count"] += 1
-            deduction_patterns[criterion]["total_missed"] += breakdown["points_missed"]
-    
-    common_deductions = sorted(
-        deduction_patterns.items(),
-        key=lambda x: x[1]["count"],
-        reverse=True
-    )[:5]
-    
     return {
         "overview": {
-            "total_applications": len(applications),
-            "passed": len(passed_applications),
-            "rejected": len(rejected_applications),
-            "pass_rate": len(passed_applications) / len(applications) * 100 if applications else 0,
-            "average_score": sum(all_scores) / len(all_scores) if all_scores else 0,
-            "score_distribution": {
-                "excellent": len([s for s in all_scores if s >= 90]),
-                "good": len([s for s in all_scores if 80 <= s < 90]),
-                "fair": len([s for s in all_scores if 70 <= s < 80]),
-                "poor": len([s for s in all_scores if s < 70])
-            }
+            "total_applications": insights["total_applications"],
+            "scored_applications": insights["scored_applications"],
+            "passed": insights["passed"],
+            "rejected": insights["rejected"],
+            "pass_rate": insights["passed"] / insights["total_applications"] * 100,
+            "average_score": insights["average_score"],
+            "score_distribution": insights["score_distribution"]
         },
-        "common_issues": [
-            {
-                "criterion": criterion,
-                "frequency": data["count"],
-                "average_points_missed": data["total_missed"] / data["count"]
-            }
-            for criterion, data in common_deductions
-        ],
+        "common_issues": insights["common_deductions"],
         "recommendations": [
             "Consider adjusting job requirements if certain skills are consistently missing",
             "Review scoring criteria if pass rate is too low",
             "Focus on training programs for common skill gaps"
         ]
     }
+
+def get_recruiter_match_matrix(db: Session, recruiter_id: int) -> MatchMatrix:
+    with _match_matrices_lock:
+        lock = _match_matrix_locks.setdefault(recruiter_id, threading.Lock())
+    with lock:
+        return _refresh_recruiter_match_matrix(db, recruiter_id)
+
+def _refresh_recruiter_match_matrix(db: Session, recruiter_id: int) -> MatchMatrix:
+    with _match_matrices_lock:
+        matrix = _match_matrices.get(recruiter_id)
+        if matrix is None:
+            matrix = MatchMatrix(ScoringEngine(), convert_rules_config(DEFAULT_SCORING_RULES))
+            _match_matrices[recruiter_id] = matrix
+    
+    jobs = db.query(Jobs).filter(Jobs.poster_id == recruiter_id, Jobs.is_active == True).all()
+    active_job_ids = {job.job_id for job in jobs}
+    
+    for job_id in [job_id for job_id in matrix.job_ids if job_id not in active_job_ids]:
+        matrix.remove_job(job_id)
+    
+    new_job_ids = [job.job_id for job in jobs if not matrix.has_job(job.job_id)]
+    for job in jobs:
+        matrix.set_job(job.job_id, create_job_description_data(job), job.updated_at)
+    
+    if not active_job_ids:
+        return matrix
+    
+    if matrix.synced_at is not None:
+        since = matrix.synced_at - MATCH_MATRIX_SYNC_LOOKBACK
+        changed_applications = db.query(Applications).options(
+            joinedload(Applications.applicant)
+        ).filter(
+            Applications.job_id.in_(active_job_ids),
+            Applications.application_id <= matrix.last_application_id,
+            or_(
+                Applications.updated_at >= since,
+                Applications.user_id.in_(select(Users.user_id).where(Users.updated_at >= since))
+            )
+        ).order_by(Applications.application_id).all()
+        
+        for application in changed_applications:
+            matrix.update_candidate(application.user_id, create_candidate_data(application.applicant, application))
+            _advance_match_matrix_sync(matrix, application)
+    
+    new_applications = db.query(Applications).options(
+        joinedload(Applications.applicant)
+    ).filter(
+        Applications.job_id.in_(active_job_ids),
+        or_(
+            Applications.application_id > matrix.last_application_id,
+            Applications.job_id.in_(new_job_ids)
+        )
+    ).order_by(Applications.application_id).all()
+    
+    for application in new_applications:
+        matrix.add_application(
+            application.application_id,
+            application.job_id,
+            application.user_id,
+            create_candidate_data(application.applicant, application)
+        )
+        _advance_match_matrix_sync(matrix, application)
+    
+    application_count = db.query(func.count(Applications.application_id)).filter(
+        Applications.job_id.in_(active_job_ids)
+    ).scalar()
+    if application_count != matrix.application_count:
+        matrix.retain_applications(set(db.scalars(
+            select(Applications.application_id).where(Applications.job_id.in_(active_job_ids))
+        )))
+    
+    return matrix
+
+def _advance_match_matrix_sync(matrix: MatchMatrix, application: Applications):
+    for updated_at in (application.updated_at, application.applicant.updated_at):
+        if matrix.synced_at is None or updated_at > matrix.synced_at:
+            matrix.synced_at = updated_at
+
+def get_recruiter_match_matrix_data(db: Session, recruiter_id: int, top_k: int = 10, applicants_only: bool = False, include_matrix: bool = False) -> dict:
+    matrix = get_recruiter_match_matrix(db, recruiter_id)
+    
+    candidate_names = dict(
+        db.query(Users.user_id, Users.full_name).filter(Users.user_id.in_(matrix.candidate_ids)).all()
+    ) if matrix.candidate_ids else {}
+    
+    top_candidates = {}
+    for job_id in matrix.job_ids:
+        top_candidates[job_id] = [
+            {**match, "candidate_name": candidate_names.get(match["candidate_id"])}
+            for match in matrix.top_k(job_id, top_k, applicants_only)
+        ]
+    
+    result = {
+        "recruiter_id": recruiter_id,
+        "total_jobs": len(matrix.job_ids),
+        "total_candidates": len(matrix.candidate_ids),
+        "top_k": top_k,
+        "top_candidates": top_candidates
+    }
+    
+    if include_matrix:
+        result["matrix"] = matrix.to_dict()
+    
+    return result
+
+def get_job_stats_data(db: Session, job_id: int) -> dict:
+    get_job_by_id(db, job_id)
+    return {"job_id": job_id, **summarize_job_stats(get_job_stats(db, job_id))}
+
+def get_pass_rate_data(db: Session, job_id: int, threshold: Optional[float] = None) -> dict:
+    get_job_by_id(db, job_id)
+    index = get_job_score_index(db, job_id)
+    threshold = ScoringConfig().pass_threshold if threshold is None else threshold
+    
+    return {
+        "job_id": job_id,
+        "total_applications": len(index),
+        "threshold": threshold,
+        "passed": index.count_at(threshold),
+        "pass_rate": index.pass_rate_at(threshold)
+    }
+
+def get_pass_rate_curve_data(db: Session, job_id: int, step: float = 1.0) -> dict:
+    if step < MIN_CURVE_STEP or step > 100:
+        raise HTTPException(status_code=400, detail=f"step must be between {MIN_CURVE_STEP} and 100")
+    
+    get_job_by_id(db, job_id)
+    index = get_job_score_index(db, job_id)
+    
+    return {
+        "job_id": job_id,
+        "total_applications": len(index),
+        "step": step,
+        "curve": index.curve(step)
+    }
+
+def get_scoring_cache_stats() -> dict:
+    return SCORING_CACHE.stats()
+
+def get_what_if_data(db: Session, job_id: int, config: Dict, top_deltas: int = REPLAY_TOP_DELTAS) -> dict:
+    get_job_by_id(db, job_id)
+    scoring_config = build_scoring_config(config)
+    
+    started = time.perf_counter()
+    replay = replay_job_scores(db, job_id, scoring_config, top_deltas)
+    
+    return {
+        "job_id": job_id,
+        "proposed_config": {
+            "weights": scoring_config.weights,
+            "experience_tolerance": scoring_config.experience_tolerance,
+            "salary_soft_overage": scoring_config.salary_soft_overage,
+            "pass_threshold": scoring_config.pass_threshold,
+            "primary_weight": scoring_config.primary_weight,
+            "secondary_weight": scoring_config.secondary_weight
+        },
+        **replay,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2)
+    }
@@ -0,0 +1,102 @@
+import json
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from models import Applications, QueuedTasks
+from api.schemas import FirstResponse
+from core.task_queue import (
+    TASK_SCORE_APPLICATION, TASK_PREPARE_INTERVIEW, TaskHandler,
+    enqueue_task, get_queue_depth, get_task_workers
+)
+from services.scoring_service import get_job_by_id, get_user_by_id, create_job_description_data, create_candidate_data
+from services.application_service import get_application_by_id, score_application_with_defaults
+from services.chat_service import create_job_description_text, create_user_info_text
+
+TASK_NOT_FOUND_MSG = "Task not found"
+
+
+def task_key(task_type: str, application_id: int) -> str:
+    return f"{task_type}:{application_id}"
+
+
+def enqueue_application_intake(db: Session, application: Applications, prepare_interview: bool = False) -> List[QueuedTasks]:
+    task_types = (TASK_SCORE_APPLICATION, TASK_PREPARE_INTERVIEW) if prepare_interview else (TASK_SCORE_APPLICATION,)
+    return [
+        enqueue_task(
+            db, task_type, {"application_id": application.application_id},
+            task_key=task_key(task_type, application.application_id)
+        )
+        for task_type in task_types
+    ]
+
+
+def run_score_application_task(db: Session, payload: Dict) -> Dict:
+    application = get_application_by_id(db, payload["application_id"])
+    job = get_job_by_id(db, application.job_id)
+    user = get_user_by_id(db, application.user_id)
+
+    scoring = score_application_with_defaults(
+        db, application, create_job_description_data(job), create_candidate_data(user, application)
+    )
+    return {key: scoring[key] for key in ("scoring_id", "final_score", "decision", "cached")}
+
+
+def run_prepare_interview_task(db: Session, llm, payload: Dict) -> Dict:
+    application = get_application_by_id(db, payload["application_id"])
+    job = get_job_by_id(db, application.job_id)
+    user = get_user_by_id(db, application.user_id)
+
+    evaluation = llm.compare_applicant_to_job(
+        create_job_description_text(job), create_user_info_text(user, application), FirstResponse
+    )
+    return {
+        "rating_score": evaluation.rating_score,
+        "discrepancies": evaluation.discrepancies,
+        "questions": llm.generate_questions(evaluation.discrepancies)
+    }
+
+
+def build_task_handlers(llm) -> Dict[str, TaskHandler]:
+    return {
+        TASK_SCORE_APPLICATION: run_score_application_task,
+        TASK_PREPARE_INTERVIEW: lambda db, payload: run_prepare_interview_task(db, llm, payload)
+    }
+
+
+def get_prepared_interview(db: Session, application_id: int) -> Optional[Dict]:
+    task = db.query(QueuedTasks).filter(
+        QueuedTasks.task_key == task_key(TASK_PREPARE_INTERVIEW, application_id),
+        QueuedTasks.status == "done"
+    ).order_by(QueuedTasks.task_id.desc()).first()
+    return json.loads(task.result) if task and task.result else None
+
+
+def create_task_response(task: QueuedTasks) -> Dict:
+    return {
+        "task_id": task.task_id,
+        "task_type": task.task_type,
+        "status": task.status,
+        "attempts": task.attempts,
+        "max_attempts": task.max_attempts,
+        "run_after": task.run_after.isoformat(),
+        "result": json.loads(task.result) if task.result else None,
+        "last_error": task.last_error,
+        "finished_at": task.finished_at.isoformat() if task.finished_at else None
+    }
+
+
+def get_task_data(db: Session, task_id: int) -> Dict:
+    task = db.query(QueuedTasks).filter(QueuedTasks.task_id == task_id).first()
+    if not task:
+        raise HTTPException(status_code=404, detail=TASK_NOT_FOUND_MSG)
+    return create_task_response(task)
+
+
+def get_queue_stats_data(db: Session) -> Dict:
+    workers = get_task_workers()
+    return {
+        "queues": get_queue_depth(db),
+        "workers": workers.stats() if workers else None
+    }